@@ -0,0 +1,31 @@
+"""board members composite index
+
+Revision ID: 5c3e9a1d7b42
+Revises: 1fbd88f9bd6e
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c3e9a1d7b42'
+down_revision: Union[str, None] = '1fbd88f9bd6e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_board_members_association_board_id_user_id',
+        'board_members_association',
+        ['board_id', 'user_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_board_members_association_board_id_user_id', table_name='board_members_association')
@@ -0,0 +1,35 @@
+"""foreign key indexes
+
+Revision ID: 8d2f4b6a1e07
+Revises: 5c3e9a1d7b42
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2f4b6a1e07'
+down_revision: Union[str, None] = '5c3e9a1d7b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_card_list_id'), 'card', ['list_id'], unique=False)
+    # (board_id, position) also serves lookups by board_id alone, so no separate board_id index.
+    op.create_index('ix_list_board_id_position', 'list', ['board_id', 'position'], unique=False)
+    op.create_index(op.f('ix_board_owner_id'), 'board', ['owner_id'], unique=False)
+    op.create_index(op.f('ix_board_is_public'), 'board', ['is_public'], unique=False)
+    op.create_index(op.f('ix_cardactivity_card_id'), 'cardactivity', ['card_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_cardactivity_card_id'), table_name='cardactivity')
+    op.drop_index(op.f('ix_board_is_public'), table_name='board')
+    op.drop_index(op.f('ix_board_owner_id'), table_name='board')
+    op.drop_index('ix_list_board_id_position', table_name='list')
+    op.drop_index(op.f('ix_card_list_id'), table_name='card')
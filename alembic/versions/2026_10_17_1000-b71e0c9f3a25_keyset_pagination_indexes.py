@@ -0,0 +1,28 @@
+"""keyset pagination indexes
+
+Revision ID: b71e0c9f3a25
+Revises: 8d2f4b6a1e07
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71e0c9f3a25'
+down_revision: Union[str, None] = '8d2f4b6a1e07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_user_created_at_id', 'user', ['created_at', 'id'], unique=False)
+    op.create_index('ix_board_created_at_id', 'board', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_board_created_at_id', table_name='board')
+    op.drop_index('ix_user_created_at_id', table_name='user')
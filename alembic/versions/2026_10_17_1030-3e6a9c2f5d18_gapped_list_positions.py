@@ -0,0 +1,42 @@
+"""gapped list positions
+
+Revision ID: 3e6a9c2f5d18
+Revises: b71e0c9f3a25
+Create Date: 2026-10-17 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e6a9c2f5d18'
+down_revision: Union[str, None] = 'b71e0c9f3a25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+POSITION_GAP = 1024
+
+
+def _renumber(step: int) -> None:
+    op.execute(
+        f"""
+        UPDATE list SET position = ranked.rn * {step}
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY board_id ORDER BY position, id) AS rn FROM list
+        ) AS ranked
+        WHERE list.id = ranked.id
+        """
+    )
+
+
+def upgrade() -> None:
+    op.alter_column('list', 'position', existing_type=sa.Integer(), type_=sa.BigInteger())
+    _renumber(POSITION_GAP)
+
+
+def downgrade() -> None:
+    _renumber(1)
+    op.alter_column('list', 'position', existing_type=sa.BigInteger(), type_=sa.Integer())
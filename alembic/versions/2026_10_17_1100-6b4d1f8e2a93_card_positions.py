@@ -0,0 +1,43 @@
+"""card positions
+
+Revision ID: 6b4d1f8e2a93
+Revises: 3e6a9c2f5d18
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6b4d1f8e2a93'
+down_revision: Union[str, None] = '3e6a9c2f5d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+POSITION_GAP = 1024
+
+
+def upgrade() -> None:
+    op.add_column('card', sa.Column('position', sa.BigInteger(), server_default='0', nullable=False))
+    op.execute(
+        f"""
+        UPDATE card SET position = ranked.rn * {POSITION_GAP}
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY list_id ORDER BY created_at, id) AS rn FROM card
+        ) AS ranked
+        WHERE card.id = ranked.id
+        """
+    )
+    op.alter_column('card', 'position', server_default=None)
+    # (list_id, position) also serves lookups by list_id alone.
+    op.create_index('ix_card_list_id_position', 'card', ['list_id', 'position'], unique=False)
+    op.drop_index('ix_card_list_id', table_name='card')
+
+
+def downgrade() -> None:
+    op.create_index('ix_card_list_id', 'card', ['list_id'], unique=False)
+    op.drop_index('ix_card_list_id_position', table_name='card')
+    op.drop_column('card', 'position')
@@ -0,0 +1,30 @@
+"""card children indexes
+
+Revision ID: a4c8e2d6f017
+Revises: 6b4d1f8e2a93
+Create Date: 2026-10-17 11:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c8e2d6f017'
+down_revision: Union[str, None] = '6b4d1f8e2a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_comment_card_id'), 'comment', ['card_id'], unique=False)
+    op.create_index(op.f('ix_cardattachment_card_id'), 'cardattachment', ['card_id'], unique=False)
+    op.create_index(op.f('ix_checklist_card_id'), 'checklist', ['card_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_checklist_card_id'), table_name='checklist')
+    op.drop_index(op.f('ix_cardattachment_card_id'), table_name='cardattachment')
+    op.drop_index(op.f('ix_comment_card_id'), table_name='comment')
@@ -0,0 +1,132 @@
+"""counter columns
+
+Revision ID: c5e1b7a9d342
+Revises: a4c8e2d6f017
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e1b7a9d342'
+down_revision: Union[str, None] = 'a4c8e2d6f017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (parent table, counter column, child table, child foreign key to the parent)
+COUNTERS = [
+    ('board', 'lists_count', 'list', 'board_id'),
+    ('list', 'cards_count', 'card', 'list_id'),
+    ('card', 'comments_count', 'comment', 'card_id'),
+    ('card', 'attachments_count', 'cardattachment', 'card_id'),
+    ('card', 'checklists_count', 'checklist', 'card_id'),
+    ('card', 'performers_count', 'task_performers_association', 'card_id'),
+]
+
+# Adjusts parent.counter by the child row's foreign key; TG_ARGV = (parent table, counter column, foreign key).
+# Moving a child to another parent (e.g. a card to another list) decrements the old parent and increments the new one.
+BUMP_COUNTER_FUNCTION = """
+CREATE OR REPLACE FUNCTION bump_counter() RETURNS trigger AS $$
+DECLARE
+    old_parent integer;
+    new_parent integer;
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        old_parent := (to_jsonb(OLD) ->> TG_ARGV[2])::integer;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'INSERT') THEN
+        new_parent := (to_jsonb(NEW) ->> TG_ARGV[2])::integer;
+    END IF;
+    IF old_parent IS NOT DISTINCT FROM new_parent THEN
+        RETURN NULL;
+    END IF;
+    IF old_parent IS NOT NULL THEN
+        EXECUTE format('UPDATE %I SET %I = %I - 1 WHERE id = $1', TG_ARGV[0], TG_ARGV[1], TG_ARGV[1])
+            USING old_parent;
+    END IF;
+    IF new_parent IS NOT NULL THEN
+        EXECUTE format('UPDATE %I SET %I = %I + 1 WHERE id = $1', TG_ARGV[0], TG_ARGV[1], TG_ARGV[1])
+            USING new_parent;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# The owner always counts as a member, so membership rows for the owner are not counted.
+BUMP_MEMBERS_COUNT_FUNCTION = """
+CREATE OR REPLACE FUNCTION bump_board_members_count() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE board SET members_count = members_count + 1 WHERE id = NEW.board_id AND owner_id <> NEW.user_id;
+    ELSE
+        UPDATE board SET members_count = members_count - 1 WHERE id = OLD.board_id AND owner_id <> OLD.user_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def _trigger_name(parent: str, counter: str) -> str:
+    return f'trg_{parent}_{counter}'
+
+
+def upgrade() -> None:
+    op.add_column('board', sa.Column('lists_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('board', sa.Column('members_count', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('list', sa.Column('cards_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('card', sa.Column('comments_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('card', sa.Column('attachments_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('card', sa.Column('checklists_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('card', sa.Column('performers_count', sa.Integer(), server_default='0', nullable=False))
+
+    op.execute(BUMP_COUNTER_FUNCTION)
+    op.execute(BUMP_MEMBERS_COUNT_FUNCTION)
+
+    for parent, counter, child, foreign_key in COUNTERS:
+        op.execute(
+            f'UPDATE "{parent}" SET {counter} = '
+            f'(SELECT count(*) FROM "{child}" WHERE "{child}".{foreign_key} = "{parent}".id)'
+        )
+        op.execute(
+            f'CREATE TRIGGER {_trigger_name(parent, counter)} '
+            f'AFTER INSERT OR DELETE OR UPDATE OF {foreign_key} ON "{child}" '
+            f"FOR EACH ROW EXECUTE FUNCTION bump_counter('{parent}', '{counter}', '{foreign_key}')"
+        )
+
+    # Board.owner used to back-populate User.boards, which inserted every membership row twice.
+    op.execute(
+        'DELETE FROM board_members_association AS a USING board_members_association AS b '
+        'WHERE a.ctid > b.ctid AND a.board_id = b.board_id AND a.user_id = b.user_id'
+    )
+    op.execute(
+        'UPDATE board SET members_count = 1 + (SELECT count(*) FROM board_members_association AS m '
+        'WHERE m.board_id = board.id AND m.user_id <> board.owner_id)'
+    )
+    op.execute(
+        f'CREATE TRIGGER {_trigger_name("board", "members_count")} '
+        'AFTER INSERT OR DELETE ON board_members_association '
+        'FOR EACH ROW EXECUTE FUNCTION bump_board_members_count()'
+    )
+
+
+def downgrade() -> None:
+    op.execute(f'DROP TRIGGER IF EXISTS {_trigger_name("board", "members_count")} ON board_members_association')
+    for parent, counter, child, foreign_key in reversed(COUNTERS):
+        op.execute(f'DROP TRIGGER IF EXISTS {_trigger_name(parent, counter)} ON "{child}"')
+
+    op.execute('DROP FUNCTION IF EXISTS bump_board_members_count()')
+    op.execute('DROP FUNCTION IF EXISTS bump_counter()')
+
+    op.drop_column('card', 'performers_count')
+    op.drop_column('card', 'checklists_count')
+    op.drop_column('card', 'attachments_count')
+    op.drop_column('card', 'comments_count')
+    op.drop_column('list', 'cards_count')
+    op.drop_column('board', 'members_count')
+    op.drop_column('board', 'lists_count')
@@ -0,0 +1,96 @@
+"""board version
+
+Revision ID: d9f3a1c7e584
+Revises: c5e1b7a9d342
+Create Date: 2026-10-17 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9f3a1c7e584'
+down_revision: Union[str, None] = 'c5e1b7a9d342'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Any direct update of a board row (name, visibility, counters) bumps its version,
+# unless the update already sets the version itself.
+BOARD_VERSION_FUNCTION = """
+CREATE OR REPLACE FUNCTION bump_own_board_version() RETURNS trigger AS $$
+BEGIN
+    IF NEW.version = OLD.version THEN
+        NEW.version := OLD.version + 1;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+LIST_BOARD_VERSION_FUNCTION = """
+CREATE OR REPLACE FUNCTION bump_list_board_version() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE board SET version = version + 1 WHERE id = OLD.board_id;
+    END IF;
+    IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.board_id <> OLD.board_id) THEN
+        UPDATE board SET version = version + 1 WHERE id = NEW.board_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# Card counter triggers update the card row, so comment, attachment, checklist and
+# performer changes reach the board through this trigger as well.
+CARD_BOARD_VERSION_FUNCTION = """
+CREATE OR REPLACE FUNCTION bump_card_board_version() RETURNS trigger AS $$
+DECLARE
+    list_ids integer[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        list_ids := ARRAY[NEW.list_id];
+    ELSIF TG_OP = 'DELETE' THEN
+        list_ids := ARRAY[OLD.list_id];
+    ELSE
+        list_ids := ARRAY[OLD.list_id, NEW.list_id];
+    END IF;
+    UPDATE board SET version = version + 1
+    WHERE id IN (SELECT board_id FROM list WHERE id = ANY(list_ids));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    op.add_column('board', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+    op.execute(BOARD_VERSION_FUNCTION)
+    op.execute(LIST_BOARD_VERSION_FUNCTION)
+    op.execute(CARD_BOARD_VERSION_FUNCTION)
+    op.execute(
+        'CREATE TRIGGER trg_board_version BEFORE UPDATE ON board '
+        'FOR EACH ROW EXECUTE FUNCTION bump_own_board_version()'
+    )
+    op.execute(
+        'CREATE TRIGGER trg_list_board_version AFTER INSERT OR UPDATE OR DELETE ON list '
+        'FOR EACH ROW EXECUTE FUNCTION bump_list_board_version()'
+    )
+    op.execute(
+        'CREATE TRIGGER trg_card_board_version AFTER INSERT OR UPDATE OR DELETE ON card '
+        'FOR EACH ROW EXECUTE FUNCTION bump_card_board_version()'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS trg_card_board_version ON card')
+    op.execute('DROP TRIGGER IF EXISTS trg_list_board_version ON list')
+    op.execute('DROP TRIGGER IF EXISTS trg_board_version ON board')
+    op.execute('DROP FUNCTION IF EXISTS bump_card_board_version()')
+    op.execute('DROP FUNCTION IF EXISTS bump_list_board_version()')
+    op.execute('DROP FUNCTION IF EXISTS bump_own_board_version()')
+    op.drop_column('board', 'version')
@@ -0,0 +1,51 @@
+"""board import jobs
+
+Revision ID: e2b8c4f6a931
+Revises: d9f3a1c7e584
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b8c4f6a931'
+down_revision: Union[str, None] = 'd9f3a1c7e584'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('importjob',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.Enum('pending', 'running', 'completed', 'failed', name='importstatus'), nullable=False),
+    sa.Column('source_path', sa.String(), nullable=False),
+    sa.Column('fallback_user_id', sa.Integer(), nullable=False),
+    sa.Column('processed_lines', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('imported_rows', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('skipped_rows', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('error', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['fallback_user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_importjob_id'), 'importjob', ['id'], unique=False)
+    op.create_table('import_id_map',
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('record_type', sa.String(), nullable=False),
+    sa.Column('old_id', sa.BigInteger(), nullable=False),
+    sa.Column('new_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['job_id'], ['importjob.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('job_id', 'record_type', 'old_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('import_id_map')
+    op.drop_index(op.f('ix_importjob_id'), table_name='importjob')
+    op.drop_table('importjob')
+    sa.Enum(name='importstatus').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,50 @@
+"""outbox
+
+Revision ID: f4a7d2c9b618
+Revises: e2b8c4f6a931
+Create Date: 2026-10-17 13:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a7d2c9b618'
+down_revision: Union[str, None] = 'e2b8c4f6a931'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Wakes the relay (LISTEN outbox) once per inserting statement; it still polls as a fallback.
+NOTIFY_OUTBOX_FUNCTION = """
+CREATE OR REPLACE FUNCTION notify_outbox() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('outbox', '');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    op.create_table('outboxmessage',
+    sa.Column('id', sa.BigInteger(), nullable=False),
+    sa.Column('task', sa.String(), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+    op.execute(NOTIFY_OUTBOX_FUNCTION)
+    op.execute(
+        'CREATE TRIGGER trg_notify_outbox AFTER INSERT ON outboxmessage '
+        'FOR EACH STATEMENT EXECUTE FUNCTION notify_outbox()'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS trg_notify_outbox ON outboxmessage')
+    op.execute('DROP FUNCTION IF EXISTS notify_outbox()')
+    op.drop_table('outboxmessage')
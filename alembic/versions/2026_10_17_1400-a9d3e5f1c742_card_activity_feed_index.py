@@ -0,0 +1,31 @@
+"""card activity feed index
+
+Revision ID: a9d3e5f1c742
+Revises: f4a7d2c9b618
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d3e5f1c742'
+down_revision: Union[str, None] = 'f4a7d2c9b618'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The feed pages by (created_at, id) within a card; the composite index replaces the card_id one.
+    op.create_index(
+        'ix_cardactivity_card_id_created_at_id', 'cardactivity', ['card_id', 'created_at', 'id'], unique=False
+    )
+    op.drop_index(op.f('ix_cardactivity_card_id'), table_name='cardactivity')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_cardactivity_card_id'), 'cardactivity', ['card_id'], unique=False)
+    op.drop_index('ix_cardactivity_card_id_created_at_id', table_name='cardactivity')
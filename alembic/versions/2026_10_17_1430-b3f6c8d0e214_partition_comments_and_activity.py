@@ -0,0 +1,128 @@
+"""partition comments and activity
+
+Revision ID: b3f6c8d0e214
+Revises: a9d3e5f1c742
+Create Date: 2026-10-17 14:30:00.000000
+
+"""
+from datetime import date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f6c8d0e214'
+down_revision: Union[str, None] = 'a9d3e5f1c742'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Monthly partitions created ahead of the current month; src/scripts/partitions.py keeps extending them.
+MONTHS_AHEAD = 3
+
+# (table, foreign keys as (column, referenced table), secondary indexes as (name, columns))
+PARTITIONED_TABLES = [
+    (
+        'comment',
+        [('author_id', 'user'), ('card_id', 'card')],
+        [('ix_comment_id', ['id']), ('ix_comment_card_id', ['card_id'])],
+    ),
+    (
+        'cardactivity',
+        [('performed_by_id', 'user'), ('card_id', 'card')],
+        [('ix_cardactivity_id', ['id']), ('ix_cardactivity_card_id_created_at_id', ['card_id', 'created_at', 'id'])],
+    ),
+]
+
+COMMENTS_COUNT_TRIGGER = (
+    'CREATE TRIGGER trg_card_comments_count AFTER INSERT OR DELETE OR UPDATE OF card_id ON comment '
+    "FOR EACH ROW EXECUTE FUNCTION bump_counter('card', 'comments_count', 'card_id')"
+)
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _partition_name(table: str, month: date) -> str:
+    # The same naming as src/scripts/partitions.py, which relies on it to find old partitions.
+    return f'{table}_p{month:%Y_%m}'
+
+
+def _create_partitions(table: str) -> None:
+    first = op.get_bind().scalar(sa.text(f'SELECT min(created_at) FROM "{table}_unpartitioned"'))
+    current = datetime.utcnow().date().replace(day=1)
+    month = first.date().replace(day=1) if first is not None else current
+
+    while month <= _add_months(current, MONTHS_AHEAD):
+        op.execute(
+            f'CREATE TABLE "{_partition_name(table, month)}" PARTITION OF "{table}" '
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{_add_months(month, 1).isoformat()} 00:00:00+00')"
+        )
+        month = _add_months(month, 1)
+    # Catches rows outside the monthly partitions (e.g. imported history); should stay empty.
+    op.execute(f'CREATE TABLE "{table}_default" PARTITION OF "{table}" DEFAULT')
+
+
+def _create_indexes(table: str, foreign_keys, indexes) -> None:
+    for column, referenced in foreign_keys:
+        op.create_foreign_key(f'{table}_{column}_fkey', table, referenced, [column], ['id'])
+    for name, columns in indexes:
+        op.create_index(name, table, columns, unique=False)
+
+
+def _move_sequence(table: str, source: str) -> None:
+    # The id sequence keeps its values; it now belongs to the new table, so dropping the old one keeps it.
+    sequence = op.get_bind().scalar(sa.text('SELECT pg_get_serial_sequence(:table, \'id\')'), {'table': source})
+    op.execute(f'ALTER SEQUENCE {sequence} OWNED BY "{table}".id')
+
+
+def upgrade() -> None:
+    for table, foreign_keys, indexes in PARTITIONED_TABLES:
+        old = f'{table}_unpartitioned'
+        # Партиціонування за created_at вимагає, щоб ключ був заповнений і входив у первинний ключ.
+        op.execute(f'UPDATE "{table}" SET created_at = COALESCE(updated_at, now()) WHERE created_at IS NULL')
+        for name, _ in indexes:
+            op.drop_index(name, table_name=table)
+        op.execute(f'ALTER TABLE "{table}" RENAME TO "{old}"')
+        op.execute(f'ALTER TABLE "{old}" RENAME CONSTRAINT "{table}_pkey" TO "{old}_pkey"')
+
+        op.execute(
+            f'CREATE TABLE "{table}" (LIKE "{old}" INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)'
+        )
+        op.execute(f'ALTER TABLE "{table}" ALTER COLUMN created_at SET NOT NULL')
+        op.execute(f'ALTER TABLE "{table}" ALTER COLUMN created_at SET DEFAULT now()')
+        op.create_primary_key(f'{table}_pkey', table, ['id', 'created_at'])
+        _create_partitions(table)
+
+        op.execute(f'INSERT INTO "{table}" SELECT * FROM "{old}"')
+        _move_sequence(table, old)
+        op.drop_table(old)
+        _create_indexes(table, foreign_keys, indexes)
+
+    # The counter trigger is created after the copy, so the copied comments are not counted twice.
+    op.execute(COMMENTS_COUNT_TRIGGER)
+
+
+def downgrade() -> None:
+    for table, foreign_keys, indexes in PARTITIONED_TABLES:
+        old = f'{table}_partitioned'
+        op.execute(f'ALTER TABLE "{table}" RENAME TO "{old}"')
+        op.execute(f'ALTER TABLE "{old}" RENAME CONSTRAINT "{table}_pkey" TO "{old}_pkey"')
+        for name, _ in indexes:
+            op.execute(f'ALTER INDEX "{name}" RENAME TO "{name}_partitioned"')
+
+        op.execute(f'CREATE TABLE "{table}" (LIKE "{old}" INCLUDING DEFAULTS)')
+        op.execute(f'ALTER TABLE "{table}" ALTER COLUMN created_at DROP NOT NULL')
+        op.execute(f'ALTER TABLE "{table}" ALTER COLUMN created_at DROP DEFAULT')
+        op.create_primary_key(f'{table}_pkey', table, ['id'])
+
+        op.execute(f'INSERT INTO "{table}" SELECT * FROM "{old}"')
+        _move_sequence(table, old)
+        # Drops the attached partitions; ones detached by src/scripts/partitions.py are standalone tables.
+        op.drop_table(old)
+        _create_indexes(table, foreign_keys, indexes)
+
+    op.execute(COMMENTS_COUNT_TRIGGER)
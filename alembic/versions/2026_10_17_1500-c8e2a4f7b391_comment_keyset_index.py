@@ -0,0 +1,32 @@
+"""comment keyset index
+
+Revision ID: c8e2a4f7b391
+Revises: b3f6c8d0e214
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e2a4f7b391'
+down_revision: Union[str, None] = 'b3f6c8d0e214'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Comment pages are read by (created_at, id) within a card; the composite index replaces the card_id one.
+    # Created on the partitioned table, so every partition (current and future) gets its own copy.
+    op.create_index(
+        'ix_comment_card_id_created_at_id', 'comment', ['card_id', 'created_at', 'id'], unique=False
+    )
+    op.drop_index('ix_comment_card_id', table_name='comment')
+
+
+def downgrade() -> None:
+    op.create_index('ix_comment_card_id', 'comment', ['card_id'], unique=False)
+    op.drop_index('ix_comment_card_id_created_at_id', table_name='comment')
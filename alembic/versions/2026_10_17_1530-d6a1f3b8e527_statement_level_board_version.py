@@ -0,0 +1,132 @@
+"""statement level board version
+
+Revision ID: d6a1f3b8e527
+Revises: c8e2a4f7b391
+Create Date: 2026-10-17 15:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6a1f3b8e527'
+down_revision: Union[str, None] = 'c8e2a4f7b391'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Statement-level triggers: a statement touching many cards or lists (a batch create, a rebalance)
+# bumps each affected board once instead of once per row. Transition tables are only allowed on
+# single-event triggers, so every table gets an INSERT, an UPDATE and a DELETE trigger sharing one function.
+LIST_BOARD_VERSION_FUNCTION = """
+CREATE OR REPLACE FUNCTION bump_list_board_version() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE board SET version = version + 1 WHERE id IN (SELECT board_id FROM new_rows);
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE board SET version = version + 1 WHERE id IN (SELECT board_id FROM old_rows);
+    ELSE
+        -- A cards_count change always comes from a card statement, which bumps the board itself.
+        UPDATE board SET version = version + 1 WHERE id IN (
+            SELECT unnest(ARRAY[o.board_id, n.board_id])
+            FROM old_rows AS o JOIN new_rows AS n ON n.id = o.id
+            WHERE (o.name, o.position, o.board_id) IS DISTINCT FROM (n.name, n.position, n.board_id)
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+CARD_BOARD_VERSION_FUNCTION = """
+CREATE OR REPLACE FUNCTION bump_card_board_version() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE board SET version = version + 1
+        WHERE id IN (SELECT board_id FROM list WHERE id IN (SELECT list_id FROM new_rows));
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE board SET version = version + 1
+        WHERE id IN (SELECT board_id FROM list WHERE id IN (SELECT list_id FROM old_rows));
+    ELSE
+        UPDATE board SET version = version + 1
+        WHERE id IN (
+            SELECT board_id FROM list
+            WHERE id IN (SELECT list_id FROM old_rows UNION SELECT list_id FROM new_rows)
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+ROW_LIST_BOARD_VERSION_FUNCTION = """
+CREATE OR REPLACE FUNCTION bump_list_board_version() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE board SET version = version + 1 WHERE id = OLD.board_id;
+    END IF;
+    IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.board_id <> OLD.board_id) THEN
+        UPDATE board SET version = version + 1 WHERE id = NEW.board_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+ROW_CARD_BOARD_VERSION_FUNCTION = """
+CREATE OR REPLACE FUNCTION bump_card_board_version() RETURNS trigger AS $$
+DECLARE
+    list_ids integer[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        list_ids := ARRAY[NEW.list_id];
+    ELSIF TG_OP = 'DELETE' THEN
+        list_ids := ARRAY[OLD.list_id];
+    ELSE
+        list_ids := ARRAY[OLD.list_id, NEW.list_id];
+    END IF;
+    UPDATE board SET version = version + 1
+    WHERE id IN (SELECT board_id FROM list WHERE id = ANY(list_ids));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+TRANSITION_TABLES = {
+    'INSERT': 'REFERENCING NEW TABLE AS new_rows',
+    'UPDATE': 'REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows',
+    'DELETE': 'REFERENCING OLD TABLE AS old_rows',
+}
+
+
+def upgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS trg_card_board_version ON card')
+    op.execute('DROP TRIGGER IF EXISTS trg_list_board_version ON list')
+    op.execute(LIST_BOARD_VERSION_FUNCTION)
+    op.execute(CARD_BOARD_VERSION_FUNCTION)
+
+    for table in ('list', 'card'):
+        for event, referencing in TRANSITION_TABLES.items():
+            op.execute(
+                f'CREATE TRIGGER trg_{table}_board_version_{event.lower()} AFTER {event} ON {table} '
+                f'{referencing} FOR EACH STATEMENT EXECUTE FUNCTION bump_{table}_board_version()'
+            )
+
+
+def downgrade() -> None:
+    for table in ('card', 'list'):
+        for event in TRANSITION_TABLES:
+            op.execute(f'DROP TRIGGER IF EXISTS trg_{table}_board_version_{event.lower()} ON {table}')
+
+    op.execute(ROW_LIST_BOARD_VERSION_FUNCTION)
+    op.execute(ROW_CARD_BOARD_VERSION_FUNCTION)
+    op.execute(
+        'CREATE TRIGGER trg_list_board_version AFTER INSERT OR UPDATE OR DELETE ON list '
+        'FOR EACH ROW EXECUTE FUNCTION bump_list_board_version()'
+    )
+    op.execute(
+        'CREATE TRIGGER trg_card_board_version AFTER INSERT OR UPDATE OR DELETE ON card '
+        'FOR EACH ROW EXECUTE FUNCTION bump_card_board_version()'
+    )
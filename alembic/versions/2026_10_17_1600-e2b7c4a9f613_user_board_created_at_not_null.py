@@ -0,0 +1,35 @@
+"""user board created_at not null
+
+Revision ID: e2b7c4a9f613
+Revises: d6a1f3b8e527
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7c4a9f613'
+down_revision: Union[str, None] = 'd6a1f3b8e527'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables paginated by the (created_at, id) keyset: a NULL created_at never compares greater than
+# a cursor, so such rows would be skipped by every page after the first.
+KEYSET_TABLES = ('user', 'board')
+
+
+def upgrade() -> None:
+    for table in KEYSET_TABLES:
+        op.execute(f'UPDATE "{table}" SET created_at = COALESCE(updated_at, now()) WHERE created_at IS NULL')
+        op.alter_column(table, 'created_at', existing_type=sa.DateTime(timezone=True), server_default=sa.func.now())
+        op.alter_column(table, 'created_at', existing_type=sa.DateTime(timezone=True), nullable=False)
+
+
+def downgrade() -> None:
+    for table in KEYSET_TABLES:
+        op.alter_column(table, 'created_at', existing_type=sa.DateTime(timezone=True), nullable=True)
+        op.alter_column(table, 'created_at', existing_type=sa.DateTime(timezone=True), server_default=None)
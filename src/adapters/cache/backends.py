@@ -0,0 +1,92 @@
+import threading
+import time
+from typing import Dict, Optional, Protocol, Tuple
+
+import redis
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        ...
+
+    def add(self, key: str, value: bytes) -> bool:
+        """Stores the value only if the key is absent; returns whether it was stored."""
+        ...
+
+    def incr(self, key: str) -> int:
+        ...
+
+
+class RedisCacheBackend:
+    def __init__(self, url: str) -> None:
+        self._redis = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._redis.get(key)
+
+    def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        self._redis.set(key, value, ex=ttl)
+
+    def add(self, key: str, value: bytes) -> bool:
+        return bool(self._redis.set(key, value, nx=True))
+
+    def incr(self, key: str) -> int:
+        return self._redis.incr(key)
+
+
+class InMemoryCacheBackend:
+    """
+    Process-local stand-in for Redis with the same semantics, for tests and single-process runs.
+    Invalidations are not seen by other processes, so do not use it with several workers.
+    """
+
+    def __init__(self) -> None:
+        self._data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[bytes]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            return self._get(key)
+
+    def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl if ttl else None)
+
+    def add(self, key: str, value: bytes) -> bool:
+        with self._lock:
+            if self._get(key) is not None:
+                return False
+            self._data[key] = (value, None)
+            return True
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value = int(self._get(key) or 0) + 1
+            self._data[key] = (str(value).encode(), None)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+def create_cache_backend(url: Optional[str]) -> Optional[CacheBackend]:
+    """``redis://...`` for Redis, ``memory://`` for the in-process stand-in, empty to disable caching."""
+    if not url:
+        return None
+    if url.startswith("memory://"):
+        return InMemoryCacheBackend()
+    return RedisCacheBackend(url)
@@ -0,0 +1,165 @@
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+
+import redis
+from sqlalchemy import DateTime, Enum, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from src.adapters.cache.backends import CacheBackend, create_cache_backend
+from src.main.config import settings
+
+ModelT = TypeVar("ModelT")
+
+
+def _dump_row(obj: Any) -> Dict[str, Any]:
+    data = {}
+    for column in inspect(type(obj)).columns:
+        value = getattr(obj, column.key)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(column.type, Enum) and value is not None:
+            value = value.name
+        data[column.key] = value
+    return data
+
+
+def _load_row(session: Session, model: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+    columns = inspect(model).columns
+    values = {}
+    for key, value in data.items():
+        column_type = columns[key].type
+        if value is not None and isinstance(column_type, DateTime):
+            value = datetime.fromisoformat(value)
+        elif value is not None and isinstance(column_type, Enum):
+            value = column_type.enum_class[value]
+        values[key] = value
+
+    obj = model(**values)
+    # Робимо об'єкт "завантаженим" без запиту до БД; якщо він уже є в сесії, merge поверне наявний.
+    make_transient_to_detached(obj)
+    return session.merge(obj, load=False)
+
+
+class CacheMetrics:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "errors": 0}
+        )
+        self._invalidations = 0
+
+    def record(self, name: str, outcome: str) -> None:
+        with self._lock:
+            self._counters[name][outcome] += 1
+
+    def record_invalidation(self) -> None:
+        with self._lock:
+            self._invalidations += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            reads = {name: dict(counters) for name, counters in self._counters.items()}
+            invalidations = self._invalidations
+        for counters in reads.values():
+            lookups = counters["hits"] + counters["misses"]
+            counters["hit_ratio"] = round(counters["hits"] / lookups, 4) if lookups else None
+        return {"reads": reads, "invalidations": invalidations}
+
+
+class BoardCache:
+    """
+    Read-through cache of a board and the rows shown on it (its lists, the cards of each list).
+
+    Every key embeds the board's version, and any write to the board, its lists or cards bumps
+    the version, so stale entries are never read again and simply expire by TTL.
+    Backend failures are logged and the read falls through to the database.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend], ttl: int) -> None:
+        self._backend = backend
+        self._ttl = ttl
+        self.metrics = CacheMetrics()
+
+    @property
+    def enabled(self) -> bool:
+        return self._backend is not None
+
+    @staticmethod
+    def _version_key(board_id: int) -> str:
+        return f"board:{board_id}:version"
+
+    def _version(self, board_id: int) -> bytes:
+        key = self._version_key(board_id)
+        version = self._backend.get(key)
+        if version is None:
+            # Стартуємо з унікального значення, щоб після втрати ключа версії не прочитати старі записи.
+            self._backend.add(key, str(time.time_ns()).encode())
+            version = self._backend.get(key)
+        return version
+
+    def read_through(
+            self,
+            session: Session,
+            board_id: int,
+            name: str,
+            model: Type[ModelT],
+            loader: Callable[[], List[ModelT]],
+            scope: str = "",
+            cache_empty: bool = True,
+    ) -> List[ModelT]:
+        """
+        Returns the cached ``name`` rows of the board (narrowed by ``scope``, e.g. a list id)
+        or loads them with ``loader`` and caches them. With ``cache_empty=False`` an empty result
+        (e.g. a board that does not exist yet) is not cached.
+        """
+        if self._backend is None:
+            return loader()
+
+        try:
+            key = f"board:{board_id}:v{self._version(board_id).decode()}:{name}:{scope}"
+            cached = self._backend.get(key)
+        except redis.RedisError as e:
+            logging.warning(f"Board cache lookup failed: {e}")
+            self.metrics.record(name, "errors")
+            return loader()
+
+        if cached is not None:
+            self.metrics.record(name, "hits")
+            return [_load_row(session, model, data) for data in json.loads(cached)]
+
+        self.metrics.record(name, "misses")
+        rows = loader()
+        if not rows and not cache_empty:
+            return rows
+        try:
+            self._backend.set(key, json.dumps([_dump_row(row) for row in rows]).encode(), ttl=self._ttl)
+        except redis.RedisError as e:
+            logging.warning(f"Board cache store failed: {e}")
+            self.metrics.record(name, "errors")
+        return rows
+
+    def invalidate(self, *board_ids: Optional[int]) -> None:
+        if self._backend is None:
+            return
+
+        for board_id in set(board_ids):
+            if board_id is None:
+                continue
+            key = self._version_key(board_id)
+            try:
+                if not self._backend.add(key, str(time.time_ns()).encode()):
+                    self._backend.incr(key)
+                self.metrics.record_invalidation()
+            except redis.RedisError as e:
+                logging.warning(f"Board cache invalidation failed: {e}")
+
+
+board_cache = BoardCache(
+    backend=create_cache_backend(settings.BOARD_CACHE_URL),
+    ttl=settings.BOARD_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,93 @@
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+import redis
+from cachetools import TTLCache
+
+from src.adapters.sqlalchemy.models.user import User, UserType
+from src.main.config import settings
+
+
+@dataclass(frozen=True)
+class UserPrincipal:
+    """The part of a user the auth dependencies need: enough for every permission check."""
+    id: int
+    type: UserType
+    is_active: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserPrincipal":
+        return cls(id=user.id, type=user.type, is_active=user.is_active)
+
+
+class PrincipalCache:
+    """
+    Bounded in-process TTL cache of user principals keyed by the token ``sub``,
+    optionally backed by a shared Redis tier.
+
+    Invalidation clears the local tier and Redis; other processes drop their local
+    copy when its TTL expires, so keep the TTL short.
+    """
+
+    def __init__(self, maxsize: int, ttl: int, redis_url: Optional[str] = None) -> None:
+        self._ttl = ttl
+        self._local = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self._redis = redis.Redis.from_url(redis_url) if redis_url else None
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"principal:{user_id}"
+
+    def get(self, user_id: int) -> Optional[UserPrincipal]:
+        with self._lock:
+            principal = self._local.get(user_id)
+        if principal is not None or self._redis is None:
+            return principal
+
+        try:
+            raw = self._redis.get(self._key(user_id))
+        except redis.RedisError as e:
+            logging.warning(f"Principal cache lookup failed: {e}")
+            return None
+        if raw is None:
+            return None
+
+        data = json.loads(raw)
+        principal = UserPrincipal(id=data["id"], type=UserType(data["type"]), is_active=data["is_active"])
+        with self._lock:
+            self._local[user_id] = principal
+        return principal
+
+    def set(self, principal: UserPrincipal) -> None:
+        with self._lock:
+            self._local[principal.id] = principal
+        if self._redis is None:
+            return
+
+        data = {"id": principal.id, "type": principal.type.value, "is_active": principal.is_active}
+        try:
+            self._redis.set(self._key(principal.id), json.dumps(data), ex=self._ttl)
+        except redis.RedisError as e:
+            logging.warning(f"Principal cache store failed: {e}")
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._local.pop(user_id, None)
+        if self._redis is None:
+            return
+
+        try:
+            self._redis.delete(self._key(user_id))
+        except redis.RedisError as e:
+            logging.warning(f"Principal cache invalidation failed: {e}")
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.USER_CACHE_MAXSIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+    redis_url=settings.USER_CACHE_REDIS_URL,
+)
@@ -1,6 +1,25 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from src.adapters.sqlalchemy.db.session import SessionLocal
 
+# Planner estimate maintained by VACUUM/ANALYZE; -1 for a table that was never analyzed.
+ESTIMATED_COUNT_QUERY = text(
+    "SELECT GREATEST(reltuples, 0)::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"
+)
+
 
 class SQLAlchemyRepo:
     def __init__(self, session: SessionLocal) -> None:
         self._session = session
+
+    def _estimated_count(self, table_name: str) -> int:
+        return self._session.scalar(ESTIMATED_COUNT_QUERY, {"table_name": table_name}) or 0
+
+
+class AsyncSQLAlchemyRepo:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def _estimated_count(self, table_name: str) -> int:
+        return await self._session.scalar(ESTIMATED_COUNT_QUERY, {"table_name": table_name}) or 0
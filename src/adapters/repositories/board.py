@@ -1,40 +1,88 @@
 from typing import List
 
+from sqlalchemy import select, exists, tuple_, Row, Select
+from sqlalchemy.orm import selectinload, load_only
 from typing_extensions import Optional
 
-from src.adapters.repositories.base import SQLAlchemyRepo
-from src.adapters.repositories.common.board import BoardSaver, BoardReader, BoardsReader
-from src.adapters.sqlalchemy.models import Board, User
+from src.adapters.cache.board import board_cache
+from src.adapters.repositories.base import SQLAlchemyRepo, AsyncSQLAlchemyRepo
+from src.adapters.repositories.common.board import (
+    BoardSaver, BoardReader, BoardsReader, BoardSummaryReader, BoardSnapshotReader, AsyncBoardReader,
+    AsyncBoardsReader
+)
+from src.adapters.schemas.pagination import Cursor
+from src.adapters.sqlalchemy.models import Board, User, List as ListModel, Card
 from src.adapters.sqlalchemy.models.board import board_members_association
 
 
-class BoardRepository(SQLAlchemyRepo, BoardSaver, BoardReader, BoardsReader):
+def _is_member_query(board_id: int, user_id: int) -> Select:
+    # Одна перевірка по індексу (board_id, user_id) замість завантаження всіх учасників.
+    return select(
+        exists().where(
+            board_members_association.c.board_id == board_id,
+            board_members_association.c.user_id == user_id,
+        )
+    )
+
+
+def _board_summary_query(board_id: int, user_id: int) -> Select:
+    """
+    Board row together with its list and member counts and whether the user is a member.
+    The counts are trigger-maintained columns, so only the membership needs a subquery.
+    """
+    is_member = (
+        exists()
+        .where(
+            board_members_association.c.board_id == Board.id,
+            board_members_association.c.user_id == user_id,
+        )
+        .correlate(Board)
+    )
+
+    return select(
+        Board,
+        # Read as a plain column: a Board already in the session (e.g. from the board cache)
+        # keeps its possibly stale attributes, while this value always comes from the row.
+        Board.version.label("version"),
+        Board.lists_count.label("lists_count"),
+        Board.members_count.label("members_count"),
+        is_member.label("is_member"),
+    ).where(Board.id == board_id)
+
+
+class BoardRepository(
+    SQLAlchemyRepo, BoardSaver, BoardReader, BoardsReader, BoardSummaryReader, BoardSnapshotReader
+):
     def save_board(self, board: Board) -> None:
         self._session.add(board)
         self._session.commit()
+        board_cache.invalidate(board.id)
         self._session.refresh(board)
 
     def update_board(self, board_id: int, board_data: dict) -> Optional[Board]:
-        board = self.get_board_by_id(board_id)
+        board = self._get_board(board_id)
         if board:
             for key, value in board_data.items():
                 setattr(board, key, value)
             self._session.commit()
+            board_cache.invalidate(board_id)
             self._session.refresh(board)
         return board
 
     def delete_board(self, board_id: int) -> None:
-        board = self.get_board_by_id(board_id)
+        board = self._get_board(board_id)
         if board:
             self._session.delete(board)
             self._session.commit()
+            board_cache.invalidate(board_id)
 
     def add_member_to_board(self, board_id: int, member_id: int) -> None:
-        board = self.get_board_by_id(board_id)
+        board = self._get_board(board_id)
         if board:
             member = self._session.query(User).filter(User.id == member_id).first()
             board.members.append(member)
             self._session.commit()
+            board_cache.invalidate(board_id)
             self._session.refresh(board)
 
     def remove_member_from_board(self, board_id: int, member_id: int) -> bool:
@@ -45,6 +93,7 @@ class BoardRepository(SQLAlchemyRepo, BoardSaver, BoardReader, BoardsReader):
         )
 
         self._session.commit()
+        board_cache.invalidate(board_id)
 
         if result.rowcount > 0:
             return True
@@ -55,21 +104,68 @@ class BoardRepository(SQLAlchemyRepo, BoardSaver, BoardReader, BoardsReader):
         return board.members
 
     def get_board_by_id(self, board_id: int) -> Optional[Board]:
-        return self._session.query(Board).filter(Board.id == board_id).first()
+        boards = board_cache.read_through(
+            self._session, board_id, "board", Board,
+            loader=lambda: [board] if (board := self._get_board(board_id)) else [],
+            # Не кешуємо 404: дошку з цим ID може створити запис повз репозиторій (імпорт через COPY).
+            cache_empty=False,
+        )
+        return boards[0] if boards else None
 
-    def get_list_of_public_boards(self, skip: int = 0, limit: int = 10) -> List[Board]:
-        return self._session.query(Board).filter(Board.is_public == True).offset(skip).limit(limit).all()
+    def _get_board(self, board_id: int) -> Optional[Board]:
+        return self._session.query(Board).filter(Board.id == board_id).first()
 
-    def get_lists_count(self, board_id: int) -> int:
-        board = self.get_board_by_id(board_id)
-        if board:
-            return len(board.lists)
+    def is_member(self, board_id: int, user_id: int) -> bool:
+        return self._session.scalar(_is_member_query(board_id=board_id, user_id=user_id))
+
+    def get_list_of_public_boards(
+            self, skip: int = 0, limit: int = 10, after: Optional[Cursor] = None
+    ) -> List[Board]:
+        query = self._session.query(Board).filter(Board.is_public == True).order_by(Board.created_at, Board.id)
+        if after is not None:
+            query = query.filter(tuple_(Board.created_at, Board.id) > after)
+        else:
+            # Курсор уже задає позицію сторінки, тож skip разом з ним не застосовуємо.
+            query = query.offset(skip)
+        return query.limit(limit).all()
+
+    def get_board_summary(self, board_id: int, user_id: int) -> Optional[Row]:
+        return self._session.execute(_board_summary_query(board_id=board_id, user_id=user_id)).first()
+
+    def get_board_lists_with_cards(self, board_id: int) -> List[ListModel]:
+        # Три запити незалежно від розміру дошки: списки, їх картки та виконавці карток.
+        # Кількості коментарів, чек-листів і вкладень зберігаються в самих картках.
+        return list(
+            self._session.scalars(
+                select(ListModel)
+                .where(ListModel.board_id == board_id)
+                .order_by(ListModel.position, ListModel.id)
+                .options(
+                    selectinload(ListModel.cards).selectinload(Card.performers).options(load_only(User.id))
+                )
+            )
+        )
 
-    def get_members_count(self, board_id: int) -> int:
-        board = self.get_board_by_id(board_id)
-        if board:
-            members_count = len(board.members)
-            if board.owner_id not in board.members:
-                members_count += 1
 
-            return members_count
+class AsyncBoardRepository(AsyncSQLAlchemyRepo, AsyncBoardReader, AsyncBoardsReader):
+    async def get_board_by_id(self, board_id: int) -> Optional[Board]:
+        result = await self._session.execute(select(Board).where(Board.id == board_id))
+        return result.scalars().first()
+
+    async def get_list_of_public_boards(
+            self, skip: int = 0, limit: int = 10, after: Optional[Cursor] = None
+    ) -> List[Board]:
+        query = select(Board).where(Board.is_public == True).order_by(Board.created_at, Board.id)
+        if after is not None:
+            query = query.where(tuple_(Board.created_at, Board.id) > after)
+        else:
+            query = query.offset(skip)
+        result = await self._session.execute(query.limit(limit))
+        return list(result.scalars().all())
+
+    async def is_member(self, board_id: int, user_id: int) -> bool:
+        return await self._session.scalar(_is_member_query(board_id=board_id, user_id=user_id))
+
+    async def get_board_summary(self, board_id: int, user_id: int) -> Optional[Row]:
+        result = await self._session.execute(_board_summary_query(board_id=board_id, user_id=user_id))
+        return result.first()
@@ -0,0 +1,61 @@
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import Select, select
+
+from src.adapters.repositories.base import SQLAlchemyRepo
+from src.adapters.repositories.common.board import BoardExporter
+from src.adapters.sqlalchemy.models import Board, List as ListModel, Card
+from src.adapters.sqlalchemy.models.card import Comment, CheckList, CardActivity, task_performers_association
+
+# Rows fetched per round trip from the server-side cursor.
+EXPORT_BATCH_SIZE = 1000
+
+
+class BoardExportRepository(SQLAlchemyRepo, BoardExporter):
+    """
+    Streams boards and everything on them, parents before children, one table at a time.
+
+    Every query runs on a server-side cursor (``yield_per``) and selects plain columns,
+    so memory use does not depend on the size of the export.
+    """
+
+    def iter_export_records(
+            self, board_ids: Optional[List[int]] = None, owner_id: Optional[int] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        boards = select(Board.id)
+        if board_ids is not None:
+            boards = boards.where(Board.id.in_(board_ids))
+        if owner_id is not None:
+            boards = boards.where(Board.owner_id == owner_id)
+        scoped = board_ids is not None or owner_id is not None
+
+        lists = select(ListModel.id).where(ListModel.board_id.in_(boards))
+        cards = select(Card.id).where(Card.list_id.in_(lists))
+
+        tables = [
+            ("board", Board.__table__, Board.id.in_(boards), [Board.id]),
+            ("list", ListModel.__table__, ListModel.board_id.in_(boards), [ListModel.board_id, ListModel.position]),
+            ("card", Card.__table__, Card.list_id.in_(lists), [Card.list_id, Card.position, Card.id]),
+            (
+                "card_performer", task_performers_association, task_performers_association.c.card_id.in_(cards),
+                [task_performers_association.c.card_id, task_performers_association.c.user_id]
+            ),
+            ("comment", Comment.__table__, Comment.card_id.in_(cards), [Comment.card_id, Comment.id]),
+            ("checklist", CheckList.__table__, CheckList.card_id.in_(cards), [CheckList.card_id, CheckList.id]),
+            ("activity", CardActivity.__table__, CardActivity.card_id.in_(cards), [CardActivity.card_id, CardActivity.id]),
+        ]
+
+        for record_type, table, scope, order_by in tables:
+            query = select(*table.columns).order_by(*order_by)
+            if scoped:
+                query = query.where(scope)
+            for row in self._stream(query):
+                yield record_type, row
+
+    def _stream(self, query: Select) -> Iterator[Dict[str, Any]]:
+        result = self._session.execute(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        # Імена колонок асоціативних таблиць приходять як quoted_name, а не str.
+        keys = [str(key) for key in result.keys()]
+        for partition in result.partitions():
+            for row in partition:
+                yield dict(zip(keys, row))
@@ -0,0 +1,97 @@
+import io
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import select, text, or_
+
+from src.adapters.repositories.base import SQLAlchemyRepo
+from src.adapters.repositories.common.board import BoardImporter
+from src.adapters.sqlalchemy.models import User, ImportJob, Card, List as ListModel
+from src.adapters.sqlalchemy.models.board_import import import_id_map
+
+COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_value(value: Any) -> str:
+    """Formats a value for COPY's text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return str(value).translate(COPY_ESCAPES)
+
+
+class BoardImportRepository(SQLAlchemyRepo, BoardImporter):
+    def create_job(self, source_path: str, fallback_user_id: int) -> ImportJob:
+        job = ImportJob(source_path=source_path, fallback_user_id=fallback_user_id)
+        self._session.add(job)
+        self._session.commit()
+        self._session.refresh(job)
+        return job
+
+    def get_job(self, job_id: int) -> Optional[ImportJob]:
+        return self._session.get(ImportJob, job_id)
+
+    def save_job(self, job: ImportJob) -> None:
+        self._session.add(job)
+        self._session.commit()
+
+    def allocate_ids(self, table_name: str, count: int) -> List[int]:
+        # nextval() з тієї ж послідовності, що й звичайні INSERT, тож ID не перетнуться.
+        return list(self._session.scalars(
+            text(
+                "SELECT nextval(pg_get_serial_sequence(:table_name, 'id')) FROM generate_series(1, :count)"
+            ),
+            {"table_name": f'"{table_name}"', "count": count},
+        ))
+
+    def get_new_ids(self, job_id: int, record_type: str, old_ids: Iterable[int]) -> Dict[int, int]:
+        old_ids = list(old_ids)
+        if not old_ids:
+            return {}
+
+        query = select(import_id_map.c.old_id, import_id_map.c.new_id).where(
+            import_id_map.c.job_id == job_id,
+            import_id_map.c.record_type == record_type,
+            import_id_map.c.old_id.in_(old_ids),
+        )
+        return dict(self._session.execute(query).all())
+
+    def get_existing_user_ids(self, user_ids: Iterable[int]) -> Set[int]:
+        user_ids = list(user_ids)
+        if not user_ids:
+            return set()
+
+        return set(self._session.scalars(select(User.id).where(User.id.in_(user_ids))))
+
+    def copy_rows(self, table_name: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> None:
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write("\t".join(_copy_value(value) for value in row))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        cursor = self._session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(f'COPY "{table_name}" ({column_list}) FROM STDIN', buffer)
+        finally:
+            cursor.close()
+
+    def save_id_map(self, job_id: int, record_type: str, pairs: Iterable[Tuple[int, int]]) -> None:
+        self.copy_rows(
+            import_id_map.name,
+            ["job_id", "record_type", "old_id", "new_id"],
+            ((job_id, record_type, old_id, new_id) for old_id, new_id in pairs),
+        )
+
+    def get_board_ids(self, list_ids: Iterable[int] = (), card_ids: Iterable[int] = ()) -> Set[int]:
+        list_ids, card_ids = set(list_ids), set(card_ids)
+        if not list_ids and not card_ids:
+            return set()
+
+        return set(self._session.scalars(
+            select(ListModel.board_id).distinct().where(or_(
+                ListModel.id.in_(list_ids),
+                ListModel.id.in_(select(Card.list_id).where(Card.id.in_(card_ids))),
+            ))
+        ))
@@ -1,14 +1,22 @@
-from typing import List, Optional
+from typing import List, Optional, Iterable, Set, Dict
 
-from src.adapters.repositories.base import SQLAlchemyRepo
-from src.adapters.repositories.common.card import CardSaver, CardReader
+from sqlalchemy import select, insert, update, func, distinct, Row
+
+from src.adapters.cache.board import board_cache
+from src.adapters.repositories.base import SQLAlchemyRepo, AsyncSQLAlchemyRepo
+from src.adapters.repositories.common.card import (
+    CardSaver, CardReader, CardBatchSaver, CardPositioner, AsyncCardReader
+)
+from src.adapters.repositories.positioning import rank_between, neighbour_positions, rebalance_positions
+from src.adapters.sqlalchemy.models import List as ListModel, User
 from src.adapters.sqlalchemy.models.card import Card
 
 
-class CardRepository(SQLAlchemyRepo, CardSaver, CardReader):
+class CardRepository(SQLAlchemyRepo, CardSaver, CardReader, CardBatchSaver, CardPositioner):
     def save_card(self, card: Card) -> None:
         self._session.commit()
         self._session.refresh(card)
+        self._invalidate_lists(card.list_id)
 
     def create_card(self, card: Card) -> None:
         self._session.add(card)
@@ -21,6 +29,7 @@ class CardRepository(SQLAlchemyRepo, CardSaver, CardReader):
                 setattr(card, key, value)
             self._session.commit()
             self._session.refresh(card)
+            self._invalidate_lists(list_id, card.list_id)
         return card
 
     def delete_card(self, list_id: int, card_id: int) -> None:
@@ -28,6 +37,81 @@ class CardRepository(SQLAlchemyRepo, CardSaver, CardReader):
         if card:
             self._session.delete(card)
             self._session.commit()
+            self._invalidate_lists(list_id)
+
+    def create_cards(self, cards_data: List[Dict]) -> List[Card]:
+        # Один INSERT ... VALUES (...), (...) RETURNING замість коміту на кожну картку.
+        card_ids = list(self._session.scalars(insert(Card).returning(Card.id), cards_data))
+        self._session.commit()
+        self._invalidate_lists(*(card_data["list_id"] for card_data in cards_data))
+        return self._get_cards_by_ids(card_ids)
+
+    def update_cards(self, cards_data: List[Dict]) -> List[Card]:
+        # Масове оновлення за первинним ключем (executemany) в одній транзакції.
+        self._session.execute(update(Card), cards_data)
+        self._session.commit()
+        cards = self._get_cards_by_ids([card_data["id"] for card_data in cards_data])
+        # Картки переміщуються лише в межах дошки, тож достатньо поточних списків.
+        self._invalidate_lists(*(card.list_id for card in cards))
+        return cards
+
+    def move_card(self, card: Card, list_id: int, index: int) -> None:
+        # Блокування рядка цільового списку серіалізує конкурентні переміщення в нього.
+        self._session.execute(select(ListModel.id).where(ListModel.id == list_id).with_for_update())
+
+        args = (self._session, Card, Card.list_id, list_id, card.id, index)
+        position = rank_between(*neighbour_positions(*args))
+        if position is None:
+            rebalance_positions(self._session, Card, Card.list_id, list_id)
+            position = rank_between(*neighbour_positions(*args))
+
+        card.list_id = list_id
+        card.position = position
+        self._session.commit()
+        self._invalidate_lists(list_id)
+        self._session.refresh(card)
+
+    def get_next_positions(self, list_ids: Iterable[int]) -> Dict[int, int]:
+        """Позиція для нової картки в кінці кожного зі списків."""
+        list_ids = list(list_ids)
+        max_positions = dict(
+            self._session.execute(
+                select(Card.list_id, func.max(Card.position))
+                .where(Card.list_id.in_(list_ids))
+                .group_by(Card.list_id)
+            ).all()
+        )
+        return {list_id: rank_between(max_positions.get(list_id), None) for list_id in list_ids}
+
+    def _invalidate_lists(self, *list_ids: int) -> None:
+        """Bumps the cache version of the boards the lists belong to."""
+        if not board_cache.enabled:
+            return
+        board_ids = self._session.scalars(
+            select(distinct(ListModel.board_id)).where(ListModel.id.in_(set(list_ids)))
+        )
+        board_cache.invalidate(*board_ids)
+
+    def _get_cards_by_ids(self, card_ids: List[int]) -> List[Card]:
+        cards = self._session.query(Card).filter(Card.id.in_(card_ids)).all()
+        cards_by_id = {card.id: card for card in cards}
+        return [cards_by_id[card_id] for card_id in card_ids]
+
+    def get_board_list_ids(self, board_id: int, list_ids: Iterable[int]) -> Set[int]:
+        return set(
+            self._session.scalars(
+                select(ListModel.id).where(ListModel.board_id == board_id, ListModel.id.in_(list(list_ids)))
+            )
+        )
+
+    def get_board_cards_state(self, board_id: int, card_ids: Iterable[int]) -> List[Row]:
+        """Current list, title, due date and responsible email of the board's cards with the given ids."""
+        return self._session.execute(
+            select(Card.id, Card.list_id, Card.title, Card.due_date, User.email.label("responsible_email"))
+            .join(ListModel, ListModel.id == Card.list_id)
+            .outerjoin(User, User.id == Card.responsible_person_id)
+            .where(ListModel.board_id == board_id, Card.id.in_(list(card_ids)))
+        ).all()
 
     def get_card(self, list_id: int, card_id: int) -> Optional[Card]:
         return (
@@ -36,8 +120,28 @@ class CardRepository(SQLAlchemyRepo, CardSaver, CardReader):
             .first()
         )
 
-    def get_cards(self, list_id: Optional[int] = None) -> List[Card]:
+    def get_cards(self, list_id: Optional[int] = None, board_id: Optional[int] = None) -> List[Card]:
         query = self._session.query(Card)
         if list_id is not None:
-            query = query.filter(Card.list_id == list_id)
-        return query.all()
+            query = query.filter(Card.list_id == list_id).order_by(Card.position, Card.id)
+        if board_id is None or list_id is None:
+            return query.all()
+        # Кешуються лише картки списку з відомою дошкою: версія ключа належить дошці.
+        return board_cache.read_through(
+            self._session, board_id, "cards", Card, loader=query.all, scope=str(list_id)
+        )
+
+
+class AsyncCardRepository(AsyncSQLAlchemyRepo, AsyncCardReader):
+    async def get_card(self, list_id: int, card_id: int) -> Optional[Card]:
+        result = await self._session.execute(
+            select(Card).where(Card.list_id == list_id, Card.id == card_id)
+        )
+        return result.scalars().first()
+
+    async def get_cards(self, list_id: Optional[int] = None) -> List[Card]:
+        query = select(Card)
+        if list_id is not None:
+            query = query.where(Card.list_id == list_id).order_by(Card.position, Card.id)
+        result = await self._session.execute(query)
+        return list(result.scalars().all())
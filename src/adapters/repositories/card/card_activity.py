@@ -0,0 +1,36 @@
+from typing import List, Optional, Iterable, Set
+
+from sqlalchemy import select, insert, tuple_
+
+from src.adapters.repositories.base import SQLAlchemyRepo
+from src.adapters.repositories.common.card import CardActivitySaver, CardActivityReader
+from src.adapters.schemas.pagination import Cursor
+from src.adapters.sqlalchemy.models.card import Card, CardActivity
+
+
+class CardActivityRepository(SQLAlchemyRepo, CardActivitySaver, CardActivityReader):
+    def save_card_activity(self, activity: CardActivity) -> None:
+        self._session.add(activity)
+        self._session.commit()
+
+    def save_card_activities(self, activities: List[dict]) -> None:
+        # Один багаторядковий INSERT на всю пачку.
+        self._session.execute(insert(CardActivity), activities)
+        self._session.commit()
+
+    def get_existing_card_ids(self, card_ids: Iterable[int]) -> Set[int]:
+        return set(self._session.scalars(select(Card.id).where(Card.id.in_(set(card_ids)))))
+
+    def get_card_activities(
+            self, card_id: int, limit: int = 50, before: Optional[Cursor] = None
+    ) -> List[CardActivity]:
+        # Newest first; served by the (card_id, created_at, id) index.
+        query = select(CardActivity).where(CardActivity.card_id == card_id)
+        if before is not None:
+            query = query.where(tuple_(CardActivity.created_at, CardActivity.id) < before)
+        query = query.order_by(CardActivity.created_at.desc(), CardActivity.id.desc()).limit(limit)
+        return list(self._session.scalars(query))
+
+    def get_card_activity(self, activity_id: int) -> Optional[CardActivity]:
+        # The primary key is (id, created_at), so the lookup scans every partition's id index.
+        return self._session.scalar(select(CardActivity).where(CardActivity.id == activity_id))
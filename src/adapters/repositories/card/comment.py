@@ -0,0 +1,59 @@
+from typing import List, Optional
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import selectinload
+
+from src.adapters.cache.board import board_cache
+from src.adapters.repositories.base import SQLAlchemyRepo
+from src.adapters.repositories.common.card import CommentSaver, CommentReader
+from src.adapters.schemas.pagination import Cursor
+from src.adapters.sqlalchemy.models import List as ListModel
+from src.adapters.sqlalchemy.models.card import Card, Comment
+
+
+class CommentRepository(SQLAlchemyRepo, CommentSaver, CommentReader):
+    def save_comment(self, comment: Comment) -> None:
+        self._session.add(comment)
+        self._session.commit()
+        self._session.refresh(comment)
+        self._invalidate_card(comment.card_id)
+
+    def update_comment(self, comment: Comment, comment_data: dict) -> Comment:
+        for key, value in comment_data.items():
+            setattr(comment, key, value)
+        self._session.commit()
+        self._session.refresh(comment)
+        return comment
+
+    def delete_comment(self, comment: Comment) -> None:
+        card_id = comment.card_id
+        self._session.delete(comment)
+        self._session.commit()
+        self._invalidate_card(card_id)
+
+    def _invalidate_card(self, card_id: int) -> None:
+        """The comments_count trigger changes the card row, so cached cards of its board are stale."""
+        if not board_cache.enabled:
+            return
+        board_cache.invalidate(self._session.scalar(
+            select(ListModel.board_id).join(Card, Card.list_id == ListModel.id).where(Card.id == card_id)
+        ))
+
+    def get_comments(self, card_id: int, limit: int = 50, after: Optional[Cursor] = None) -> List[Comment]:
+        # Oldest first. The (card_id, created_at, id) index serves both the filter and the order,
+        # so a page reads only `limit` index entries however long the thread is.
+        query = select(Comment).where(Comment.card_id == card_id)
+        if after is not None:
+            query = query.where(tuple_(Comment.created_at, Comment.id) > after)
+        query = (
+            query.order_by(Comment.created_at, Comment.id)
+            .limit(limit)
+            # Автори всієї сторінки одним запитом IN (...).
+            .options(selectinload(Comment.author))
+        )
+        return list(self._session.scalars(query))
+
+    def get_comment(self, card_id: int, comment_id: int) -> Optional[Comment]:
+        return self._session.scalar(
+            select(Comment).where(Comment.card_id == card_id, Comment.id == comment_id).options(selectinload(Comment.author))
+        )
@@ -1,7 +1,10 @@
 from abc import abstractmethod
-from typing import Protocol, List, Optional
+from typing import Protocol, List, Optional, Iterator, Tuple, Dict, Any, Iterable, Sequence, Set
 
-from src.adapters.sqlalchemy.models import Board
+from sqlalchemy import Row
+
+from src.adapters.schemas.pagination import Cursor
+from src.adapters.sqlalchemy.models import Board, List as ListModel, ImportJob
 
 
 class BoardSaver(Protocol):
@@ -37,9 +40,112 @@ class BoardReader(Protocol):
         """Отримує дошку за її ID."""
         raise NotImplementedError
 
+    @abstractmethod
+    def is_member(self, board_id: int, user_id: int) -> bool:
+        """Перевіряє, чи є користувач учасником дошки."""
+        raise NotImplementedError
+
+
+class BoardSummaryReader(Protocol):
+    @abstractmethod
+    def get_board_summary(self, board_id: int, user_id: int) -> Optional[Row]:
+        """Отримує дошку з кількістю списків і учасників та ознакою членства користувача."""
+        raise NotImplementedError
+
+
+class BoardSnapshotReader(Protocol):
+    @abstractmethod
+    def get_board_lists_with_cards(self, board_id: int) -> List[ListModel]:
+        """Отримує списки дошки разом з їх картками та виконавцями карток."""
+        raise NotImplementedError
+
 
 class BoardsReader(Protocol):
     @abstractmethod
-    def get_list_of_public_boards(self, skip: int = 0, limit: int = 10) -> List[Board]:  # /boards/public
+    def get_list_of_public_boards(
+            self, skip: int = 0, limit: int = 10, after: Optional[Cursor] = None
+    ) -> List[Board]:  # /boards/public
+        """Отримує список всіх публічних дошок."""
+        raise NotImplementedError
+
+
+class AsyncBoardReader(Protocol):
+    @abstractmethod
+    async def get_board_by_id(self, board_id: int) -> Optional[Board]:
+        """Отримує дошку за її ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def is_member(self, board_id: int, user_id: int) -> bool:
+        """Перевіряє, чи є користувач учасником дошки."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_board_summary(self, board_id: int, user_id: int) -> Optional[Row]:
+        """Отримує дошку з кількістю списків і учасників та ознакою членства користувача."""
+        raise NotImplementedError
+
+
+class AsyncBoardsReader(Protocol):
+    @abstractmethod
+    async def get_list_of_public_boards(
+            self, skip: int = 0, limit: int = 10, after: Optional[Cursor] = None
+    ) -> List[Board]:
         """Отримує список всіх публічних дошок."""
         raise NotImplementedError
+
+
+class BoardExporter(Protocol):
+    @abstractmethod
+    def iter_export_records(
+            self, board_ids: Optional[List[int]] = None, owner_id: Optional[int] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Потоково віддає рядки дошок та всіх їх даних як пари (тип запису, значення колонок)."""
+        raise NotImplementedError
+
+
+class BoardImporter(Protocol):
+    @abstractmethod
+    def create_job(self, source_path: str, fallback_user_id: int) -> ImportJob:
+        """Створює задачу імпорту для файлу експорту."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_job(self, job_id: int) -> Optional[ImportJob]:
+        """Отримує задачу імпорту за її ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_job(self, job: ImportJob) -> None:
+        """Зберігає задачу імпорту разом з усіма рядками, завантаженими з останнього збереження."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def allocate_ids(self, table_name: str, count: int) -> List[int]:
+        """Резервує нові ID з послідовності таблиці."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_new_ids(self, job_id: int, record_type: str, old_ids: Iterable[int]) -> Dict[int, int]:
+        """Отримує нові ID вже імпортованих записів за їх ID з файлу експорту."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_existing_user_ids(self, user_ids: Iterable[int]) -> Set[int]:
+        """Повертає ті з ID користувачів, які існують у базі даних."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def copy_rows(self, table_name: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> None:
+        """Завантажує рядки в таблицю через COPY FROM STDIN."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_id_map(self, job_id: int, record_type: str, pairs: Iterable[Tuple[int, int]]) -> None:
+        """Зберігає відповідність старих і нових ID імпортованих записів."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_board_ids(self, list_ids: Iterable[int] = (), card_ids: Iterable[int] = ()) -> Set[int]:
+        """Повертає ID дошок, яким належать списки та картки."""
+        raise NotImplementedError
@@ -1,6 +1,7 @@
 from abc import abstractmethod
-from typing import Protocol, List, Optional
+from typing import Protocol, List, Optional, Dict, Iterable
 
+from src.adapters.schemas.pagination import Cursor
 from src.adapters.sqlalchemy.models import Card, Comment, CardAttachment, CheckList, CardActivity
 
 
@@ -22,9 +23,29 @@ class CardSaver(Protocol):
         raise NotImplementedError
 
 
+class CardBatchSaver(Protocol):
+    @abstractmethod
+    def create_cards(self, cards_data: List[dict]) -> List[Card]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_cards(self, cards_data: List[dict]) -> List[Card]:
+        raise NotImplementedError
+
+
+class CardPositioner(Protocol):
+    @abstractmethod
+    def move_card(self, card: Card, list_id: int, index: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_next_positions(self, list_ids: Iterable[int]) -> Dict[int, int]:
+        raise NotImplementedError
+
+
 class CardReader(Protocol):
     @abstractmethod
-    def get_cards(self, list_id: int) -> List[Card]:
+    def get_cards(self, list_id: int, board_id: Optional[int] = None) -> List[Card]:
         raise NotImplementedError
 
     @abstractmethod
@@ -32,27 +53,37 @@ class CardReader(Protocol):
         raise NotImplementedError
 
 
+class AsyncCardReader(Protocol):
+    @abstractmethod
+    async def get_cards(self, list_id: int) -> List[Card]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_card(self, list_id: int, card_id: int) -> Optional[Card]:
+        raise NotImplementedError
+
+
 class CommentSaver(Protocol):
     @abstractmethod
     def save_comment(self, comment: Comment) -> None:
         raise NotImplementedError
 
     @abstractmethod
-    def update_comment(self, comment_id: int, comment_data: dict) -> Optional[Comment]:
+    def update_comment(self, comment: Comment, comment_data: dict) -> Comment:
         raise NotImplementedError
 
     @abstractmethod
-    def delete_comment(self, comment_id: int) -> None:
+    def delete_comment(self, comment: Comment) -> None:
         raise NotImplementedError
 
 
 class CommentReader(Protocol):
     @abstractmethod
-    def get_comments(self, card_id: int) -> List[Comment]:
+    def get_comments(self, card_id: int, limit: int = 50, after: Optional[Cursor] = None) -> List[Comment]:
         raise NotImplementedError
 
     @abstractmethod
-    def get_comment(self, comment_id: int) -> Optional[Comment]:
+    def get_comment(self, card_id: int, comment_id: int) -> Optional[Comment]:
         raise NotImplementedError
 
 
@@ -105,10 +136,16 @@ class CardActivitySaver(Protocol):
     def save_card_activity(self, activity: CardActivity) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def save_card_activities(self, activities: List[dict]) -> None:
+        raise NotImplementedError
+
 
 class CardActivityReader(Protocol):
     @abstractmethod
-    def get_card_activities(self, card_id: int) -> List[CardActivity]:
+    def get_card_activities(
+            self, card_id: int, limit: int = 50, before: Optional[Cursor] = None
+    ) -> List[CardActivity]:
         raise NotImplementedError
 
     @abstractmethod
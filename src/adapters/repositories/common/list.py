@@ -26,6 +26,18 @@ class ListSaver(Protocol):
         raise NotImplementedError
 
 
+class ListPositioner(Protocol):
+    @abstractmethod
+    def move_list(self, board_id: int, list: ListModel, index: int) -> None:
+        """Переміщує список на вказане місце (з 1), оновлюючи позицію лише цього списку."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_next_position(self, board_id: int) -> int:
+        """Повертає позицію для нового списку в кінці дошки."""
+        raise NotImplementedError
+
+
 class ListReader(Protocol):
     @abstractmethod
     def get_lists_by_board(self, board_id: int) -> ListType[ListModel]:
@@ -36,3 +48,20 @@ class ListReader(Protocol):
     def get_list_by_id(self, board_id: int, list_id: int) -> Optional[ListModel]:
         """Отримує конкретний список дошки за ID дошки та ID списку."""
         raise NotImplementedError
+
+    @abstractmethod
+    def get_list_index(self, list: ListModel) -> int:
+        """Повертає місце списку на дошці (з 1)."""
+        raise NotImplementedError
+
+
+class AsyncListReader(Protocol):
+    @abstractmethod
+    async def get_lists_by_board(self, board_id: int) -> ListType[ListModel]:
+        """Отримує всі списки для дошки за її ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_list_by_id(self, board_id: int, list_id: int) -> Optional[ListModel]:
+        """Отримує конкретний список дошки за ID дошки та ID списку."""
+        raise NotImplementedError
@@ -0,0 +1,23 @@
+from abc import abstractmethod
+from typing import Protocol, List, Dict, Any
+
+from src.adapters.sqlalchemy.models import OutboxMessage
+
+
+class OutboxWriter(Protocol):
+    @abstractmethod
+    def add_message(self, task: str, payload: Dict[str, Any]) -> None:
+        """Додає задачу до outbox у поточній транзакції, без коміту."""
+        raise NotImplementedError
+
+
+class OutboxRelayReader(Protocol):
+    @abstractmethod
+    def claim_batch(self, limit: int) -> List[OutboxMessage]:
+        """Блокує найстаріші неопубліковані повідомлення, пропускаючи заблоковані іншими реле."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_messages(self, messages: List[OutboxMessage]) -> None:
+        """Видаляє опубліковані повідомлення та комітить транзакцію."""
+        raise NotImplementedError
@@ -1,6 +1,7 @@
 from abc import abstractmethod
-from typing import Protocol, List
+from typing import Protocol, List, Optional
 
+from src.adapters.schemas.pagination import Cursor
 from src.adapters.sqlalchemy.models.user import User
 
 
@@ -22,9 +23,33 @@ class UserReader(Protocol):
 
 class UsersReader(Protocol):
     @abstractmethod
-    def get_users_list(self, skip: int, limit: int) -> List[User]:
+    def get_users_list(self, skip: int, limit: int, after: Optional[Cursor] = None) -> List[User]:
         raise NotImplementedError
 
     @abstractmethod
     def get_users_count(self) -> int:
         raise NotImplementedError
+
+    @abstractmethod
+    def get_users_estimated_count(self) -> int:
+        raise NotImplementedError
+
+
+class AsyncUserReader(Protocol):
+    @abstractmethod
+    async def get_user_by_id(self, user_id: int) -> User:
+        raise NotImplementedError
+
+
+class AsyncUsersReader(Protocol):
+    @abstractmethod
+    async def get_users_list(self, skip: int, limit: int, after: Optional[Cursor] = None) -> List[User]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_users_count(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_users_estimated_count(self) -> int:
+        raise NotImplementedError
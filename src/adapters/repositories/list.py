@@ -1,18 +1,24 @@
 from typing import Dict, Optional, List as ListType
 
-from src.adapters.repositories.base import SQLAlchemyRepo
-from src.adapters.repositories.common.list import ListSaver, ListReader
-from src.adapters.sqlalchemy.models import List as ListModel
+from sqlalchemy import select, func, tuple_
 
+from src.adapters.cache.board import board_cache
+from src.adapters.repositories.base import SQLAlchemyRepo, AsyncSQLAlchemyRepo
+from src.adapters.repositories.common.list import ListSaver, ListReader, AsyncListReader, ListPositioner
+from src.adapters.repositories.positioning import rank_between, neighbour_positions, rebalance_positions
+from src.adapters.sqlalchemy.models import List as ListModel, Board
 
-class ListRepository(SQLAlchemyRepo, ListSaver, ListReader):
+
+class ListRepository(SQLAlchemyRepo, ListSaver, ListReader, ListPositioner):
     def save_list(self, list: ListModel) -> None:
         self._session.add(list)
         self._session.commit()
+        board_cache.invalidate(list.board_id)
         self._session.refresh(list)
 
     def save_all_lists(self, lists: ListType[ListModel]) -> None:
         self._session.commit()
+        board_cache.invalidate(*(lst.board_id for lst in lists))
 
     def update_list(self, board_id: int, list_id: int, list_data: Dict) -> Optional[ListModel]:
         list = self.get_list_by_id(board_id=board_id, list_id=list_id)
@@ -20,6 +26,7 @@ class ListRepository(SQLAlchemyRepo, ListSaver, ListReader):
             for key, value in list_data.items():
                 setattr(list, key, value)
             self._session.commit()
+            board_cache.invalidate(board_id)
             self._session.refresh(list)
         return list
 
@@ -28,25 +35,64 @@ class ListRepository(SQLAlchemyRepo, ListSaver, ListReader):
         if list_to_delete:
             self._session.delete(list_to_delete)
             self._session.commit()
+            board_cache.invalidate(board_id)
+
+    def move_list(self, board_id: int, list: ListModel, index: int) -> None:
+        # Блокування рядка дошки серіалізує конкурентні переміщення в межах однієї дошки.
+        self._lock_board(board_id)
+
+        args = (self._session, ListModel, ListModel.board_id, board_id, list.id, index)
+        position = rank_between(*neighbour_positions(*args))
+        if position is None:
+            rebalance_positions(self._session, ListModel, ListModel.board_id, board_id)
+            position = rank_between(*neighbour_positions(*args))
+
+        list.position = position
+        self._session.commit()
+        board_cache.invalidate(board_id)
+        self._session.refresh(list)
+
+    def get_next_position(self, board_id: int) -> int:
+        max_position = self._session.scalar(
+            select(func.max(ListModel.position)).where(ListModel.board_id == board_id)
+        )
+        return rank_between(max_position, None)
+
+    def _lock_board(self, board_id: int) -> None:
+        self._session.execute(select(Board.id).where(Board.id == board_id).with_for_update())
 
     def get_lists_by_board(self, board_id: int) -> ListType[ListModel]:
-        return self._session.query(ListModel).filter(ListModel.board_id == board_id).order_by(ListModel.position).all()
+        return board_cache.read_through(
+            self._session, board_id, "lists", ListModel,
+            loader=lambda: (
+                self._session.query(ListModel)
+                .filter(ListModel.board_id == board_id)
+                .order_by(ListModel.position, ListModel.id)
+                .all()
+            ),
+        )
 
     def get_list_by_id(self, board_id: int, list_id: int) -> Optional[ListModel]:
         return self._session.query(ListModel).filter(ListModel.board_id == board_id, ListModel.id == list_id).first()
 
-    def get_max_position(self, board_id: int) -> Optional[int]:
-        return (
-            self._session.query(ListModel.position)
-            .filter(ListModel.board_id == board_id)
-            .order_by(ListModel.position.desc())
-            .first()
+    def get_list_index(self, list: ListModel) -> int:
+        return self._session.scalar(
+            select(func.count()).where(
+                ListModel.board_id == list.board_id,
+                tuple_(ListModel.position, ListModel.id) <= (list.position, list.id),
+            )
+        )
+
+
+class AsyncListRepository(AsyncSQLAlchemyRepo, AsyncListReader):
+    async def get_lists_by_board(self, board_id: int) -> ListType[ListModel]:
+        result = await self._session.execute(
+            select(ListModel).where(ListModel.board_id == board_id).order_by(ListModel.position, ListModel.id)
         )
+        return list(result.scalars().all())
 
-    def get_lists_above_position(self, board_id: int, position: int) -> ListType[ListModel]:
-        return (
-            self._session.query(ListModel)
-            .filter(ListModel.board_id == board_id, ListModel.position > position)
-            .order_by(ListModel.position)
-            .all()
+    async def get_list_by_id(self, board_id: int, list_id: int) -> Optional[ListModel]:
+        result = await self._session.execute(
+            select(ListModel).where(ListModel.board_id == board_id, ListModel.id == list_id)
         )
+        return result.scalars().first()
@@ -0,0 +1,27 @@
+from typing import Any, Dict, List
+
+from sqlalchemy import select, delete
+
+from src.adapters.repositories.base import SQLAlchemyRepo
+from src.adapters.repositories.common.outbox import OutboxWriter, OutboxRelayReader
+from src.adapters.sqlalchemy.models import OutboxMessage
+
+
+class OutboxRepository(SQLAlchemyRepo, OutboxWriter, OutboxRelayReader):
+    def add_message(self, task: str, payload: Dict[str, Any]) -> None:
+        # Коміт робить репозиторій, що зберігає саму зміну: обидва рядки в одній транзакції.
+        self._session.add(OutboxMessage(task=task, payload=payload))
+
+    def claim_batch(self, limit: int) -> List[OutboxMessage]:
+        return list(self._session.scalars(
+            select(OutboxMessage)
+            .order_by(OutboxMessage.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        ))
+
+    def delete_messages(self, messages: List[OutboxMessage]) -> None:
+        self._session.execute(
+            delete(OutboxMessage).where(OutboxMessage.id.in_([message.id for message in messages]))
+        )
+        self._session.commit()
@@ -0,0 +1,69 @@
+"""
+Розріджені позиції для впорядкованих сутностей (списки дошки, картки списку).
+
+Позиції зберігаються з кроком ``POSITION_GAP``, тож переміщення записує один рядок:
+нова позиція береться посередині між сусідами. Коли між сусідами не лишається місця,
+позиції в межах батьківської сутності перенумеровуються одним UPDATE.
+"""
+from typing import Optional, Tuple
+
+from sqlalchemy import select, update, func
+from sqlalchemy.orm import Session
+
+POSITION_GAP = 1024
+
+
+def rank_between(before: Optional[int], after: Optional[int]) -> Optional[int]:
+    """Позиція між двома сусідами або None, якщо між ними немає вільного місця."""
+    if after is None:
+        return (before or 0) + POSITION_GAP
+
+    lower = before if before is not None else 0
+    if after - lower < 2:
+        return None
+    return (lower + after) // 2
+
+
+def neighbour_positions(
+        session: Session, model, scope_column, scope_id: int, item_id: int, index: int
+) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Позиції сусідів, між якими опиниться елемент, якщо поставити його на місце ``index`` (з 1),
+    не враховуючи сам елемент.
+    """
+    offset = max(index - 2, 0)
+    positions = list(
+        session.scalars(
+            select(model.position)
+            .where(scope_column == scope_id, model.id != item_id)
+            .order_by(model.position, model.id)
+            .offset(offset)
+            .limit(2 if index > 1 else 1)
+        )
+    )
+
+    if index <= 1:
+        return None, positions[0] if positions else None
+    if not positions:
+        # Місце за межами списку - елемент стає останнім.
+        return session.scalar(
+            select(func.max(model.position)).where(scope_column == scope_id, model.id != item_id)
+        ), None
+    before = positions[0]
+    after = positions[1] if len(positions) > 1 else None
+    return before, after
+
+
+def rebalance_positions(session: Session, model, scope_column, scope_id: int) -> None:
+    """Рівномірно перерозподіляє позиції елементів в межах батьківської сутності."""
+    ranked = (
+        select(model.id, func.row_number().over(order_by=(model.position, model.id)).label("rn"))
+        .where(scope_column == scope_id)
+        .subquery()
+    )
+    session.execute(
+        update(model)
+        .where(model.id == ranked.c.id)
+        .values(position=ranked.c.rn * POSITION_GAP)
+        .execution_options(synchronize_session=False)
+    )
@@ -1,9 +1,14 @@
-from typing import List
+from typing import List, Optional
 
+from sqlalchemy import select, func, tuple_
 from sqlalchemy.exc import IntegrityError
 
-from src.adapters.repositories.base import SQLAlchemyRepo
-from src.adapters.repositories.common.user import UserReader, UsersReader, UserSaver
+from src.adapters.cache.principal import principal_cache
+from src.adapters.repositories.base import SQLAlchemyRepo, AsyncSQLAlchemyRepo
+from src.adapters.schemas.pagination import Cursor
+from src.adapters.repositories.common.user import (
+    UserReader, UsersReader, UserSaver, AsyncUserReader, AsyncUsersReader
+)
 from src.adapters.sqlalchemy.models.user import User
 
 
@@ -22,6 +27,8 @@ class UserRepository(SQLAlchemyRepo, UserReader, UsersReader, UserSaver):
             self._session.refresh(user)
         except IntegrityError as err:
             self._session.rollback()
+        finally:
+            principal_cache.invalidate(user_id)
 
         return user
 
@@ -34,8 +41,38 @@ class UserRepository(SQLAlchemyRepo, UserReader, UsersReader, UserSaver):
     def get_user_by_email(self, email: str) -> User:
         return self._session.query(User).filter(User.email == email).first()
 
-    def get_users_list(self, skip: int, limit: int) -> List[User]:
-        return self._session.query(User).offset(skip).limit(limit).all()
+    def get_users_list(self, skip: int, limit: int, after: Optional[Cursor] = None) -> List[User]:
+        query = self._session.query(User).order_by(User.created_at, User.id)
+        if after is not None:
+            query = query.filter(tuple_(User.created_at, User.id) > after)
+        else:
+            # Курсор уже задає позицію сторінки, тож skip разом з ним не застосовуємо.
+            query = query.offset(skip)
+        return query.limit(limit).all()
 
     def get_users_count(self) -> int:
         return self._session.query(User).count()
+
+    def get_users_estimated_count(self) -> int:
+        return self._estimated_count('"user"')
+
+
+class AsyncUserRepository(AsyncSQLAlchemyRepo, AsyncUserReader, AsyncUsersReader):
+    async def get_user_by_id(self, id: int) -> User:
+        result = await self._session.execute(select(User).where(User.id == id))
+        return result.scalars().first()
+
+    async def get_users_list(self, skip: int, limit: int, after: Optional[Cursor] = None) -> List[User]:
+        query = select(User).order_by(User.created_at, User.id)
+        if after is not None:
+            query = query.where(tuple_(User.created_at, User.id) > after)
+        else:
+            query = query.offset(skip)
+        result = await self._session.execute(query.limit(limit))
+        return list(result.scalars().all())
+
+    async def get_users_count(self) -> int:
+        return await self._session.scalar(select(func.count(User.id)))
+
+    async def get_users_estimated_count(self) -> int:
+        return await self._estimated_count('"user"')
@@ -1,9 +1,10 @@
 from datetime import datetime
 
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, List
 
 from src.adapters.schemas.user import UserExtendedData
+from src.adapters.sqlalchemy.models.board_import import ImportStatus
 
 
 class BoardCreate(BaseModel):
@@ -34,7 +35,48 @@ class BoardExternalResponse(BaseModel):
     members: int
 
 
+class SnapshotCard(BaseModel):
+    id: int
+    title: str
+    description: Optional[str] = None
+    priority: Optional[str] = None
+    responsible_person_id: int
+    position: int
+    due_date: Optional[datetime] = None
+    reminder_datetime: Optional[datetime] = None
+    performer_ids: List[int]
+    comments_count: int
+    checklists_count: int
+    attachments_count: int
+
+
+class SnapshotList(BaseModel):
+    id: int
+    name: str
+    position: int
+    cards: List[SnapshotCard]
+
+
+class BoardSnapshotResponse(BaseModel):
+    board_detail: BoardResponse
+    lists: List[SnapshotList]
+
+
 class BoardMember(BaseModel):
     board_id: int
     member_id: int
     member_data: UserExtendedData
+
+
+class ImportJobResponse(BaseModel):
+    id: int
+    status: ImportStatus
+    processed_lines: int
+    imported_rows: int
+    skipped_rows: int
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
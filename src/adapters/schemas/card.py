@@ -1,5 +1,5 @@
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 
 from src.adapters.schemas.user import UserShortResponse
@@ -18,6 +18,27 @@ class CardUpdate(CardCreate):
     list_id: Optional[int] = None
 
 
+class CardMove(BaseModel):
+    list_id: int
+    position: int = Field(ge=1)
+
+
+class CardBatchCreateItem(CardCreate):
+    list_id: int
+
+
+class CardBatchCreate(BaseModel):
+    cards: List[CardBatchCreateItem] = Field(min_length=1, max_length=1000)
+
+
+class CardBatchUpdateItem(CardUpdate):
+    id: int
+
+
+class CardBatchUpdate(BaseModel):
+    cards: List[CardBatchUpdateItem] = Field(min_length=1, max_length=1000)
+
+
 class CardResponse(BaseModel):
     id: int
     title: str
@@ -25,6 +46,7 @@ class CardResponse(BaseModel):
     priority: str
     responsible_person_id: int
     list_id: int
+    position: int
     due_date: Optional[datetime] = None
     reminder_datetime: Optional[datetime] = None
     created_at: datetime
@@ -41,3 +63,16 @@ class CardExternalResponse(BaseModel):
     comments_count: int
     attachments_count: int
     checklists_count: int
+
+
+class CardActivityResponse(BaseModel):
+    id: int
+    card_id: int
+    action_type: str
+    description: str
+    performed_by_id: int
+    performed_at: Optional[datetime] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
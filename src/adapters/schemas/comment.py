@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class CommentCreate(BaseModel):
+    content: str = Field(min_length=1, max_length=10000)
+
+
+class CommentUpdate(CommentCreate):
+    pass
+
+
+class CommentAuthorResponse(BaseModel):
+    id: int
+    username: str
+
+    class Config:
+        from_attributes = True
+
+
+class CommentResponse(BaseModel):
+    id: int
+    card_id: int
+    content: str
+    author_id: int
+    author: Optional[CommentAuthorResponse] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
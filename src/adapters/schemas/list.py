@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
 
 
@@ -10,7 +10,7 @@ class ListCreate(BaseModel):
 
 class ListUpdate(BaseModel):
     name: Optional[str] = None
-    position: Optional[int] = None
+    position: Optional[int] = Field(None, ge=1)
 
 
 class ListNameUpdate(BaseModel):
@@ -24,6 +24,7 @@ class ListPositionUpdate(BaseModel):
 class ListResponse(BaseModel):
     id: int
     name: str
+    # Місце списку на дошці (з 1), як і в ListUpdate; розріджений ранг у базі назовні не віддаємо.
     position: int
     board_id: int
     created_at: datetime
@@ -1,6 +1,18 @@
+import base64
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Optional, Tuple, Sequence
+
 from pydantic import BaseModel
 from fastapi import Query
 
+# Position of a row in a (created_at, id) ordering.
+Cursor = Tuple[datetime, int]
+
+# List endpoints that return a bare JSON array report the next page cursor in this header.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 class Pagination(BaseModel):
     skip: int = Query(0, ge=0)
@@ -8,4 +20,33 @@ class Pagination(BaseModel):
 
 
 class PaginationResponse(Pagination):
-    total: int
+    total: Optional[int] = None
+    total_is_approximate: bool = False
+    next_cursor: Optional[str] = None
+
+
+class CountMode(str, Enum):
+    exact = "exact"
+    approximate = "approximate"
+    none = "none"
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), id]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """Raises ValueError if the cursor was not produced by ``encode_cursor``."""
+    try:
+        created_at, id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), int(id)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def next_cursor(items: Sequence, limit: int) -> Optional[str]:
+    """Cursor after the last item of a full page; a short page is the last one."""
+    if not items or len(items) < limit:
+        return None
+    return encode_cursor(items[-1].created_at, items[-1].id)
@@ -0,0 +1,133 @@
+import threading
+import time
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool, Pool
+
+WAIT_TIME_BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000, 30000)
+CONNECTION_COUNT_BUCKETS = (0, 1, 2, 5, 10, 15, 20, 30, 50, 75, 100)
+
+
+class Histogram:
+    """Thread-safe histogram with fixed upper bounds, reported cumulatively."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = list(self._counts)
+            total_sum = self._sum
+
+        cumulative = list(accumulate(counts))
+        buckets = {f"{bound:g}": count for bound, count in zip(self.buckets, cumulative)}
+        buckets["+Inf"] = cumulative[-1]
+        return {"count": cumulative[-1], "sum": total_sum, "buckets": buckets}
+
+
+class PoolMetrics:
+    def __init__(self) -> None:
+        self.wait_time_ms = Histogram(WAIT_TIME_BUCKETS_MS)
+        self.checked_out = Histogram(CONNECTION_COUNT_BUCKETS)
+        self.overflow = Histogram(CONNECTION_COUNT_BUCKETS)
+        self._counters = {"connects": 0, "checkouts": 0, "checkins": 0, "invalidations": 0, "timeouts": 0}
+        self._lock = threading.Lock()
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+        return {
+            **counters,
+            "wait_time_ms": self.wait_time_ms.snapshot(),
+            "checked_out": self.checked_out.snapshot(),
+            "overflow": self.overflow.snapshot(),
+        }
+
+
+class _InstrumentedPoolMixin:
+    """
+    Times how long a caller waits for a connection and samples pool occupancy on every checkout.
+
+    SQLAlchemy has no "checkout requested" event, so the wait is measured around ``_do_get``;
+    everything else is collected from the regular pool events (see ``instrument_pool``).
+    """
+
+    _metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            if self._metrics:
+                self._metrics.incr("timeouts")
+            raise
+        finally:
+            if self._metrics:
+                self._metrics.wait_time_ms.observe((time.perf_counter() - start) * 1000)
+
+        if self._metrics:
+            self._metrics.checked_out.observe(self.checkedout())
+            self._metrics.overflow.observe(max(self.overflow(), 0))
+        return connection
+
+    def recreate(self):
+        # engine.dispose() replaces the pool; keep collecting into the same metrics.
+        pool = super().recreate()
+        pool._metrics = self._metrics
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument_pool(pool: Pool) -> PoolMetrics:
+    metrics = PoolMetrics()
+    pool._metrics = metrics
+
+    # Listeners are attached to the pool's dispatch, which survives pool.recreate().
+    event.listen(pool, "connect", lambda *args: metrics.incr("connects"))
+    event.listen(pool, "checkout", lambda *args: metrics.incr("checkouts"))
+    event.listen(pool, "checkin", lambda *args: metrics.incr("checkins"))
+    event.listen(pool, "invalidate", lambda *args: metrics.incr("invalidations"))
+
+    return metrics
+
+
+def pool_status(pool: Pool) -> Dict[str, Any]:
+    report: Dict[str, Any] = {"class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        report.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            timeout=pool.timeout(),
+        )
+
+    metrics = getattr(pool, "_metrics", None)
+    if metrics:
+        report["metrics"] = metrics.snapshot()
+    return report
@@ -1,7 +1,36 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 
+from src.adapters.sqlalchemy.db.pool_metrics import (
+    InstrumentedQueuePool, InstrumentedAsyncAdaptedQueuePool, instrument_pool
+)
 from src.main.config import settings
 
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URL, pool_pre_ping=True)
+POOL_OPTIONS = dict(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_use_lifo=settings.DB_POOL_USE_LIFO,
+)
+
+engine = create_engine(
+    settings.SQLALCHEMY_DATABASE_URL, poolclass=InstrumentedQueuePool, **POOL_OPTIONS
+)
+instrument_pool(engine.pool)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+ASYNC_DATABASE_URL = settings.SQLALCHEMY_ASYNC_DATABASE_URL or make_url(
+    str(settings.SQLALCHEMY_DATABASE_URL)
+).set(drivername="postgresql+asyncpg")
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL, poolclass=InstrumentedAsyncAdaptedQueuePool, **POOL_OPTIONS
+)
+instrument_pool(async_engine.sync_engine.pool)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
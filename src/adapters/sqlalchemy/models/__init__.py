@@ -2,3 +2,5 @@ from .user import User
 from .board import Board
 from .list import List
 from .card import Card, Comment, CardAttachment, CheckList,CardActivity
+from .board_import import ImportJob
+from .outbox import OutboxMessage
@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Boolean, Table
+from sqlalchemy import Column, DateTime, Integer, String, ForeignKey, Boolean, Table, Index
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
 from src.adapters.sqlalchemy.db.base_class import Base
 from src.adapters.sqlalchemy.models.base import TimestampedModel
@@ -7,16 +8,31 @@ from src.adapters.sqlalchemy.models.base import TimestampedModel
 board_members_association = Table(
     'board_members_association', Base.metadata,
     Column('board_id', Integer, ForeignKey('board.id')),
-    Column('user_id', Integer, ForeignKey('user.id'))
+    Column('user_id', Integer, ForeignKey('user.id')),
+    Index('ix_board_members_association_board_id_user_id', 'board_id', 'user_id'),
 )
 
 
 class Board(Base, TimestampedModel):
+    __table_args__ = (
+        # Keyset pagination order for board listings.
+        Index('ix_board_created_at_id', 'created_at', 'id'),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
+    # Ключ keyset-пагінації: NULL випав би з порівняння (created_at, id) > курсор.
+    created_at = Column(DateTime(timezone=True), nullable=False, default=func.now(), server_default=func.now())
     name = Column(String, nullable=False, index=True)
-    is_public = Column(Boolean, default=True)
-    owner_id = Column(Integer, ForeignKey('user.id'), nullable=False)
+    is_public = Column(Boolean, default=True, index=True)
+    owner_id = Column(Integer, ForeignKey('user.id'), nullable=False, index=True)
+
+    # Лічильники підтримуються тригерами бази даних (див. міграцію counter_columns).
+    lists_count = Column(Integer, nullable=False, default=0, server_default='0')
+    # Власник рахується учасником дошки.
+    members_count = Column(Integer, nullable=False, default=1, server_default='1')
+    # Зростає при кожній зміні дошки, її списків чи карток (тригери міграції board_version); основа ETag.
+    version = Column(Integer, nullable=False, default=1, server_default='1')
 
-    owner = relationship("User", back_populates="boards")
+    owner = relationship("User", back_populates="boards_owner")
     lists = relationship("List", back_populates="board", cascade="all, delete-orphan")
     members = relationship("User", secondary=board_members_association, back_populates="boards")
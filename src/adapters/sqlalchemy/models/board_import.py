@@ -0,0 +1,38 @@
+from enum import Enum as PyEnum
+
+from sqlalchemy import Column, Integer, BigInteger, String, Enum, ForeignKey, Table
+
+from src.adapters.sqlalchemy.db.base_class import Base
+from src.adapters.sqlalchemy.models.base import TimestampedModel
+
+
+class ImportStatus(PyEnum):
+    pending = "Pending"
+    running = "Running"
+    completed = "Completed"
+    failed = "Failed"
+
+
+class ImportJob(Base, TimestampedModel):
+    id = Column(Integer, primary_key=True, index=True)
+    status = Column(Enum(ImportStatus), nullable=False, default=ImportStatus.pending)
+    # NDJSON (or gzipped NDJSON) file in the export format, see src/application/board/board_export.py.
+    source_path = Column(String, nullable=False)
+    # Власник/автор для записів, чиї користувачі не існують у цій базі.
+    fallback_user_id = Column(Integer, ForeignKey('user.id'), nullable=False)
+
+    # Рядки файлу, вже завантажені й закомічені; повторний запуск продовжує з наступного.
+    processed_lines = Column(BigInteger, nullable=False, default=0, server_default='0')
+    imported_rows = Column(BigInteger, nullable=False, default=0, server_default='0')
+    skipped_rows = Column(BigInteger, nullable=False, default=0, server_default='0')
+    error = Column(String, nullable=True)
+
+
+# Old (exported) id -> new id of every row an import job has loaded, per record type.
+import_id_map = Table(
+    'import_id_map', Base.metadata,
+    Column('job_id', ForeignKey('importjob.id', ondelete='CASCADE'), primary_key=True),
+    Column('record_type', String, primary_key=True),
+    Column('old_id', BigInteger, primary_key=True),
+    Column('new_id', Integer, nullable=False),
+)
@@ -1,7 +1,8 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
-from sqlalchemy import Column, Integer, String, Enum, ForeignKey, DateTime, Table, Boolean
+from sqlalchemy import Column, Integer, BigInteger, String, Enum, ForeignKey, DateTime, Table, Boolean, Index
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from enum import Enum as PyEnum
 
 from src.adapters.sqlalchemy.db.base_class import Base
@@ -22,16 +23,28 @@ class Priority(PyEnum):
 
 
 class Card(Base, TimestampedModel):
+    __table_args__ = (
+        # Також обслуговує пошук карток лише за list_id.
+        Index('ix_card_list_id_position', 'list_id', 'position'),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     description = Column(String, nullable=True)
     priority = Column(Enum(Priority), default=Priority.medium)
     responsible_person_id = Column(Integer, ForeignKey('user.id'), nullable=False)
     list_id = Column(Integer, ForeignKey('list.id'), nullable=False)
+    position = Column(BigInteger, nullable=False, default=0)
 
     due_date = Column(DateTime, nullable=True)
     reminder_datetime = Column(DateTime, nullable=True)
 
+    # Лічильники підтримуються тригерами бази даних (див. міграцію counter_columns).
+    comments_count = Column(Integer, nullable=False, default=0, server_default='0')
+    attachments_count = Column(Integer, nullable=False, default=0, server_default='0')
+    checklists_count = Column(Integer, nullable=False, default=0, server_default='0')
+    performers_count = Column(Integer, nullable=False, default=0, server_default='0')
+
     list = relationship("List", back_populates="cards")
     responsible = relationship('User', back_populates='cards_responsible')
     performers = relationship('User', secondary=task_performers_association, back_populates="perform_cards")
@@ -41,8 +54,31 @@ class Card(Base, TimestampedModel):
     activities = relationship("CardActivity", back_populates="card", cascade="all, delete-orphan")
 
 
+# Таблиці comment і cardactivity партиціоновані за місяцями created_at (див. міграцію
+# partition_comments_and_activity і src/scripts/partitions.py), тож created_at входить у первинний ключ.
+PARTITIONED_TABLE_ARGS = {"postgresql_partition_by": "RANGE (created_at)"}
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def partition_key_column() -> Column:
+    # Значення задається в Python: ORM одразу знає весь первинний ключ нового рядка.
+    return Column(
+        DateTime(timezone=True), primary_key=True, nullable=False, default=_utcnow, server_default=func.now()
+    )
+
+
 class Comment(Base, TimestampedModel):
-    id = Column(Integer, primary_key=True, index=True)
+    __table_args__ = (
+        # Сторінки коментарів картки (keyset за created_at, id); також обслуговує пошук лише за card_id.
+        Index('ix_comment_card_id_created_at_id', 'card_id', 'created_at', 'id'),
+        PARTITIONED_TABLE_ARGS,
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    created_at = partition_key_column()
     content = Column(String, nullable=False)
     author_id = Column(Integer, ForeignKey('user.id'), nullable=False)
     card_id = Column(Integer, ForeignKey('card.id'), nullable=False)
@@ -54,7 +90,7 @@ class Comment(Base, TimestampedModel):
 class CardAttachment(Base, TimestampedModel):
     id = Column(Integer, primary_key=True, index=True)
     file_path = Column(String, nullable=False)
-    card_id = Column(Integer, ForeignKey('card.id'), nullable=False)
+    card_id = Column(Integer, ForeignKey('card.id'), nullable=False, index=True)
     uploaded_at = Column(DateTime, default=datetime.utcnow)
 
     card = relationship("Card", back_populates="attachments")
@@ -62,7 +98,7 @@ class CardAttachment(Base, TimestampedModel):
 
 class CheckList(Base, TimestampedModel):
     id = Column(Integer, primary_key=True, index=True)
-    card_id = Column(Integer, ForeignKey("card.id"))
+    card_id = Column(Integer, ForeignKey("card.id"), index=True)
     title = Column(String)
     is_checked = Column(Boolean, default=False)
     position = Column(Integer, default=0)
@@ -79,7 +115,14 @@ class ActionType(PyEnum):
 
 
 class CardActivity(Base, TimestampedModel):
-    id = Column(Integer, primary_key=True, index=True)
+    __table_args__ = (
+        # Стрічка активності картки (keyset за created_at, id); також обслуговує пошук лише за card_id.
+        Index('ix_cardactivity_card_id_created_at_id', 'card_id', 'created_at', 'id'),
+        PARTITIONED_TABLE_ARGS,
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    created_at = partition_key_column()
     action_type = Column(Enum(ActionType), nullable=False)
     description = Column(String, nullable=False)
     performed_by_id = Column(Integer, ForeignKey('user.id'), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from src.adapters.sqlalchemy.db.base_class import Base
@@ -6,10 +6,18 @@ from src.adapters.sqlalchemy.models.base import TimestampedModel
 
 
 class List(Base, TimestampedModel):
+    __table_args__ = (
+        # Також обслуговує пошук списків лише за board_id.
+        Index('ix_list_board_id_position', 'board_id', 'position'),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False, index=True)
-    position = Column(Integer, default=0)
+    position = Column(BigInteger, default=0)
     board_id = Column(Integer, ForeignKey('board.id'), nullable=False)
 
+    # Підтримується тригером бази даних (див. міграцію counter_columns).
+    cards_count = Column(Integer, nullable=False, default=0, server_default='0')
+
     board = relationship("Board", back_populates="lists")
     cards = relationship("Card", back_populates="list", cascade="all, delete-orphan")
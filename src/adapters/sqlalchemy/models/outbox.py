@@ -0,0 +1,15 @@
+from sqlalchemy import Column, BigInteger, String, DateTime, JSON
+from sqlalchemy.sql import func
+
+from src.adapters.sqlalchemy.db.base_class import Base
+
+
+class OutboxMessage(Base):
+    """
+    A Celery task to enqueue, written in the same transaction as the change it reports.
+    The outbox relay (src/scripts/outbox_relay.py) publishes and deletes the rows.
+    """
+    id = Column(BigInteger, primary_key=True)
+    task = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -1,7 +1,8 @@
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, Integer, String, Boolean, Enum
+from sqlalchemy import Column, DateTime, Integer, String, Boolean, Enum, Index
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
 from src.adapters.sqlalchemy.db.base_class import Base
 from src.adapters.sqlalchemy.models.base import TimestampedModel
@@ -15,7 +16,14 @@ class UserType(PyEnum):
 
 
 class User(Base, TimestampedModel):
+    __table_args__ = (
+        # Keyset pagination order for the users listing.
+        Index('ix_user_created_at_id', 'created_at', 'id'),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
+    # Ключ keyset-пагінації: NULL випав би з порівняння (created_at, id) > курсор.
+    created_at = Column(DateTime(timezone=True), nullable=False, default=func.now(), server_default=func.now())
     username = Column(String, unique=True, nullable=False, index=True)
     email = Column(String, unique=True, nullable=False, index=True)
     hashed_password = Column(String, nullable=False)
@@ -0,0 +1,58 @@
+import zlib
+from datetime import datetime
+from typing import Callable, Iterator, List, Optional
+
+import orjson
+from sqlalchemy.orm import Session
+
+from src.adapters.repositories.board_export import BoardExportRepository
+from src.adapters.sqlalchemy.db.session import SessionLocal
+
+EXPORT_FORMAT_VERSION = 1
+# Bytes of NDJSON buffered before a chunk is handed to the response (or the compressor).
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+def export_chunks(
+        board_ids: Optional[List[int]] = None,
+        owner_id: Optional[int] = None,
+        compress: bool = False,
+        session_factory: Optional[Callable[[], Session]] = None,
+) -> Iterator[bytes]:
+    """
+    Yields the NDJSON export of the given boards (all boards when no filter is given) in chunks.
+
+    The first line is a header ``{"type": "export", ...}``, every other line is
+    ``{"type": <record type>, "row": {<column>: <value>}}``, parents before children.
+    The generator opens its own session: a streaming response outlives the request's one.
+    """
+    session = (session_factory or SessionLocal)()
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS) if compress else None
+    try:
+        # Один знімок бази на весь експорт, навіть якщо він триває хвилини.
+        session.connection(execution_options={"isolation_level": "REPEATABLE READ", "postgresql_readonly": True})
+        repo = BoardExportRepository(session=session)
+
+        buffer = bytearray(orjson.dumps({
+            "type": "export",
+            "format_version": EXPORT_FORMAT_VERSION,
+            "exported_at": datetime.utcnow(),
+            "board_ids": board_ids,
+            "owner_id": owner_id,
+        }))
+        buffer += b"\n"
+        for record_type, row in repo.iter_export_records(board_ids=board_ids, owner_id=owner_id):
+            buffer += orjson.dumps({"type": record_type, "row": row})
+            buffer += b"\n"
+            if len(buffer) >= EXPORT_CHUNK_SIZE:
+                chunk = compressor.compress(bytes(buffer)) if compressor else bytes(buffer)
+                buffer.clear()
+                if chunk:
+                    yield chunk
+
+        tail = compressor.compress(bytes(buffer)) + compressor.flush() if compressor else bytes(buffer)
+        if tail:
+            yield tail
+    finally:
+        session.rollback()
+        session.close()
@@ -0,0 +1,208 @@
+import gzip
+import logging
+from typing import Any, BinaryIO, Callable, Dict, List, NamedTuple, Optional, Set, Tuple, Type
+from enum import Enum as PyEnum
+
+import orjson
+from sqlalchemy.orm import Session
+
+from src.adapters.cache.board import board_cache
+from src.adapters.repositories.board_import import BoardImportRepository
+from src.adapters.sqlalchemy.db.session import SessionLocal
+from src.adapters.sqlalchemy.models import ImportJob
+from src.adapters.sqlalchemy.models.board_import import ImportStatus
+from src.adapters.sqlalchemy.models.card import Priority
+from src.application.board.board_export import EXPORT_FORMAT_VERSION
+from src.main.config import settings
+
+# Reference to the user table: kept when the user exists here, otherwise replaced (see ImportTable).
+USER = "user"
+
+
+class ImportTable(NamedTuple):
+    table: str
+    # Columns copied from the exported row; counters and versions are left to the triggers.
+    columns: List[str]
+    # Column -> record type (or USER) whose new id replaces the exported one.
+    references: Dict[str, str]
+    enums: Dict[str, Type[PyEnum]] = {}
+    has_id: bool = True
+    # Association rows are dropped instead of pointing them at the fallback user (it would duplicate keys).
+    skip_unknown_users: bool = False
+    # created_at is the partition key of the table and may not be NULL; older rows fall back to updated_at.
+    partitioned: bool = False
+
+
+# Loaded in this order by the export format: every parent precedes its children.
+IMPORT_TABLES: Dict[str, ImportTable] = {
+    "board": ImportTable(
+        "board", ["name", "is_public", "owner_id", "created_at", "updated_at"], {"owner_id": USER}
+    ),
+    "list": ImportTable(
+        "list", ["name", "position", "board_id", "created_at", "updated_at"], {"board_id": "board"}
+    ),
+    "card": ImportTable(
+        "card",
+        [
+            "title", "description", "priority", "responsible_person_id", "list_id", "position",
+            "due_date", "reminder_datetime", "created_at", "updated_at",
+        ],
+        {"responsible_person_id": USER, "list_id": "list"},
+        enums={"priority": Priority},
+    ),
+    "card_performer": ImportTable(
+        "task_performers_association", ["card_id", "user_id"], {"card_id": "card", "user_id": USER},
+        has_id=False, skip_unknown_users=True,
+    ),
+    "comment": ImportTable(
+        "comment", ["content", "author_id", "card_id", "created_at", "updated_at"],
+        {"author_id": USER, "card_id": "card"},
+        partitioned=True,
+    ),
+    "checklist": ImportTable(
+        "checklist", ["card_id", "title", "is_checked", "position", "created_at", "updated_at"],
+        {"card_id": "card"},
+    ),
+}
+
+
+def _open_source(path: str) -> BinaryIO:
+    with open(path, "rb") as f:
+        magic = f.read(2)
+    return gzip.open(path, "rb") if magic == b"\x1f\x8b" else open(path, "rb")
+
+
+def _affected_boards(
+        repo: BoardImportRepository, spec: ImportTable, values: List[List[Any]], ids: List[int]
+) -> Set[int]:
+    """Boards that received rows from a batch; their cached lists, cards and 404s are stale."""
+    if spec.table == "board":
+        return set(ids)
+
+    def column(name: str) -> Set[int]:
+        return {record[spec.columns.index(name)] for record in values} if name in spec.columns else set()
+
+    return column("board_id") | repo.get_board_ids(list_ids=column("list_id"), card_ids=column("card_id"))
+
+
+def _load_batch(
+        repo: BoardImportRepository, job: ImportJob, record_type: str, rows: List[Dict[str, Any]]
+) -> Tuple[int, int, Set[int]]:
+    """COPYs one batch of rows of a type with remapped ids; returns (imported, skipped, affected board ids)."""
+    spec = IMPORT_TABLES[record_type]
+
+    new_ids = {
+        column: repo.get_new_ids(job.id, parent, {row[column] for row in rows if row.get(column) is not None})
+        for column, parent in spec.references.items()
+        if parent != USER
+    }
+    user_columns = [column for column, parent in spec.references.items() if parent == USER]
+    existing_users = repo.get_existing_user_ids(
+        {row[column] for row in rows for column in user_columns if row.get(column) is not None}
+    )
+
+    values, old_ids = [], []
+    for row in rows:
+        record = [row.get(column) for column in spec.columns]
+        if spec.partitioned and row.get("created_at") is None:
+            record[spec.columns.index("created_at")] = row.get("updated_at") or job.created_at
+        for index, column in enumerate(spec.columns):
+            if column in new_ids:
+                record[index] = new_ids[column].get(record[index])
+            elif column in user_columns and record[index] not in existing_users:
+                record[index] = None if spec.skip_unknown_users else job.fallback_user_id
+            elif column in spec.enums and record[index] is not None:
+                # Експорт пише значення enum, а тип у Postgres зберігає імена.
+                record[index] = spec.enums[column](record[index]).name
+
+        # Батьківський запис не імпортовано (або користувача немає) — пропускаємо рядок.
+        if any(record[spec.columns.index(column)] is None for column in spec.references):
+            continue
+        values.append(record)
+        old_ids.append(row.get("id"))
+
+    ids = []
+    if values:
+        if spec.has_id:
+            ids = repo.allocate_ids(spec.table, len(values))
+            repo.copy_rows(spec.table, ["id"] + spec.columns, ([new_id] + record for new_id, record in zip(ids, values)))
+            repo.save_id_map(job.id, record_type, zip(old_ids, ids))
+        else:
+            repo.copy_rows(spec.table, spec.columns, values)
+
+    board_ids = _affected_boards(repo, spec, values, ids) if values else set()
+    return len(values), len(rows) - len(values), board_ids
+
+
+def run_import(
+        job_id: int,
+        session_factory: Optional[Callable[[], Session]] = None,
+        batch_size: Optional[int] = None,
+        progress: Optional[Callable[[ImportJob], None]] = None,
+) -> Optional[ImportJob]:
+    """
+    Loads an NDJSON export into the database for an import job, resuming after its last committed line.
+
+    Rows are COPYed in batches of one record type; each batch is committed together with its
+    id map entries and the job progress, so an interrupted job can simply be run again.
+    """
+    batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+    session = (session_factory or SessionLocal)()
+    repo = BoardImportRepository(session=session)
+    try:
+        job = repo.get_job(job_id)
+        if job is None or job.status == ImportStatus.completed:
+            return job
+
+        job.status = ImportStatus.running
+        job.error = None
+        repo.save_job(job)
+
+        batch_type, batch = None, []
+        line_number = job.processed_lines
+
+        def flush(last_line: int) -> None:
+            nonlocal batch
+            board_ids = set()
+            if batch:
+                imported, skipped, board_ids = _load_batch(repo, job, batch_type, batch)
+                job.imported_rows += imported
+                job.skipped_rows += skipped
+                batch = []
+            job.processed_lines = last_line
+            repo.save_job(job)
+            # COPY обходить репозиторії, тож кеш дошок скидаємо тут, після коміту пачки.
+            board_cache.invalidate(*board_ids)
+            if progress:
+                progress(job)
+
+        try:
+            with _open_source(job.source_path) as source:
+                for line_number, line in enumerate(source, start=1):
+                    if line_number <= job.processed_lines or not line.strip():
+                        continue
+
+                    record = orjson.loads(line)
+                    record_type = record.get("type")
+                    if record_type == "export" and record.get("format_version") != EXPORT_FORMAT_VERSION:
+                        raise ValueError(f"Unsupported export format version: {record.get('format_version')}")
+
+                    if batch and (record_type != batch_type or len(batch) >= batch_size):
+                        flush(line_number - 1)
+                    if record_type in IMPORT_TABLES:
+                        batch_type = record_type
+                        batch.append(record["row"])
+
+            flush(line_number)
+            job.status = ImportStatus.completed
+            repo.save_job(job)
+        except Exception as e:
+            logging.exception(f"Import job {job_id} failed")
+            session.rollback()
+            job.status = ImportStatus.failed
+            job.error = str(e)
+            repo.save_job(job)
+
+        return job
+    finally:
+        session.close()
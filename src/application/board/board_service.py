@@ -1,19 +1,29 @@
-from typing import Optional, Union, List, Dict
+from typing import Optional, Union, List, Dict, Tuple
 
 from fastapi import HTTPException
 from fastapi_filter.contrib.sqlalchemy import Filter
+from sqlalchemy import Row, tuple_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from src.adapters.repositories.board import BoardRepository
 from src.adapters.schemas.board import BoardCreate, BoardUpdate
-from src.adapters.sqlalchemy.models import Board, User
+from src.adapters.schemas.pagination import Cursor
+from src.adapters.sqlalchemy.models import Board, User, List as ListModel
 from src.adapters.sqlalchemy.models.user import UserType
 
 
 class BoardService:
     def __init__(self, board_repo: BoardRepository) -> None:
         self.board_repo = board_repo
+        # The service lives for one request, so this memoizes membership checks per request.
+        self._membership: Dict[Tuple[int, int], bool] = {}
+
+    def _is_member(self, board_id: int, user_id: int) -> bool:
+        key = (board_id, user_id)
+        if key not in self._membership:
+            self._membership[key] = self.board_repo.is_member(board_id=board_id, user_id=user_id)
+        return self._membership[key]
 
     def create_board(self, obj_in: BoardCreate, current_user: User) -> Board:
         if not current_user:
@@ -46,8 +56,8 @@ class BoardService:
 
         self.board_repo.delete_board(board_id)
 
-    def get_public_boards(self, skip: int = 0, limit: int = 10) -> List[Board]:
-        return self.board_repo.get_list_of_public_boards(skip=skip, limit=limit)
+    def get_public_boards(self, skip: int = 0, limit: int = 10, after: Optional[Cursor] = None) -> List[Board]:
+        return self.board_repo.get_list_of_public_boards(skip=skip, limit=limit, after=after)
 
     def get_board_members(self, board: Board, current_user: User) -> List[User]:
         if not board.is_public and board.owner_id != current_user.id and current_user.type != UserType.admin:
@@ -55,17 +65,14 @@ class BoardService:
         return self.board_repo.get_board_members(board_id=board.id)
 
     def is_user_member_of_board(self, board: Board, current_user: User) -> bool:
-        board_members = self.board_repo.get_board_members(board_id=board.id)
-
         if current_user.type == UserType.admin or current_user.id == board.owner_id:
             return True
-        return current_user.id in [member.id for member in board_members]
+        return self._is_member(board_id=board.id, user_id=current_user.id)
 
     def is_user_member_of_board_by_id(self, board: Board, user_id: int) -> bool:
-        members = self.board_repo.get_board_members(board_id=board.id)
         if user_id == board.owner_id:
             return True
-        return any(member.id == user_id for member in members)
+        return self._is_member(board_id=board.id, user_id=user_id)
 
     def add_member_to_board(self, board: Board, member_id: int, current_user: User) -> None:
         if board.owner_id != current_user.id and current_user.type != UserType.admin:
@@ -74,10 +81,11 @@ class BoardService:
         if member_id == current_user.id:
             raise HTTPException(status_code=400, detail="Board owner cannot add themselves as a member")
 
-        if any(member.id == member_id for member in board.members):
+        if self._is_member(board_id=board.id, user_id=member_id):
             raise HTTPException(status_code=400, detail="User is already a member of this board")
 
         self.board_repo.add_member_to_board(board_id=board.id, member_id=member_id)
+        self._membership[(board.id, member_id)] = True
 
     def remove_member_from_board(self, board: Board, member_id: int, current_user: User) -> None:
         if board.owner_id != current_user.id and current_user.type != UserType.admin:
@@ -87,14 +95,33 @@ class BoardService:
             raise HTTPException(status_code=403, detail="Administrators cannot remove themselves")
 
         removed_user = self.board_repo.remove_member_from_board(board_id=board.id, member_id=member_id)
+        self._membership.pop((board.id, member_id), None)
         if not removed_user:
             raise HTTPException(status_code=404, detail="User is not a member of the board")
 
-    def get_count_of_board_lists(self, board_id: int) -> int:
-        return self.board_repo.get_lists_count(board_id)
+    def get_board_summary(self, board_id: int, current_user: User) -> Row:
+        summary = self.board_repo.get_board_summary(board_id=board_id, user_id=current_user.id)
+        if not summary:
+            raise HTTPException(status_code=404, detail="Board not found")
 
-    def get_count_of_board_members(self, board_id: int) -> int:
-        return self.board_repo.get_members_count(board_id)
+        board = summary.Board
+        if not board.is_public and board.owner_id != current_user.id and current_user.type != UserType.admin:
+            if not summary.is_member:
+                raise HTTPException(
+                    status_code=403, detail="You do not have permission to view this board"
+                )
+
+        return summary
+
+    def check_can_view_board(self, board: Board, current_user: User) -> None:
+        if not board.is_public and not self.is_user_member_of_board(board, current_user):
+            raise HTTPException(
+                status_code=403, detail="You do not have permission to view this board"
+            )
+
+    def get_board_snapshot(self, board: Board, current_user: User) -> List[ListModel]:
+        self.check_can_view_board(board, current_user)
+        return self.board_repo.get_board_lists_with_cards(board_id=board.id)
 
 
 class BoardFilter(Filter):
@@ -107,15 +134,16 @@ class BoardFilter(Filter):
         search_field_name = "search"
 
     def filter_boards(
-            self, db: Session, skip: int, limit: int
+            self, db: Session, skip: int, limit: int, after: Optional[Cursor] = None
     ) -> Union[List[Board], Dict[str, str]]:
         """
         Filters and retrieves boards based on the provided filter parameters.
 
         Args:
             db: SQLAlchemy Session object for database access.
-            skip: The number of boards to skip before returning results (pagination).
+            skip: The number of boards to skip before returning results (pagination); ignored with ``after``.
             limit: The maximum number of boards to return.
+            after: Keyset cursor; only boards ordered after this (created_at, id) are returned.
 
         Returns:
             A list of `Board` objects if the filtering is successful, or a dictionary
@@ -135,7 +163,13 @@ class BoardFilter(Filter):
             if self.is_public is not None:
                 query = query.filter(Board.is_public == self.is_public)
 
-            boards = query.offset(skip).limit(limit).all()
+            query = query.order_by(Board.created_at, Board.id)
+            if after is not None:
+                query = query.filter(tuple_(Board.created_at, Board.id) > after)
+            else:
+                query = query.offset(skip)
+
+            boards = query.limit(limit).all()
             return boards
 
         except SQLAlchemyError as e:
@@ -0,0 +1,134 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.adapters.repositories.card.card_activity import CardActivityRepository
+from src.adapters.sqlalchemy.db.session import SessionLocal
+from src.adapters.sqlalchemy.models.card import ActionType
+from src.main.config import settings
+
+_STOP = object()
+
+
+class ActivityWriter:
+    """
+    Collects card activity records in memory and inserts them in batches from a background thread.
+
+    A batch is written once it holds ``batch_size`` records or ``flush_seconds`` after its first
+    record arrived, whichever comes first. Recording never touches the database: when the queue
+    is full the record is dropped with a warning rather than slowing the request down.
+    """
+
+    def __init__(
+            self,
+            batch_size: int,
+            flush_seconds: float,
+            max_pending: int,
+            session_factory: Optional[Callable[[], Session]] = None,
+    ) -> None:
+        self._batch_size = batch_size
+        self._flush_seconds = flush_seconds
+        self._max_pending = max_pending
+        self._session_factory = session_factory or SessionLocal
+        self._lock = threading.Lock()
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self.dropped = 0
+
+    def _ensure_started(self) -> queue.Queue:
+        with self._lock:
+            # A forked worker inherits the queue but not the thread; it starts its own.
+            if self._thread is None or self._pid != os.getpid():
+                self._queue = queue.Queue(maxsize=self._max_pending)
+                self._thread = threading.Thread(target=self._run, args=(self._queue,), name="activity-writer", daemon=True)
+                self._pid = os.getpid()
+                self._thread.start()
+            return self._queue
+
+    def record(self, card_id: int, action_type: ActionType, description: str, performed_by_id: int) -> None:
+        now = datetime.now(timezone.utc)
+        activity = dict(
+            card_id=card_id,
+            action_type=action_type,
+            description=description,
+            performed_by_id=performed_by_id,
+            performed_at=now.replace(tzinfo=None),
+            created_at=now,
+            updated_at=now,
+        )
+        try:
+            self._ensure_started().put_nowait(activity)
+        except queue.Full:
+            self.dropped += 1
+            logging.warning(f"Activity queue is full, dropped '{action_type.value}' for card #{card_id}")
+
+    def _run(self, pending: queue.Queue) -> None:
+        while True:
+            first = pending.get()
+            if first is _STOP:
+                return
+
+            batch, stop = [first], False
+            deadline = time.monotonic() + self._flush_seconds
+            while len(batch) < self._batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    activity = pending.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if activity is _STOP:
+                    stop = True
+                    break
+                batch.append(activity)
+
+            self._write(batch)
+            if stop:
+                return
+
+    def _write(self, batch: List[dict]) -> None:
+        session = self._session_factory()
+        try:
+            repo = CardActivityRepository(session=session)
+            try:
+                repo.save_card_activities(batch)
+            except IntegrityError:
+                # Картку могли видалити до запису пачки — зберігаємо активність лише наявних карток.
+                session.rollback()
+                card_ids = repo.get_existing_card_ids(activity["card_id"] for activity in batch)
+                batch = [activity for activity in batch if activity["card_id"] in card_ids]
+                if batch:
+                    repo.save_card_activities(batch)
+        except Exception as e:
+            session.rollback()
+            logging.error(f"Writing {len(batch)} card activities failed: {e}")
+        finally:
+            session.close()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Writes what is still queued and stops the thread."""
+        with self._lock:
+            thread, pending = self._thread, self._queue
+            if thread is None or self._pid != os.getpid():
+                return
+            self._thread = None
+        pending.put(_STOP)
+        thread.join(timeout)
+
+
+activity_writer = ActivityWriter(
+    batch_size=settings.ACTIVITY_BATCH_SIZE,
+    flush_seconds=settings.ACTIVITY_FLUSH_SECONDS,
+    max_pending=settings.ACTIVITY_MAX_PENDING,
+)
+atexit.register(activity_writer.close, timeout=settings.ACTIVITY_FLUSH_SECONDS + 5)
@@ -1,23 +1,63 @@
-from typing import List
+from typing import List, Set, Optional
 
 from fastapi import HTTPException, Depends
 from starlette import status
 
 from src.adapters.repositories.card.card import CardRepository
-from src.adapters.schemas.card import CardCreate, CardUpdate
+from src.adapters.repositories.card.card_activity import CardActivityRepository
+from src.adapters.repositories.outbox import OutboxRepository
+from src.adapters.repositories.positioning import POSITION_GAP
+from src.adapters.schemas.card import CardCreate, CardUpdate, CardBatchCreate, CardBatchUpdate, CardMove
+from src.adapters.schemas.pagination import Cursor
 from src.adapters.sqlalchemy.models import Card, User, Board
+from src.adapters.sqlalchemy.models.card import ActionType, CardActivity
 from src.adapters.sqlalchemy.models.user import UserType
 from src.application.board.board_service import BoardService
-from src.main.utils import send_status_change_email, mock_send_status_change_email
+from src.application.card.activity_writer import activity_writer
+from src.main.utils import send_status_change_email, send_status_change_emails, mock_send_status_change_email
 
 
 class CardService:
-    def __init__(self, card_repo: CardRepository, board_service: BoardService) -> None:
+    def __init__(
+            self,
+            card_repo: CardRepository,
+            board_service: BoardService,
+            outbox_repo: OutboxRepository,
+            activity_repo: CardActivityRepository,
+    ) -> None:
         self.card_repo = card_repo
         self.board_service = board_service
+        # Shares the card repository's session: notifications commit together with the card change.
+        self.outbox_repo = outbox_repo
+        self.activity_repo = activity_repo
+
+    def _notify_status_change(self, email_to: str, task_title: str, old_status: int, new_status: int, due_date) -> None:
+        self.outbox_repo.add_message(send_status_change_email.name, dict(
+            email_to=email_to,
+            task_title=task_title,
+            old_status=old_status,
+            new_status=new_status,
+            due_date=due_date.isoformat() if due_date else None
+        ))
+
+    @staticmethod
+    def _record_update(card_id: int, card_data: dict, old_list_id: int, current_user: User) -> None:
+        # Активність пишеться у фоні пачками, тож запит не чекає на додатковий INSERT.
+        new_list_id = card_data.get("list_id")
+        if new_list_id is not None and new_list_id != old_list_id:
+            activity_writer.record(
+                card_id, ActionType.status_changed, f"Moved from list #{old_list_id} to list #{new_list_id}",
+                current_user.id
+            )
+
+        changed_fields = [key for key in card_data if key not in ("list_id", "position", "id")]
+        if changed_fields:
+            activity_writer.record(
+                card_id, ActionType.updated, f"Updated {', '.join(changed_fields)}", current_user.id
+            )
 
-    def get_cards_by_list(self, list_id: int) -> List[Card]:
-        return self.card_repo.get_cards(list_id=list_id)
+    def get_cards_by_list(self, list_id: int, board_id: Optional[int] = None) -> List[Card]:
+        return self.card_repo.get_cards(list_id=list_id, board_id=board_id)
 
     def _get_card(self, list_id: int, card_id: int) -> Card:
         return self.card_repo.get_card(list_id=list_id, card_id=card_id)
@@ -56,13 +96,136 @@ class CardService:
 
         card_data["responsible_person_id"] = responsible_person_id
         card_data["list_id"] = list_id
+        card_data["position"] = self.card_repo.get_next_positions([list_id])[list_id]
 
         card_db_obj = Card(**card_data)
 
         self.card_repo.create_card(card_db_obj)
+        activity_writer.record(
+            card_db_obj.id, ActionType.created, f"Created card '{card_db_obj.title}'", current_user.id
+        )
 
         return card_db_obj
 
+    def create_cards(self, board: Board, obj_in: CardBatchCreate, current_user: User) -> List[Card]:
+        if board.owner_id != current_user.id and current_user.type != UserType.admin:
+            if not self.board_service.is_user_member_of_board(board, current_user):
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="You do not have permission to create cards in this board"
+                )
+
+        self._check_board_lists(board=board, list_ids={card_in.list_id for card_in in obj_in.cards})
+
+        next_positions = self.card_repo.get_next_positions({card_in.list_id for card_in in obj_in.cards})
+
+        cards_data = []
+        for card_in in obj_in.cards:
+            card_data = card_in.dict()
+            card_data["position"] = next_positions[card_in.list_id]
+            next_positions[card_in.list_id] += POSITION_GAP
+
+            responsible_person_id = card_data.get("responsible_person_id")
+            if responsible_person_id is None:
+                responsible_person_id = current_user.id
+
+            if current_user.id == board.owner_id:
+                # Перевірки членства кешуються в BoardService, тож кожен користувач перевіряється один раз.
+                if not self.board_service.is_user_member_of_board_by_id(board=board, user_id=responsible_person_id):
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"Can't make user #{responsible_person_id} responsible for a card in this board."
+                    )
+            elif responsible_person_id != current_user.id:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="You can only assign yourself as responsible."
+                )
+
+            card_data["responsible_person_id"] = responsible_person_id
+            cards_data.append(card_data)
+
+        cards = self.card_repo.create_cards(cards_data)
+        for card in cards:
+            activity_writer.record(card.id, ActionType.created, f"Created card '{card.title}'", current_user.id)
+
+        return cards
+
+    def update_cards(self, board: Board, obj_in: CardBatchUpdate, current_user: User) -> List[Card]:
+        if board.owner_id != current_user.id and current_user.type != UserType.admin:
+            if not self.board_service.is_user_member_of_board(board, current_user):
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="You do not have permission to update cards in this board"
+                )
+
+        card_ids = [card_in.id for card_in in obj_in.cards]
+        if len(set(card_ids)) != len(card_ids):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Each card can only be updated once per batch."
+            )
+
+        cards_state = {row.id: row for row in self.card_repo.get_board_cards_state(board_id=board.id, card_ids=card_ids)}
+        missing_card_ids = set(card_ids) - cards_state.keys()
+        if missing_card_ids:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Cards not found in this board: {sorted(missing_card_ids)}"
+            )
+
+        self._check_board_lists(
+            board=board, list_ids={card_in.list_id for card_in in obj_in.cards if card_in.list_id is not None}
+        )
+
+        moved_list_ids = {
+            card_in.list_id for card_in in obj_in.cards
+            if card_in.list_id is not None and card_in.list_id != cards_state[card_in.id].list_id
+        }
+        next_positions = self.card_repo.get_next_positions(moved_list_ids) if moved_list_ids else {}
+
+        cards_data = []
+        notifications = []
+        for card_in in obj_in.cards:
+            card_data = card_in.dict(exclude_unset=True)
+            old_state = cards_state[card_in.id]
+            is_moved = card_in.list_id is not None and card_in.list_id != old_state.list_id
+            if is_moved:
+                # Переміщена картка стає останньою в цільовому списку.
+                card_data["position"] = next_positions[card_in.list_id]
+                next_positions[card_in.list_id] += POSITION_GAP
+            cards_data.append(card_data)
+
+            if is_moved and old_state.responsible_email:
+                due_date = card_data.get("due_date", old_state.due_date)
+                notifications.append(dict(
+                    email_to=old_state.responsible_email,
+                    task_title=card_data.get("title", old_state.title),
+                    old_status=old_state.list_id,
+                    new_status=card_in.list_id,
+                    due_date=due_date.isoformat() if due_date else None
+                ))
+
+        if notifications:
+            self.outbox_repo.add_message(send_status_change_emails.name, dict(notifications=notifications))
+
+        cards = self.card_repo.update_cards(cards_data)
+        for card_data in cards_data:
+            self._record_update(card_data["id"], card_data, cards_state[card_data["id"]].list_id, current_user)
+
+        return cards
+
+    def _check_board_lists(self, board: Board, list_ids: Set[int]) -> None:
+        if not list_ids:
+            return
+
+        missing_list_ids = list_ids - self.card_repo.get_board_list_ids(board_id=board.id, list_ids=list_ids)
+        if missing_list_ids:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Lists not found in this board: {sorted(missing_list_ids)}"
+            )
+
     def update_card(self, board: Board, list_id: int, card_id: int, obj_in: CardUpdate, current_user: User) -> Card:
         if board.owner_id != current_user.id and current_user.type != UserType.admin:
             if not self.board_service.is_user_member_of_board(board, current_user):
@@ -79,19 +242,18 @@ class CardService:
         new_status = obj_in.list_id
 
         card_data = obj_in.dict(exclude_unset=True)
+        if new_status is not None and new_status != old_status:
+            self._check_board_lists(board=board, list_ids={new_status})
+            card_data["position"] = self.card_repo.get_next_positions([new_status])[new_status]
 
-        updated_card = self.card_repo.update_card(list_id=list_id, card_id=card_id, card_data=card_data)
-
-        if old_status != new_status:
             responsible_user = card.responsible
-
             if responsible_user:
-                send_status_change_email.delay(
+                self._notify_status_change(
                     email_to=responsible_user.email,
-                    task_title=card.title,
+                    task_title=card_data.get("title", card.title),
                     old_status=old_status,
                     new_status=new_status,
-                    due_date=card.due_date
+                    due_date=card_data.get("due_date", card.due_date)
                 )
             # if responsible_user:
             #     mock_send_status_change_email(
@@ -102,8 +264,46 @@ class CardService:
             #         due_date=str(card.due_date)
             #     )
 
+        updated_card = self.card_repo.update_card(list_id=list_id, card_id=card_id, card_data=card_data)
+        self._record_update(card_id, card_data, old_status, current_user)
+
         return updated_card
 
+    def move_card(self, board: Board, card: Card, obj_in: CardMove, current_user: User) -> Card:
+        if board.owner_id != current_user.id and current_user.type != UserType.admin:
+            if not self.board_service.is_user_member_of_board(board, current_user):
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="You do not have permission to move a card in this board"
+                )
+
+        old_status = card.list_id
+        if obj_in.list_id != old_status:
+            self._check_board_lists(board=board, list_ids={obj_in.list_id})
+
+        if old_status != obj_in.list_id and card.responsible:
+            self._notify_status_change(
+                email_to=card.responsible.email,
+                task_title=card.title,
+                old_status=old_status,
+                new_status=obj_in.list_id,
+                due_date=card.due_date
+            )
+
+        # Список, позиція і сповіщення в outbox комітяться в одній транзакції.
+        self.card_repo.move_card(card=card, list_id=obj_in.list_id, index=obj_in.position)
+        if old_status != obj_in.list_id:
+            activity_writer.record(
+                card.id, ActionType.status_changed, f"Moved from list #{old_status} to list #{obj_in.list_id}",
+                current_user.id
+            )
+        else:
+            activity_writer.record(
+                card.id, ActionType.updated, f"Moved to position {obj_in.position}", current_user.id
+            )
+
+        return card
+
     def delete_card(self, board: Board, list_id: int, card_id: int, current_user: User) -> None:
         if board.owner_id != current_user.id and current_user.type != UserType.admin:
             raise HTTPException(
@@ -126,6 +326,7 @@ class CardService:
             )
         card.performers.append(user)
         self.card_repo.save_card(card)
+        activity_writer.record(card.id, ActionType.assigned, f"Assigned {user.username}", current_user.id)
 
     def remove_performer(self, board: Board, list_id: int, card_id: int, user: User, current_user: User):
         if board.owner_id != current_user.id and current_user.type != UserType.admin:
@@ -143,6 +344,12 @@ class CardService:
                 detail="Performer not found."
             )
 
+    def get_activities(
+            self, board: Board, card: Card, current_user: User, limit: int = 50, before: Optional[Cursor] = None
+    ) -> List[CardActivity]:
+        self.board_service.check_can_view_board(board, current_user)
+        return self.activity_repo.get_card_activities(card_id=card.id, limit=limit, before=before)
+
     def get_performers(self, board: Board, list_id: int, card_id: int, current_user: User) -> List[User]:
         if board.owner_id != current_user.id and current_user.type != UserType.admin:
             raise HTTPException(
@@ -0,0 +1,60 @@
+from typing import List, Optional
+
+from fastapi import HTTPException
+from starlette import status
+
+from src.adapters.repositories.card.comment import CommentRepository
+from src.adapters.schemas.comment import CommentCreate, CommentUpdate
+from src.adapters.schemas.pagination import Cursor
+from src.adapters.sqlalchemy.models import Board, Card, User
+from src.adapters.sqlalchemy.models.card import ActionType, Comment
+from src.adapters.sqlalchemy.models.user import UserType
+from src.application.board.board_service import BoardService
+from src.application.card.activity_writer import activity_writer
+
+
+class CommentService:
+    def __init__(self, comment_repo: CommentRepository, board_service: BoardService) -> None:
+        self.comment_repo = comment_repo
+        self.board_service = board_service
+
+    def get_comments(
+            self, board: Board, card: Card, current_user: User, limit: int = 50, after: Optional[Cursor] = None
+    ) -> List[Comment]:
+        self.board_service.check_can_view_board(board, current_user)
+        return self.comment_repo.get_comments(card_id=card.id, limit=limit, after=after)
+
+    def create_comment(self, board: Board, card: Card, obj_in: CommentCreate, current_user: User) -> Comment:
+        if board.owner_id != current_user.id and current_user.type != UserType.admin:
+            if not self.board_service.is_user_member_of_board(board, current_user):
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="You do not have permission to comment on cards in this board"
+                )
+
+        comment = Comment(content=obj_in.content, card_id=card.id, author_id=current_user.id)
+        self.comment_repo.save_comment(comment)
+        activity_writer.record(card.id, ActionType.comment_added, f"Commented #{comment.id}", current_user.id)
+
+        return comment
+
+    def update_comment(self, comment: Comment, obj_in: CommentUpdate, current_user: User) -> Comment:
+        if comment.author_id != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="You can only edit your own comments"
+            )
+
+        return self.comment_repo.update_comment(comment, obj_in.dict(exclude_unset=True))
+
+    def delete_comment(self, board: Board, comment: Comment, current_user: User) -> None:
+        # Автор, власник дошки або адміністратор.
+        if (
+            comment.author_id != current_user.id
+            and board.owner_id != current_user.id
+            and current_user.type != UserType.admin
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="You do not have permission to delete this comment"
+            )
+
+        self.comment_repo.delete_comment(comment)
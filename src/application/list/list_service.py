@@ -14,6 +14,9 @@ class ListService:
     def get_lists_by_board(self, board_id: int) -> ListType[ListModel]:
         return self.list_repo.get_lists_by_board(board_id=board_id)
 
+    def get_list_index(self, list: ListModel) -> int:
+        return self.list_repo.get_list_index(list)
+
     def create_list(self, board: Board, obj_in: ListCreate, current_user: User) -> ListModel:
         if not current_user:
             raise HTTPException(status_code=400, detail="Invalid current user")
@@ -22,9 +25,7 @@ class ListService:
             raise HTTPException(
                 status_code=403, detail="You do not have permission to perform this action"
             )
-        max_position_row = self.list_repo.get_max_position(board.id)
-        max_position = max_position_row[0] if max_position_row else 0
-        new_position = max_position + 1
+        new_position = self.list_repo.get_next_position(board.id)
 
         list_data = obj_in.dict()
         list_data["board_id"] = board.id
@@ -45,28 +46,10 @@ class ListService:
             list.name = obj_in.name
 
         if obj_in.position is not None:
-            new_position = obj_in.position
-            lists = self.list_repo.get_lists_by_board(board_id=board.id)
-
-            # Зміна позицій всіх списків, якщо нова позиція відрізняється
-            if new_position != list.position:
-                # Пересунути всі списки вниз або вверх в залежності від нової позиції
-                if new_position < list.position:
-                    # Перемістити всі списки вниз, якщо нова позиція менша
-                    for lst in lists:
-                        if new_position <= lst.position < list.position:
-                            lst.position += 1
-                elif new_position > list.position:
-                    # Перемістити всі списки вверх, якщо нова позиція більша
-                    for lst in lists:
-                        if list.position < lst.position <= new_position:
-                            lst.position -= 1
-
-                list.position = new_position
-
-                self.list_repo.save_all_lists(lists)
-
-        self.list_repo.save_list(list)
+            # position - бажане місце списку на дошці (з 1); оновлюється лише позиція цього списку.
+            self.list_repo.move_list(board_id=board.id, list=list, index=obj_in.position)
+        else:
+            self.list_repo.save_list(list)
 
         return list
 
@@ -76,11 +59,5 @@ class ListService:
                 status_code=403, detail="You do not have permission to perform this action"
             )
 
+        # Позиції розріджені, тож решту списків перенумеровувати не потрібно.
         self.list_repo.delete_list(board_id=board.id, list_id=list.id)
-
-        # Оновити позиції інших списків
-        lists_to_update = self.list_repo.get_lists_above_position(board_id=board.id, position=list.position)
-        for lst in lists_to_update:
-            lst.position -= 1
-
-        self.list_repo.save_all_lists(lists_to_update)
@@ -3,12 +3,12 @@ import re
 from typing import Union, Optional, List
 
 from src.adapters.repositories.user import UserRepository
-from src.adapters.schemas.pagination import Pagination
+from src.adapters.schemas.pagination import Pagination, Cursor, CountMode
 from src.adapters.schemas.user import UserCreate, UserSignUp, UserId, UserUpdate
 from src.adapters.sqlalchemy.models import User
 from src.adapters.sqlalchemy.models.user import UserType
 from src.application.common.exceptions import UserExistsError, UserNotFoundError, WeakPasswordError
-from src.main.security import get_password_hash, verify_password
+from src.main.security import get_password_hash, verify_and_update_password
 
 
 class UserService:
@@ -52,10 +52,14 @@ class UserService:
 
         return updated_user
 
-    def get_users_list(self, data: Pagination) -> List[User]:
-        return self.user_repo.get_users_list(skip=data.skip, limit=data.limit)
+    def get_users_list(self, data: Pagination, after: Optional[Cursor] = None) -> List[User]:
+        return self.user_repo.get_users_list(skip=data.skip, limit=data.limit, after=after)
 
-    def get_users_total(self) -> int:
+    def get_users_total(self, count_mode: CountMode = CountMode.exact) -> Optional[int]:
+        if count_mode == CountMode.none:
+            return None
+        if count_mode == CountMode.approximate:
+            return self.user_repo.get_users_estimated_count()
         return self.user_repo.get_users_count()
 
     def get_user(self, data: UserId) -> User:
@@ -74,8 +78,12 @@ class UserService:
         user = self.user_repo.get_user_by_email(email=email)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        verified, new_hash = verify_and_update_password(password, user.hashed_password)
+        if not verified:
             return None
+        if new_hash:
+            # Хеш зроблено з іншими параметрами bcrypt — оновлюємо його, поки пароль відомий.
+            user = self.user_repo.update_user(user_id=user.id, update_data={"hashed_password": new_hash})
         return user
 
     def is_active(self, user: User) -> bool:
@@ -28,6 +28,8 @@ class Settings(BaseSettings):
     ACTIVATION_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 3
 
     TOKEN_ALGORITHM: str = "HS256"
+    # Number of verified tokens whose claims are kept to skip re-verification.
+    TOKEN_CACHE_MAXSIZE: int = 10000
 
     SERVER_NAME: str = "tz_theoriginals"
     SERVER_HOST: str = "0.0.0.0"
@@ -63,6 +65,22 @@ class Settings(BaseSettings):
     POSTGRES_TEST_DB: str = os.getenv("POSTGRES_TEST_DB")
     SQLALCHEMY_TEST_DATABASE_URL: Optional[str] = None
 
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    # Seconds after which a connection is replaced on checkout; -1 disables recycling.
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: float = 30
+    # Pre-ping costs a round-trip per checkout; with it disabled, stale connections
+    # are only caught by DB_POOL_RECYCLE or on first use.
+    DB_POOL_PRE_PING: bool = True
+    # LIFO keeps a small set of connections hot and lets idle ones hit the recycle limit.
+    DB_POOL_USE_LIFO: bool = False
+
+    # Serve the hot read endpoints from async handlers backed by an AsyncEngine.
+    DB_ASYNC_MODE: bool = False
+    # Defaults to SQLALCHEMY_DATABASE_URL with the asyncpg driver.
+    SQLALCHEMY_ASYNC_DATABASE_URL: Optional[str] = None
+
     @field_validator("SQLALCHEMY_DATABASE_URL", mode="before")
     def assemble_db_connection(
             cls, v: Optional[str], values: Dict[str, Any]
@@ -91,8 +109,40 @@ class Settings(BaseSettings):
             path=f"/{values.get('POSTGRES_TEST_DB') or ''}",
         )
 
+    # Authenticated user principals (id, type, is_active) cached by token subject.
+    USER_CACHE_TTL_SECONDS: int = 30
+    USER_CACHE_MAXSIZE: int = 10000
+    # Optional shared tier; leave empty to keep the cache in-process only.
+    USER_CACHE_REDIS_URL: Optional[str] = None
+
+    # Read-through cache of boards, their lists and cards: redis://... for Redis,
+    # memory:// for an in-process stand-in (tests, single worker), empty to disable.
+    BOARD_CACHE_URL: Optional[str] = None
+    BOARD_CACHE_TTL_SECONDS: int = 300
+
+    # Uploaded board imports are written here before the background job loads them.
+    IMPORT_DIR: str = "imports"
+    # Rows per COPY batch; each batch is committed together with the job progress.
+    IMPORT_BATCH_SIZE: int = 5000
+
+    # Card activity is inserted by a background thread in batches of up to ACTIVITY_BATCH_SIZE rows,
+    # at least every ACTIVITY_FLUSH_SECONDS; beyond ACTIVITY_MAX_PENDING queued records new ones are dropped.
+    ACTIVITY_BATCH_SIZE: int = 500
+    ACTIVITY_FLUSH_SECONDS: float = 1
+    ACTIVITY_MAX_PENDING: int = 10000
+
+    # bcrypt cost factor; hashes made with another cost are rehashed on the next login.
+    BCRYPT_ROUNDS: int = 12
+    # Processes that hash and verify passwords off the request threads; 0 runs bcrypt inline.
+    PASSWORD_HASH_WORKERS: int = 2
+    # Password operations queued or running at once; further logins and sign-ups get a 503.
+    PASSWORD_HASH_MAX_PENDING: int = 32
+
     SECRET_KEY: str = os.getenv("SECRET_KEY")
     BROKER_URL: str = os.getenv("BROKER_URL")
+    # Outbox relay: messages published per transaction, and the poll interval when no NOTIFY arrives.
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_POLL_SECONDS: float = 5
 
     EMAILS_ENABLED: bool = True
 
@@ -105,6 +155,15 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str = os.getenv("SMTP_PASSWORD")
 
     EMAIL_RESET_TOKEN_EXPIRE_HOURS: int = os.getenv("EMAIL_RESET_TOKEN_EXPIRE_HOURS")
+    # Open SMTP connections kept per worker process; idle ones are NOOP-checked before reuse.
+    EMAIL_SMTP_POOL_SIZE: int = 2
+    EMAIL_SMTP_IDLE_CHECK_SECONDS: int = 30
+    # Status changes for one recipient within this window are sent as a single digest; 0 sends at once.
+    EMAIL_DIGEST_WINDOW_SECONDS: int = 30
+    # Redis holding the pending digests; defaults to BROKER_URL.
+    EMAIL_DIGEST_REDIS_URL: Optional[str] = None
+    # Retries of a failed status email send (exponential backoff); the queued changes stay in Redis meanwhile.
+    EMAIL_SEND_MAX_RETRIES: int = 5
     EMAIL_TEMPLATES_DIR: ClassVar[str] = "src/templates/email"
 
     class Config:
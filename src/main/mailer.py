@@ -0,0 +1,167 @@
+import logging
+import os
+import queue
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from email.message import EmailMessage
+from email.utils import formataddr
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Optional
+
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+
+from src.main.config import settings
+
+# Templates are compiled once per process; auto_reload=False skips the mtime check on every render.
+template_env = Environment(
+    loader=FileSystemLoader(settings.EMAIL_TEMPLATES_DIR),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=False,
+)
+
+
+def render_template(name: str, context: Dict[str, Any]) -> str:
+    return template_env.get_template(name).render(**context)
+
+
+@lru_cache(maxsize=128)
+def compile_template(source: str) -> Template:
+    """Compiles an inline template (e.g. a subject line) once per distinct source."""
+    return template_env.from_string(source)
+
+
+class _PooledConnection:
+    def __init__(self, smtp: smtplib.SMTP) -> None:
+        self.smtp = smtp
+        self.last_used = time.monotonic()
+
+
+class SMTPConnectionPool:
+    """
+    Keeps up to ``size`` logged-in SMTP connections open and hands them out one at a time.
+
+    A connection idle for longer than ``idle_check_seconds`` is probed with NOOP before reuse,
+    and a connection the server dropped is replaced transparently.
+    """
+
+    def __init__(self, size: int, idle_check_seconds: int) -> None:
+        self._idle = queue.LifoQueue(maxsize=size)
+        self._idle_check_seconds = idle_check_seconds
+
+    @staticmethod
+    def _connect() -> smtplib.SMTP:
+        smtp = smtplib.SMTP(settings.SMTP_HOST, int(settings.SMTP_PORT), timeout=30)
+        if settings.SMTP_TLS:
+            smtp.starttls()
+        if settings.SMTP_USER:
+            smtp.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+        return smtp
+
+    @staticmethod
+    def _close(connection: _PooledConnection) -> None:
+        try:
+            connection.smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.smtp.close()
+
+    def _checkout(self) -> _PooledConnection:
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                return _PooledConnection(self._connect())
+
+            if time.monotonic() - connection.last_used < self._idle_check_seconds:
+                return connection
+            try:
+                if connection.smtp.noop()[0] == 250:
+                    return connection
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close(connection)
+
+    def _checkin(self, connection: _PooledConnection) -> None:
+        connection.last_used = time.monotonic()
+        try:
+            self._idle.put_nowait(connection)
+        except queue.Full:
+            self._close(connection)
+
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        connection = self._checkout()
+        try:
+            yield connection.smtp
+        except (smtplib.SMTPServerDisconnected, OSError):
+            self._close(connection)
+            raise
+        except BaseException:
+            # Після помилки посеред транзакції стан з'єднання невідомий — скидаємо його.
+            try:
+                connection.smtp.rset()
+            except (smtplib.SMTPException, OSError):
+                self._close(connection)
+                raise
+            self._checkin(connection)
+            raise
+        else:
+            self._checkin(connection)
+
+    def send(self, message: EmailMessage) -> None:
+        try:
+            with self.connection() as smtp:
+                smtp.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            # The pooled connection went stale between the check and the send; retry once on a fresh one.
+            with self.connection() as smtp:
+                smtp.send_message(message)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._close(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+
+_pool: Optional[SMTPConnectionPool] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def get_smtp_pool() -> SMTPConnectionPool:
+    """The SMTP pool of the current process; forked Celery workers each open their own connections."""
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = SMTPConnectionPool(
+                size=settings.EMAIL_SMTP_POOL_SIZE, idle_check_seconds=settings.EMAIL_SMTP_IDLE_CHECK_SECONDS
+            )
+            _pool_pid = os.getpid()
+        return _pool
+
+
+def close_smtp_pool() -> None:
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.close()
+
+
+def build_message(email_to: str, subject: str, html: str) -> EmailMessage:
+    message = EmailMessage()
+    message["Subject"] = subject
+    message["From"] = formataddr((settings.EMAILS_FROM_NAME, settings.EMAILS_FROM_EMAIL))
+    message["To"] = email_to
+    message.set_content(html, subtype="html")
+    return message
+
+
+def deliver(email_to: str, subject: str, html: str) -> None:
+    try:
+        get_smtp_pool().send(build_message(email_to, subject, html))
+    except (smtplib.SMTPException, OSError) as e:
+        logging.error(f"Sending email to {email_to} failed: {e}")
+        raise
+    logging.info(f"Email sent to {email_to}: {subject}")
@@ -1,15 +1,35 @@
+import hashlib
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional, Tuple, TypeVar
 
+from cachetools import LRUCache
 from fastapi import HTTPException
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 
 from src.main.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+
+T = TypeVar("T")
 
 ALGORITHM = settings.TOKEN_ALGORITHM
 
+# Claims of already verified tokens keyed by (secret, sha256(token)), so hot clients
+# skip the signature check and JSON parsing; entries are honoured only until "exp".
+_verified_tokens = LRUCache(maxsize=settings.TOKEN_CACHE_MAXSIZE)
+_verified_tokens_lock = threading.Lock()
+
+# bcrypt holds a CPU for the whole hash, so it runs in worker processes; the semaphore
+# bounds how many operations may wait for them instead of letting a login storm queue up.
+_password_pool: Optional[ProcessPoolExecutor] = None
+_password_pool_lock = threading.Lock()
+_password_slots = threading.BoundedSemaphore(max(settings.PASSWORD_HASH_MAX_PENDING, 1))
+
 
 def create_token(
         secret_key: str, expire: datetime, sub: str, email: str
@@ -56,19 +76,20 @@ def create_activation_token(user_id: int, user_email: str) -> str:
 
 
 def decode_token(token: str, secret_key: str) -> dict[str, str]:
+    cache_key = (secret_key, hashlib.sha256(token.encode()).digest())
+    with _verified_tokens_lock:
+        cached_token = _verified_tokens.get(cache_key)
+    if cached_token is not None:
+        if cached_token["exp"] >= time.time():
+            return dict(cached_token)
+        with _verified_tokens_lock:
+            _verified_tokens.pop(cache_key, None)
+        raise HTTPException(status_code=401, detail="Token has expired")
+
     try:
         decoded_token = jwt.decode(
             token=token, key=secret_key, algorithms=[ALGORITHM]
         )
-        exp_datetime = datetime.fromtimestamp(
-            decoded_token["exp"], timezone.utc
-        )
-        print(exp_datetime)
-        return (
-            decoded_token
-            if exp_datetime >= datetime.now(timezone.utc)
-            else None
-        )
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token has expired")
     except JWTError as e:
@@ -77,6 +98,16 @@ def decode_token(token: str, secret_key: str) -> dict[str, str]:
             status_code=401, detail="Could not validate credentials"
         )
 
+    exp_datetime = datetime.fromtimestamp(
+        decoded_token["exp"], timezone.utc
+    )
+    if exp_datetime < datetime.now(timezone.utc):
+        return None
+
+    with _verified_tokens_lock:
+        _verified_tokens[cache_key] = decoded_token
+    return dict(decoded_token)
+
 
 def decode_access_token(token: str) -> dict[str, str]:
     return decode_token(token=token, secret_key=settings.JWT_SECRET_KEY)
@@ -92,9 +123,57 @@ def decode_activation_token(token: str) -> dict[str, str]:
     return decode_token(token=token, secret_key=settings.ACTIVATION_SECRET_KEY)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def _get_password_pool() -> ProcessPoolExecutor:
+    global _password_pool
+    with _password_pool_lock:
+        if _password_pool is None:
+            # spawn, not fork: the server process already runs threads.
+            _password_pool = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _password_pool
+
+
+def _run_password_task(func: Callable[..., T], *args) -> T:
+    if settings.PASSWORD_HASH_WORKERS <= 0:
+        return func(*args)
+
+    if not _password_slots.acquire(blocking=False):
+        raise HTTPException(
+            status_code=503, detail="Too many concurrent sign-ins, try again later", headers={"Retry-After": "1"}
+        )
+    try:
+        future = _get_password_pool().submit(func, *args)
+    except BaseException:
+        _password_slots.release()
+        raise
+    future.add_done_callback(lambda _: _password_slots.release())
+    return future.result()
+
+
+def _hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def _verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return _run_password_task(_verify_password, plain_password, hashed_password)
+
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verifies the password and, when the hash uses outdated settings (e.g. another BCRYPT_ROUNDS),
+    also returns a new hash of it; the second item is None otherwise.
+    """
+    return _run_password_task(_verify_and_update_password, plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return _run_password_task(_hash_password, password)
@@ -1,13 +1,39 @@
+import json
 import logging
 
-from pathlib import Path
-from typing import Any, Dict
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
 from src.main.celery import celery_app
 
-import emails
-from emails.template import JinjaTemplate
+import redis
+from celery.signals import worker_process_shutdown
 
 from src.main.config import settings
+from src.main.mailer import compile_template, deliver, render_template, close_smtp_pool
+
+DIGEST_KEY = "email:digest:{email}"
+DIGEST_SCHEDULED_KEY = "email:digest:{email}:scheduled"
+# Tasks published by the outbox relay carry this task id prefix; a redelivered one is dropped.
+OUTBOX_TASK_ID_PREFIX = "outbox-"
+DELIVERED_KEY = "email:delivered:{task_id}"
+DELIVERED_TTL_SECONDS = 7 * 24 * 3600
+# Failed sends are retried with exponential backoff; the outbox row is already gone by then.
+SEND_RETRY_OPTIONS = dict(autoretry_for=(Exception,), retry_backoff=True, max_retries=settings.EMAIL_SEND_MAX_RETRIES)
+
+_digest_redis: Optional[redis.Redis] = None
+
+
+def _get_digest_redis() -> redis.Redis:
+    global _digest_redis
+    if _digest_redis is None:
+        _digest_redis = redis.Redis.from_url(settings.EMAIL_DIGEST_REDIS_URL or settings.BROKER_URL)
+    return _digest_redis
+
+
+@worker_process_shutdown.connect
+def _close_smtp_connections(**kwargs) -> None:
+    close_smtp_pool()
 
 
 def send_email(
@@ -19,48 +45,153 @@ def send_email(
     assert (
         settings.EMAILS_ENABLED
     ), "no provided configuration for email variables"
-    message = emails.Message(
-        subject=JinjaTemplate(subject_template),
-        html=JinjaTemplate(html_template),
-        mail_from=(settings.EMAILS_FROM_NAME, settings.EMAILS_FROM_EMAIL),
-    )
-    smtp_options = {"host": settings.SMTP_HOST, "port": settings.SMTP_PORT}
-    if settings.SMTP_TLS:
-        smtp_options["tls"] = True
-    if settings.SMTP_USER:
-        smtp_options["user"] = settings.SMTP_USER
-    if settings.SMTP_PASSWORD:
-        smtp_options["password"] = settings.SMTP_PASSWORD
     try:
-        response = message.send(
-            to=email_to, render=environment, smtp=smtp_options
+        deliver(
+            email_to=email_to,
+            subject=compile_template(subject_template).render(**environment),
+            html=compile_template(html_template).render(**environment),
         )
     except Exception as e:
         logging.info(f"ERROR: {e}")
-    logging.info(f"send email result: {response}")
 
 
-@celery_app.task
-def send_status_change_email(email_to, task_title, old_status, new_status, due_date):
+def _claim_delivery(task_id: Optional[str]) -> bool:
+    """
+    False if a task with this outbox id was already handled (the relay may publish a message twice).
+
+    The claim is released when the task fails, so its retry claims it again. Once the changes are
+    queued, the digest task owns them and retries a failed send itself.
+    """
+    if not task_id or not task_id.startswith(OUTBOX_TASK_ID_PREFIX):
+        return True
+    return bool(_get_digest_redis().set(DELIVERED_KEY.format(task_id=task_id), 1, nx=True, ex=DELIVERED_TTL_SECONDS))
+
+
+def _release_delivery(task_id: Optional[str]) -> None:
+    """Drops the claim of a task that failed, so a redelivery of its outbox message is handled again."""
+    if task_id and task_id.startswith(OUTBOX_TASK_ID_PREFIX):
+        _get_digest_redis().delete(DELIVERED_KEY.format(task_id=task_id))
+
+
+def _status_change(email_to, task_title, old_status, new_status, due_date) -> Dict[str, Any]:
+    if isinstance(due_date, str):
+        due_date = datetime.fromisoformat(due_date)
+    if isinstance(due_date, date):
+        due_date = due_date.strftime('%Y-%m-%d')
+    return {
+        "email": email_to,
+        "task_title": task_title,
+        "old_status": old_status,
+        "new_status": new_status,
+        "due_date": due_date or 'No due date',
+    }
+
+
+def _send_status_changes(email_to: str, changes: List[Dict[str, Any]]) -> None:
+    assert (
+        settings.EMAILS_ENABLED
+    ), "no provided configuration for email variables"
     project_name = settings.PROJECT_NAME
-    subject = f"{project_name} - Task Status Update: {task_title}"
-
-    with open(Path(settings.EMAIL_TEMPLATES_DIR) / "task_status_change_email.html") as f:
-        template_str = f.read()
-
-    send_email(
-        email_to=email_to,
-        subject_template=subject,
-        html_template=template_str,
-        environment={
-            "project_name": project_name,
-            "email": email_to,
-            "task_title": task_title,
-            "old_status": old_status,
-            "new_status": new_status,
-            "due_date": due_date.strftime('%Y-%m-%d') if due_date else 'No due date'
-        },
-    )
+    if len(changes) == 1:
+        subject = f"{project_name} - Task Status Update: {changes[0]['task_title']}"
+        html = render_template(
+            "task_status_change_email.html", {"project_name": project_name, **changes[0]}
+        )
+    else:
+        subject = f"{project_name} - {len(changes)} Task Status Updates"
+        html = render_template(
+            "task_status_digest_email.html", {"project_name": project_name, "email": email_to, "changes": changes}
+        )
+
+    try:
+        deliver(email_to=email_to, subject=subject, html=html)
+    except Exception as e:
+        # Піднімаємо далі: задача повторить надсилання, а зміни лишаються в черзі.
+        logging.error(f"Sending {len(changes)} status change(s) to {email_to} failed: {e}")
+        raise
+
+
+def _schedule_digest(email_to: str) -> None:
+    window = settings.EMAIL_DIGEST_WINDOW_SECONDS
+    # Лише перша зміна у вікні планує доставку, решта просто додається до дайджесту.
+    if _get_digest_redis().set(DIGEST_SCHEDULED_KEY.format(email=email_to), 1, nx=True, ex=window * 2):
+        send_status_digest.apply_async(args=[email_to], countdown=window)
+
+
+def queue_status_changes(notifications: List[Dict[str, Any]]) -> None:
+    """
+    Groups status changes by recipient and holds them for EMAIL_DIGEST_WINDOW_SECONDS,
+    so a burst of moves reaches each recipient as one digest email.
+    """
+    changes_by_email = defaultdict(list)
+    for notification in notifications:
+        changes_by_email[notification["email_to"]].append(_status_change(**notification))
+
+    window = settings.EMAIL_DIGEST_WINDOW_SECONDS
+    if window <= 0:
+        for email_to, changes in changes_by_email.items():
+            _send_status_changes(email_to, changes)
+        return
+
+    client = _get_digest_redis()
+    for email_to, changes in changes_by_email.items():
+        pipe = client.pipeline()
+        pipe.rpush(DIGEST_KEY.format(email=email_to), *(json.dumps(change) for change in changes))
+        pipe.expire(DIGEST_KEY.format(email=email_to), window * 10)
+        pipe.execute()
+        _schedule_digest(email_to)
+
+
+@celery_app.task(acks_late=True, **SEND_RETRY_OPTIONS)
+def send_status_digest(email_to: str) -> None:
+    """
+    Sends every status change collected for the recipient since the digest was scheduled.
+
+    The changes are removed from Redis only after the email went out, so a failed send is retried
+    with the same changes and a crashed worker leaves them for the next digest.
+    """
+    client = _get_digest_redis()
+    pending = client.lrange(DIGEST_KEY.format(email=email_to), 0, -1)
+    if pending:
+        _send_status_changes(email_to, [json.loads(change) for change in pending])
+
+    # Прибираємо лише прочитані зміни: додані під час надсилання йдуть наступним дайджестом.
+    pipe = client.pipeline()
+    pipe.ltrim(DIGEST_KEY.format(email=email_to), len(pending), -1)
+    pipe.delete(DIGEST_SCHEDULED_KEY.format(email=email_to))
+    pipe.llen(DIGEST_KEY.format(email=email_to))
+    _, _, remaining = pipe.execute()
+    if remaining:
+        _schedule_digest(email_to)
+
+
+@celery_app.task(bind=True, **SEND_RETRY_OPTIONS)
+def send_status_change_email(self, email_to, task_title, old_status, new_status, due_date):
+    if not _claim_delivery(self.request.id):
+        return
+    try:
+        queue_status_changes([dict(
+            email_to=email_to,
+            task_title=task_title,
+            old_status=old_status,
+            new_status=new_status,
+            due_date=due_date
+        )])
+    except Exception:
+        _release_delivery(self.request.id)
+        raise
+
+
+@celery_app.task(bind=True, **SEND_RETRY_OPTIONS)
+def send_status_change_emails(self, notifications: List[Dict[str, Any]]) -> None:
+    """Sends the status change emails of a batch card update, enqueued as a single task."""
+    if not _claim_delivery(self.request.id):
+        return
+    try:
+        queue_status_changes(notifications)
+    except Exception:
+        _release_delivery(self.request.id)
+        raise
 
 
 def mock_send_status_change_email(
@@ -73,4 +204,3 @@ def mock_send_status_change_email(
     print(f"Mock email sent to {email_to}")
     print(f"Subject: Status Change Notification for '{task_title}'")
     print(f"Body: The status has changed from {old_status} to {new_status}. Due date: {due_date}.")
-
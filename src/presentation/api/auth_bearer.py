@@ -33,20 +33,23 @@ class JWTBearer(HTTPBearer):
                 detail="Invalid authentication scheme.",
             )
 
-        if not self.verify_jwt(credentials.credentials):
+        payload = self.verify_jwt(credentials.credentials)
+        if not payload:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Invalid token or expired token.",
             )
 
+        # Downstream dependencies read the claims from here instead of decoding the token again.
+        request.state.token_claims = payload
+
         return credentials.credentials
 
-    def verify_jwt(self, jwt_token: str) -> bool:
+    def verify_jwt(self, jwt_token: str) -> Optional[dict]:
         """
-        Verifies the JWT token and returns True if valid, otherwise False.
+        Verifies the JWT token and returns its claims if valid, otherwise None.
         """
         try:
-            payload = decode_access_token(jwt_token)
-            return bool(payload)
+            return decode_access_token(jwt_token)
         except Exception as e:
-            return False
+            return None
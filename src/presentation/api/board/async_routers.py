@@ -0,0 +1,70 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from starlette import status
+
+from src.adapters.repositories.board import AsyncBoardRepository
+from src.adapters.schemas.board import BoardResponse, BoardExternalResponse
+from src.adapters.schemas.pagination import Cursor, NEXT_CURSOR_HEADER, next_cursor
+from src.adapters.sqlalchemy.models import User
+from src.adapters.sqlalchemy.models.user import UserType
+from src.presentation.api.conditional import weak_etag, etag_matches, not_modified
+from src.presentation.api.serialization import json_rows_response
+from src.presentation.dependencies.base import get_cursor
+from src.presentation.dependencies.board import get_async_board_repo
+from src.presentation.dependencies.user import get_current_active_user_async
+
+router = APIRouter()
+
+
+@router.get("/public", response_model=List[BoardResponse])
+async def read_public_boards_async(
+        *,
+        board_repo: AsyncBoardRepository = Depends(get_async_board_repo),
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Cursor] = Depends(get_cursor),
+        current_user: User = Depends(get_current_active_user_async)
+):
+    """
+    Retrieve public boards response.
+    """
+    boards = await board_repo.get_list_of_public_boards(skip=skip, limit=limit, after=after)
+    cursor = next_cursor(boards, limit)
+    return json_rows_response(boards, BoardResponse, headers={NEXT_CURSOR_HEADER: cursor} if cursor else None)
+
+
+@router.get("/{board_id}", response_model=BoardExternalResponse)
+async def read_board_by_id_async(
+    request: Request,
+    response: Response,
+    board_id: int,
+    board_repo: AsyncBoardRepository = Depends(get_async_board_repo),
+    current_user: User = Depends(get_current_active_user_async)
+):
+    """
+    Read a board by id.
+    """
+    summary = await board_repo.get_board_summary(board_id=board_id, user_id=current_user.id)
+    if not summary:
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    board = summary.Board
+    if not board.is_public:
+        if board.owner_id != current_user.id and current_user.type != UserType.admin:
+            if not summary.is_member:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="You do not have permission to view this board"
+                )
+
+    etag = weak_etag("board", board.id, summary.version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
+    return BoardExternalResponse(
+        board_detail=BoardResponse.model_validate(board),
+        lists=summary.lists_count,
+        members=summary.members_count
+    )
@@ -1,48 +1,63 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from starlette import status
 from starlette.status import HTTP_204_NO_CONTENT
 
-from src.adapters.schemas.board import BoardCreate, BoardResponse, BoardExternalResponse, BoardUpdate
+from src.adapters.schemas.board import (
+    BoardCreate, BoardResponse, BoardExternalResponse, BoardUpdate, BoardSnapshotResponse, SnapshotList, SnapshotCard
+)
+from src.adapters.schemas.pagination import Cursor, NEXT_CURSOR_HEADER, next_cursor
 from src.adapters.schemas.user import UserResponse
 from src.adapters.sqlalchemy.models import User, Board
-from src.adapters.sqlalchemy.models.user import UserType
+from src.application.board.board_export import export_chunks
 from src.application.board.board_service import BoardFilter, BoardService
-from src.presentation.dependencies.base import get_db
+from src.presentation.api.conditional import weak_etag, etag_matches, not_modified
+from src.presentation.api.serialization import json_rows_response
+from src.presentation.dependencies.base import get_db, get_cursor
 from src.presentation.dependencies.board import get_board_service, get_board
 from src.presentation.dependencies.user import get_current_active_superuser, get_current_active_user, get_user
 
 router = APIRouter()
 
 
-@router.get("/")
+@router.get("/", response_model=List[BoardResponse])
 def read_all_boards(
         filters: BoardFilter = Depends(),
         db: Session = Depends(get_db),
         skip: int = 0,
         limit: int = 100,
+        after: Optional[Cursor] = Depends(get_cursor),
         current_superuser: User = Depends(get_current_active_superuser)
 ):
     """
     Retrieve paginated boards response.
     """
-    return filters.filter_boards(db, skip, limit)
+    boards = filters.filter_boards(db, skip, limit, after=after)
+    if not isinstance(boards, list):
+        return boards
 
+    cursor = next_cursor(boards, limit)
+    return json_rows_response(boards, BoardResponse, headers={NEXT_CURSOR_HEADER: cursor} if cursor else None)
 
-@router.get("/public")
+
+@router.get("/public", response_model=List[BoardResponse])
 def read_public_boards(
         *,
         board_service: BoardService = Depends(get_board_service),
         skip: int = 0,
         limit: int = 100,
+        after: Optional[Cursor] = Depends(get_cursor),
         current_user: User = Depends(get_current_active_user)
 ):
     """
     Retrieve public boards response.
     """
-    return board_service.get_public_boards(skip=skip, limit=limit)
+    boards = board_service.get_public_boards(skip=skip, limit=limit, after=after)
+    cursor = next_cursor(boards, limit)
+    return json_rows_response(boards, BoardResponse, headers={NEXT_CURSOR_HEADER: cursor} if cursor else None)
 
 
 @router.get("/user/{user_id}", response_model=List[BoardResponse])
@@ -53,28 +68,28 @@ def read_user_boards(
     """
     Read user boards by user_id.
     """
-    return user.boards_owner
+    return json_rows_response(user.boards_owner, BoardResponse)
 
 
 @router.get("/{board_id}", response_model=BoardExternalResponse)
 def read_board_by_id(
-    board: Board = Depends(get_board),
+    request: Request,
+    response: Response,
+    board_id: int,
     board_service: BoardService = Depends(get_board_service),
     current_user: User = Depends(get_current_active_user)
 ):
     """
-    Read a post by id.
+    Read a board by id.
     """
-    count_of_lists = board_service.get_count_of_board_lists(board.id)
-    count_of_members = board_service.get_count_of_board_members(board.id)
+    # One uncached statement: the board, its counts, the membership for the 403 and the version for the ETag.
+    summary = board_service.get_board_summary(board_id=board_id, current_user=current_user)
+    etag = weak_etag("board", board_id, summary.version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
 
-    if not board.is_public:
-        if board.owner_id != current_user.id and current_user.type != UserType.admin:
-            if not board_service.is_user_member_of_board(board, current_user):
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="You do not have permission to view this board"
-                )
+    board = summary.Board
 
     board_detail = BoardResponse(
         id=board.id,
@@ -86,8 +101,69 @@ def read_board_by_id(
     )
     return BoardExternalResponse(
         board_detail=board_detail,
-        lists=count_of_lists,
-        members=count_of_members
+        lists=summary.lists_count,
+        members=summary.members_count
+    )
+
+
+@router.get("/{board_id}/snapshot", response_model=BoardSnapshotResponse)
+def read_board_snapshot(
+    board: Board = Depends(get_board),
+    board_service: BoardService = Depends(get_board_service),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Read a board with all its lists, cards, card performers and card counts.
+    """
+    lists = board_service.get_board_snapshot(board=board, current_user=current_user)
+
+    return BoardSnapshotResponse(
+        board_detail=BoardResponse.model_validate(board),
+        lists=[
+            SnapshotList(
+                id=lst.id,
+                name=lst.name,
+                position=index,
+                cards=[
+                    SnapshotCard(
+                        id=card.id,
+                        title=card.title,
+                        description=card.description,
+                        priority=card.priority.value if card.priority else None,
+                        responsible_person_id=card.responsible_person_id,
+                        position=card.position,
+                        due_date=card.due_date,
+                        reminder_datetime=card.reminder_datetime,
+                        performer_ids=[performer.id for performer in card.performers],
+                        comments_count=card.comments_count,
+                        checklists_count=card.checklists_count,
+                        attachments_count=card.attachments_count
+                    )
+                    for card in sorted(lst.cards, key=lambda card: (card.position, card.id))
+                ]
+            )
+            for index, lst in enumerate(lists, start=1)
+        ]
+    )
+
+
+@router.get("/{board_id}/export", response_class=StreamingResponse)
+def export_board(
+    compress: bool = False,
+    board: Board = Depends(get_board),
+    board_service: BoardService = Depends(get_board_service),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Stream a board with its lists, cards, performers, comments, checklists and activities as NDJSON.
+    """
+    board_service.check_can_view_board(board, current_user)
+
+    filename = f"board-{board.id}.ndjson" + (".gz" if compress else "")
+    return StreamingResponse(
+        export_chunks(board_ids=[board.id], compress=compress),
+        media_type="application/gzip" if compress else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
 
@@ -0,0 +1,34 @@
+from typing import List as ListType
+
+from fastapi import APIRouter, Depends, Request
+
+from src.adapters.repositories.card.card import AsyncCardRepository
+from src.adapters.schemas.card import CardResponse
+from src.adapters.sqlalchemy.models import Board, User, List
+from src.presentation.api.conditional import weak_etag, etag_matches, not_modified
+from src.presentation.api.serialization import json_rows_response
+from src.presentation.dependencies.board import get_board_async
+from src.presentation.dependencies.card import get_async_card_repo
+from src.presentation.dependencies.list import get_list_async
+from src.presentation.dependencies.user import get_current_active_user_async
+
+router = APIRouter()
+
+
+@router.get("/{board_id}/lists/{list_id}/cards", response_model=ListType[CardResponse])
+async def read_all_cards_async(
+    request: Request,
+    board: Board = Depends(get_board_async),
+    list: List = Depends(get_list_async),
+    card_repo: AsyncCardRepository = Depends(get_async_card_repo),
+    current_user: User = Depends(get_current_active_user_async)
+):
+    """
+    Retrieve cards by list_id.
+    """
+    etag = weak_etag("cards", list.id, board.version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    cards = await card_repo.get_cards(list_id=list.id)
+    return json_rows_response(cards, CardResponse, headers={"ETag": etag})
@@ -1,12 +1,19 @@
-from typing import List as ListType
+from typing import List as ListType, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 from starlette.status import HTTP_204_NO_CONTENT
 
-from src.adapters.schemas.card import CardUpdate, CardResponse, CardCreate, CardExternalResponse
+from src.adapters.schemas.card import (
+    CardUpdate, CardResponse, CardCreate, CardExternalResponse, CardBatchCreate, CardBatchUpdate, CardMove,
+    CardActivityResponse
+)
+from src.adapters.schemas.pagination import Cursor, NEXT_CURSOR_HEADER, next_cursor
 from src.adapters.schemas.user import UserResponse, UserShortResponse
 from src.adapters.sqlalchemy.models import Board, User, List, Card
 from src.application.card.card_service import CardService
+from src.presentation.api.conditional import weak_etag, etag_matches, not_modified
+from src.presentation.api.serialization import json_rows_response
+from src.presentation.dependencies.base import get_before_cursor
 from src.presentation.dependencies.board import get_board
 from src.presentation.dependencies.card import get_card, get_card_service
 from src.presentation.dependencies.list import get_list
@@ -15,8 +22,9 @@ from src.presentation.dependencies.user import get_current_active_user, get_user
 router = APIRouter()
 
 
-@router.get("/{board_id}/lists/{list_id}/cards")
+@router.get("/{board_id}/lists/{list_id}/cards", response_model=ListType[CardResponse])
 def read_all_cards(
+    request: Request,
     board: Board = Depends(get_board),
     list: List = Depends(get_list),
     card_service: CardService = Depends(get_card_service),
@@ -25,12 +33,18 @@ def read_all_cards(
     """
     Retrieve cards by list_id.
     """
-    lists = card_service.get_cards_by_list(list_id=list.id)
-    return lists
+    etag = weak_etag("cards", list.id, board.version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    cards = card_service.get_cards_by_list(list_id=list.id, board_id=board.id)
+    return json_rows_response(cards, CardResponse, headers={"ETag": etag})
 
 
 @router.get("/{board_id}/lists/{list_id}/cards/{card_id}", response_model=CardExternalResponse)
 def read_card_by_id(
+    request: Request,
+    response: Response,
     board: Board = Depends(get_board),
     list: List = Depends(get_list),
     card: Card = Depends(get_card),
@@ -39,6 +53,12 @@ def read_card_by_id(
     """
     Read a card by id.
     """
+    # Зміни картки, її виконавців і лічильників підвищують версію дошки тригерами.
+    etag = weak_etag("card", card.id, board.version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
     return CardExternalResponse(
         card_detail=CardResponse(
             id=card.id,
@@ -47,6 +67,7 @@ def read_card_by_id(
             priority=card.priority,
             responsible_person_id=card.responsible_person_id,
             list_id=card.list_id,
+            position=card.position,
             due_date=card.due_date,
             reminder_datetime=card.reminder_datetime,
             created_at=card.created_at,
@@ -61,10 +82,10 @@ def read_card_by_id(
                 is_active=performer.is_active
             ) for performer in card.performers
         ],
-        performers_count=len(card.performers),
-        comments_count=len(card.comments),
-        attachments_count=len(card.attachments),
-        checklists_count=len(card.check_lists),
+        performers_count=card.performers_count,
+        comments_count=card.comments_count,
+        attachments_count=card.attachments_count,
+        checklists_count=card.checklists_count,
     )
 
 
@@ -88,6 +109,7 @@ def create_card(
         priority=card.priority,
         responsible_person_id=card.responsible_person_id,
         list_id=card.list_id,
+        position=card.position,
         due_date=card.due_date,
         reminder_datetime=card.reminder_datetime,
         created_at=card.created_at,
@@ -95,6 +117,32 @@ def create_card(
     )
 
 
+@router.post("/{board_id}/cards:batch", response_model=ListType[CardResponse])
+def create_cards_batch(
+    cards_in: CardBatchCreate,
+    board: Board = Depends(get_board),
+    card_service: CardService = Depends(get_card_service),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Create many cards of the board in one transaction.
+    """
+    return card_service.create_cards(board=board, obj_in=cards_in, current_user=current_user)
+
+
+@router.patch("/{board_id}/cards:batch", response_model=ListType[CardResponse])
+def update_cards_batch(
+    cards_in: CardBatchUpdate,
+    board: Board = Depends(get_board),
+    card_service: CardService = Depends(get_card_service),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Update or move many cards of the board in one transaction.
+    """
+    return card_service.update_cards(board=board, obj_in=cards_in, current_user=current_user)
+
+
 @router.patch("/{board_id}/lists/{list_id}/cards/{card_id}", response_model=CardResponse)
 def update_card(
         card_in: CardUpdate,
@@ -118,6 +166,7 @@ def update_card(
         priority=updated_card.priority,
         responsible_person_id=updated_card.responsible_person_id,
         list_id=updated_card.list_id,
+        position=updated_card.position,
         due_date=updated_card.due_date,
         reminder_datetime=updated_card.reminder_datetime,
         created_at=updated_card.created_at,
@@ -125,6 +174,21 @@ def update_card(
     )
 
 
+@router.post("/{board_id}/lists/{list_id}/cards/{card_id}/move", response_model=CardResponse)
+def move_card(
+    card_in: CardMove,
+    board: Board = Depends(get_board),
+    list: List = Depends(get_list),
+    card: Card = Depends(get_card),
+    card_service: CardService = Depends(get_card_service),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Move a card to a position (1-based) in the same or another list of the board.
+    """
+    return card_service.move_card(board=board, card=card, obj_in=card_in, current_user=current_user)
+
+
 @router.delete("/{board_id}/lists/{list_id}/cards/{card_id}", status_code=HTTP_204_NO_CONTENT)
 def remove_card(
     board: Board = Depends(get_board),
@@ -139,6 +203,26 @@ def remove_card(
     return card_service.delete_card(board=board, list_id=list.id, card_id=card.id, current_user=current_user)
 
 
+@router.get("/{board_id}/lists/{list_id}/cards/{card_id}/activities", response_model=ListType[CardActivityResponse])
+def read_card_activities(
+    board: Board = Depends(get_board),
+    list: List = Depends(get_list),
+    card: Card = Depends(get_card),
+    limit: int = Query(50, ge=1, le=500),
+    before: Optional[Cursor] = Depends(get_before_cursor),
+    card_service: CardService = Depends(get_card_service),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Card activity, newest first. Pass the X-Next-Cursor header of a page as `before` to get the next one.
+    """
+    activities = card_service.get_activities(board=board, card=card, current_user=current_user, limit=limit, before=before)
+    cursor = next_cursor(activities, limit)
+    return json_rows_response(
+        activities, CardActivityResponse, headers={NEXT_CURSOR_HEADER: cursor} if cursor else None
+    )
+
+
 @router.get("/{board_id}/lists/{list_id}/cards/{card_id}/performers", response_model=ListType[UserResponse])
 def get_performers(
     board: Board = Depends(get_board),
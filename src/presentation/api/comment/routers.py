@@ -0,0 +1,92 @@
+from typing import List as ListType, Optional
+
+from fastapi import APIRouter, Depends, Query
+from starlette.status import HTTP_204_NO_CONTENT
+
+from src.adapters.schemas.comment import CommentCreate, CommentUpdate, CommentResponse, CommentAuthorResponse
+from src.adapters.schemas.pagination import Cursor, NEXT_CURSOR_HEADER, next_cursor
+from src.adapters.sqlalchemy.models import Board, User, List, Card
+from src.adapters.sqlalchemy.models.card import Comment
+from src.application.card.comment_service import CommentService
+from src.presentation.api.serialization import json_response, row_to_dict
+from src.presentation.dependencies.base import get_cursor
+from src.presentation.dependencies.board import get_board
+from src.presentation.dependencies.card import get_card, get_comment, get_comment_service
+from src.presentation.dependencies.list import get_list
+from src.presentation.dependencies.user import get_current_active_user
+
+router = APIRouter()
+
+
+def _comment_row(comment: Comment) -> dict:
+    row = row_to_dict(comment, CommentResponse)
+    row["author"] = row_to_dict(comment.author, CommentAuthorResponse) if comment.author else None
+    return row
+
+
+@router.get("/{board_id}/lists/{list_id}/cards/{card_id}/comments", response_model=ListType[CommentResponse])
+def read_comments(
+    board: Board = Depends(get_board),
+    list: List = Depends(get_list),
+    card: Card = Depends(get_card),
+    limit: int = Query(50, ge=1, le=500),
+    after: Optional[Cursor] = Depends(get_cursor),
+    comment_service: CommentService = Depends(get_comment_service),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Card comments, oldest first. Pass the X-Next-Cursor header of a page as `after` to get the next one.
+    """
+    comments = comment_service.get_comments(board=board, card=card, current_user=current_user, limit=limit, after=after)
+    cursor = next_cursor(comments, limit)
+    return json_response(
+        [_comment_row(comment) for comment in comments], headers={NEXT_CURSOR_HEADER: cursor} if cursor else None
+    )
+
+
+@router.post("/{board_id}/lists/{list_id}/cards/{card_id}/comments", response_model=CommentResponse)
+def create_comment(
+    comment_in: CommentCreate,
+    board: Board = Depends(get_board),
+    list: List = Depends(get_list),
+    card: Card = Depends(get_card),
+    comment_service: CommentService = Depends(get_comment_service),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Comment on a card.
+    """
+    comment = comment_service.create_comment(board=board, card=card, obj_in=comment_in, current_user=current_user)
+    return json_response(_comment_row(comment))
+
+
+@router.patch("/{board_id}/lists/{list_id}/cards/{card_id}/comments/{comment_id}", response_model=CommentResponse)
+def update_comment(
+    comment_in: CommentUpdate,
+    board: Board = Depends(get_board),
+    list: List = Depends(get_list),
+    card: Card = Depends(get_card),
+    comment: Comment = Depends(get_comment),
+    comment_service: CommentService = Depends(get_comment_service),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Edit a comment.
+    """
+    comment = comment_service.update_comment(comment=comment, obj_in=comment_in, current_user=current_user)
+    return json_response(_comment_row(comment))
+
+
+@router.delete("/{board_id}/lists/{list_id}/cards/{card_id}/comments/{comment_id}", status_code=HTTP_204_NO_CONTENT)
+def delete_comment(
+    board: Board = Depends(get_board),
+    list: List = Depends(get_list),
+    card: Card = Depends(get_card),
+    comment: Comment = Depends(get_comment),
+    comment_service: CommentService = Depends(get_comment_service),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Delete a comment.
+    """
+    comment_service.delete_comment(board=board, comment=comment, current_user=current_user)
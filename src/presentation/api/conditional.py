@@ -0,0 +1,27 @@
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response
+from starlette.status import HTTP_304_NOT_MODIFIED
+
+
+def weak_etag(*parts: Any) -> str:
+    """Weak ETag from the values that change whenever the representation does (ids, versions, timestamps)."""
+    digest = hashlib.sha1(":".join(str(part) for part in parts).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of ``etag`` against the request's If-None-Match header."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+
+    opaque_tag = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque_tag for candidate in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -0,0 +1,128 @@
+import os
+from typing import Optional
+from uuid import uuid4
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from starlette import status
+from starlette.concurrency import run_in_threadpool
+
+from src.adapters.cache.board import board_cache
+from src.adapters.repositories.board_import import BoardImportRepository
+from src.adapters.schemas.board import ImportJobResponse
+from src.adapters.sqlalchemy.db.pool_metrics import pool_status
+from src.adapters.sqlalchemy.db.session import engine, async_engine
+from src.adapters.sqlalchemy.models import User, ImportJob
+from src.adapters.sqlalchemy.models.board_import import ImportStatus
+from src.application.board.board_export import export_chunks
+from src.application.board.board_import import run_import
+from src.main.config import settings
+from src.presentation.dependencies.board import get_board_import_repo
+from src.presentation.dependencies.user import get_current_active_superuser
+
+router = APIRouter()
+
+
+@router.get("/pool")
+def read_pool_metrics(
+        current_superuser: User = Depends(get_current_active_superuser)
+) -> dict:
+    """
+    Report connection pool occupancy and the checkout wait-time histograms.
+    """
+    return {
+        "sync": pool_status(engine.pool),
+        "async": pool_status(async_engine.sync_engine.pool),
+    }
+
+
+@router.get("/cache")
+def read_cache_metrics(
+        current_superuser: User = Depends(get_current_active_superuser)
+) -> dict:
+    """
+    Report board cache hit/miss counters per cached read and the number of invalidations.
+    """
+    return {"enabled": board_cache.enabled, **board_cache.metrics.snapshot()}
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_workspace(
+        owner_id: Optional[int] = None,
+        compress: bool = False,
+        current_superuser: User = Depends(get_current_active_superuser)
+):
+    """
+    Stream every board (or every board of one owner) with all its data as NDJSON.
+    """
+    filename = (f"boards-owner-{owner_id}" if owner_id is not None else "boards") + ".ndjson"
+    if compress:
+        filename += ".gz"
+    return StreamingResponse(
+        export_chunks(owner_id=owner_id, compress=compress),
+        media_type="application/gzip" if compress else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+def get_import_job(
+        job_id: int,
+        import_repo: BoardImportRepository = Depends(get_board_import_repo)
+) -> ImportJob:
+    job = import_repo.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+
+    return job
+
+
+@router.post("/imports", response_model=ImportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_import(
+        request: Request,
+        background_tasks: BackgroundTasks,
+        import_repo: BoardImportRepository = Depends(get_board_import_repo),
+        current_superuser: User = Depends(get_current_active_superuser)
+):
+    """
+    Upload an NDJSON board export (plain or gzip) and load it in the background.
+    Users referenced by the export that do not exist here are replaced with the uploader.
+    """
+    os.makedirs(settings.IMPORT_DIR, exist_ok=True)
+    source_path = os.path.join(settings.IMPORT_DIR, f"{uuid4().hex}.ndjson")
+    # Тіло запиту пишемо у файл частинами, не тримаючи весь експорт у пам'яті.
+    with open(source_path, "wb") as f:
+        async for chunk in request.stream():
+            await run_in_threadpool(f.write, chunk)
+
+    job = await run_in_threadpool(import_repo.create_job, source_path, current_superuser.id)
+    background_tasks.add_task(run_import, job.id)
+
+    return job
+
+
+@router.get("/imports/{job_id}", response_model=ImportJobResponse)
+def read_import(
+        job: ImportJob = Depends(get_import_job),
+        current_superuser: User = Depends(get_current_active_superuser)
+):
+    """
+    Report the progress of an import job.
+    """
+    return job
+
+
+@router.post("/imports/{job_id}/resume", response_model=ImportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+def resume_import(
+        background_tasks: BackgroundTasks,
+        job: ImportJob = Depends(get_import_job),
+        current_superuser: User = Depends(get_current_active_superuser)
+):
+    """
+    Continue a failed or interrupted import job after its last committed batch.
+    """
+    if job.status in (ImportStatus.running, ImportStatus.completed):
+        raise HTTPException(status_code=409, detail=f"Import job is {job.status.value.lower()}")
+
+    background_tasks.add_task(run_import, job.id)
+
+    return job
@@ -0,0 +1,48 @@
+from typing import List as ListType
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from starlette import status
+
+from src.adapters.repositories.board import AsyncBoardRepository
+from src.adapters.repositories.list import AsyncListRepository
+from src.adapters.schemas.list import ListResponse
+from src.adapters.sqlalchemy.models import Board, User
+from src.adapters.sqlalchemy.models.user import UserType
+from src.presentation.api.conditional import weak_etag, etag_matches, not_modified
+from src.presentation.api.serialization import json_response, row_to_dict
+from src.presentation.dependencies.board import get_board_async, get_async_board_repo
+from src.presentation.dependencies.list import get_async_list_repo
+from src.presentation.dependencies.user import get_current_active_user_async
+
+router = APIRouter()
+
+
+@router.get("/{board_id}/lists", response_model=ListType[ListResponse])
+async def read_all_lists_async(
+    request: Request,
+    board: Board = Depends(get_board_async),
+    list_repo: AsyncListRepository = Depends(get_async_list_repo),
+    board_repo: AsyncBoardRepository = Depends(get_async_board_repo),
+    current_user: User = Depends(get_current_active_user_async)
+):
+    """
+    Retrieve lists by board_id.
+    """
+    if not board.is_public:
+        if board.owner_id != current_user.id and current_user.type != UserType.admin:
+            if not await board_repo.is_member(board_id=board.id, user_id=current_user.id):
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="You do not have permission to view this board"
+                )
+
+    etag = weak_etag("lists", board.id, board.version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    lists = await list_repo.get_lists_by_board(board_id=board.id)
+    # Списки вже впорядковані, тож місце на дошці - це їх номер у відповіді.
+    return json_response(
+        [dict(row_to_dict(lst, ListResponse), position=index) for index, lst in enumerate(lists, start=1)],
+        headers={"ETag": etag},
+    )
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List as ListType
+
+from fastapi import APIRouter, Depends, HTTPException, Request
 from starlette import status
 from starlette.status import HTTP_204_NO_CONTENT
 
@@ -7,6 +9,8 @@ from src.adapters.sqlalchemy.models import Board, User, List
 from src.adapters.sqlalchemy.models.user import UserType
 from src.application.board.board_service import BoardService
 from src.application.list.list_service import ListService
+from src.presentation.api.conditional import weak_etag, etag_matches, not_modified
+from src.presentation.api.serialization import json_response, row_to_dict
 from src.presentation.dependencies.board import get_board, get_board_service
 from src.presentation.dependencies.list import get_list_service, get_list
 from src.presentation.dependencies.user import get_current_active_user
@@ -14,8 +18,9 @@ from src.presentation.dependencies.user import get_current_active_user
 router = APIRouter()
 
 
-@router.get("/{board_id}/lists")
+@router.get("/{board_id}/lists", response_model=ListType[ListResponse])
 def read_all_lists(
+    request: Request,
     board: Board = Depends(get_board),
     list_service: ListService = Depends(get_list_service),
     board_service: BoardService = Depends(get_board_service),
@@ -32,14 +37,23 @@ def read_all_lists(
                     detail="You do not have permission to view this board"
                 )
 
+    etag = weak_etag("lists", board.id, board.version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     lists = list_service.get_lists_by_board(board_id=board.id)
-    return lists
+    # Списки вже впорядковані, тож місце на дошці - це їх номер у відповіді.
+    return json_response(
+        [dict(row_to_dict(lst, ListResponse), position=index) for index, lst in enumerate(lists, start=1)],
+        headers={"ETag": etag},
+    )
 
 
 @router.get("/{board_id}/lists/{list_id}", response_model=ListExternalResponse)
 def read_list_by_id(
     board: Board = Depends(get_board),
     list: List = Depends(get_list),
+    list_service: ListService = Depends(get_list_service),
     board_service: BoardService = Depends(get_board_service),
     current_user: User = Depends(get_current_active_user)
 ) -> ListExternalResponse:
@@ -57,12 +71,12 @@ def read_list_by_id(
         list_detail=ListResponse(
             id=list.id,
             name=list.name,
-            position=list.position,
+            position=list_service.get_list_index(list),
             board_id=list.board_id,
             created_at=list.created_at,
             updated_at=list.updated_at
         ),
-        cards=len(list.cards)
+        cards=list.cards_count
     )
 
 
@@ -81,7 +95,7 @@ def create_list(
     return ListResponse(
         id=list_obj.id,
         name=list_obj.name,
-        position=list_obj.position,
+        position=list_service.get_list_index(list_obj),
         board_id=list_obj.board_id,
         created_at=list_obj.created_at,
         updated_at=list_obj.updated_at
@@ -106,7 +120,7 @@ def update_list(
     return ListResponse(
         id=updated_list.id,
         name=updated_list.name,
-        position=updated_list.position,
+        position=list_service.get_list_index(updated_list),
         board_id=updated_list.board_id,
         created_at=updated_list.created_at,
         updated_at=updated_list.updated_at
@@ -1,17 +1,30 @@
 from fastapi import APIRouter
+from src.main.config import settings
 from src.presentation.api.auth import routers as auth_routers
-from src.presentation.api.user import routers as user_routers
-from src.presentation.api.board import routers as board_routers
-from src.presentation.api.list import routers as list_routers
-from src.presentation.api.card import routers as card_routers
+from src.presentation.api.user import routers as user_routers, async_routers as user_async_routers
+from src.presentation.api.board import routers as board_routers, async_routers as board_async_routers
+from src.presentation.api.list import routers as list_routers, async_routers as list_async_routers
+from src.presentation.api.card import routers as card_routers, async_routers as card_async_routers
+from src.presentation.api.comment import routers as comment_routers
+from src.presentation.api.internal import routers as internal_routers
 
 api_router = APIRouter()
 
+if settings.DB_ASYNC_MODE:
+    # Async handlers are registered first, so they take precedence over the sync
+    # routes with the same path; every other endpoint keeps running on the sync engine.
+    api_router.include_router(user_async_routers.router, prefix="/users", tags=["user"])
+    api_router.include_router(board_async_routers.router, prefix="/boards", tags=["board"])
+    api_router.include_router(list_async_routers.router, prefix="/boards", tags=["list"])
+    api_router.include_router(card_async_routers.router, prefix="/boards", tags=["card"])
+
 api_router.include_router(auth_routers.router, prefix="/auth", tags=["auth"])
 api_router.include_router(user_routers.router, prefix="/users", tags=["user"])
 api_router.include_router(board_routers.router, prefix="/boards", tags=["board"])
 api_router.include_router(list_routers.router, prefix="/boards", tags=["list"])
 api_router.include_router(card_routers.router, prefix="/boards", tags=["card"])
+api_router.include_router(comment_routers.router, prefix="/boards", tags=["comment"])
+api_router.include_router(internal_routers.router, prefix="/internal", tags=["internal"])
 
 
 @api_router.get("/alive")
@@ -0,0 +1,44 @@
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple, Type
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+from sqlalchemy import Row
+
+# Matches the pydantic JSON output: UTC datetimes end in "Z", naive ones stay naive.
+ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+
+@lru_cache(maxsize=None)
+def _fields(schema: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(schema.model_fields)
+
+
+def row_to_dict(row: Any, schema: Type[BaseModel]) -> Dict[str, Any]:
+    """Picks the schema's fields from an ORM object or a Core result row, without validation."""
+    if isinstance(row, Row):
+        mapping = row._mapping
+        return {field: mapping[field] for field in _fields(schema)}
+    return {field: getattr(row, field) for field in _fields(schema)}
+
+
+def json_response(content: Any, headers: Optional[Dict[str, str]] = None, status_code: int = 200) -> Response:
+    return Response(
+        content=orjson.dumps(content, option=ORJSON_OPTIONS),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+def json_rows_response(
+        rows: Iterable[Any], schema: Type[BaseModel], headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Serializes rows straight to JSON bytes in the shape of ``schema``.
+
+    Skips building and validating a pydantic model per row, so use it only for rows that
+    already satisfy the schema (database rows read with the columns it lists).
+    """
+    return json_response([row_to_dict(row, schema) for row in rows], headers=headers)
@@ -0,0 +1,45 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+
+from src.adapters.repositories.user import AsyncUserRepository
+from src.adapters.schemas.pagination import PaginationResponse, Cursor, CountMode, next_cursor
+from src.adapters.schemas.user import UserResponse, UsersListResponse
+from src.adapters.sqlalchemy.models import User
+from src.presentation.api.serialization import json_response, row_to_dict
+from src.presentation.dependencies.base import get_cursor
+from src.presentation.dependencies.user import get_current_active_superuser_async, get_async_user_repo
+
+router = APIRouter()
+
+
+@router.get("/", response_model=UsersListResponse)
+async def read_users_async(
+        skip: int = 0,
+        limit: int = 10,
+        after: Optional[Cursor] = Depends(get_cursor),
+        count: CountMode = CountMode.exact,
+        user_repo: AsyncUserRepository = Depends(get_async_user_repo),
+        current_superuser: User = Depends(get_current_active_superuser_async),
+) -> UsersListResponse:
+    """
+    Retrieve paginated users response.
+    """
+    users = await user_repo.get_users_list(skip=skip, limit=limit, after=after)
+    if count == CountMode.exact:
+        total = await user_repo.get_users_count()
+    elif count == CountMode.approximate:
+        total = await user_repo.get_users_estimated_count()
+    else:
+        total = None
+
+    return json_response({
+        "pagination_detail": PaginationResponse(
+            skip=skip,
+            limit=limit,
+            total=total,
+            total_is_approximate=count == CountMode.approximate,
+            next_cursor=next_cursor(users, limit),
+        ).model_dump(),
+        "users_list": [row_to_dict(user, UserResponse) for user in users],
+    })
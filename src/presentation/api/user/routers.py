@@ -1,11 +1,13 @@
-from typing import Any
+from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 
-from src.adapters.schemas.pagination import Pagination, PaginationResponse
+from src.adapters.schemas.pagination import Pagination, PaginationResponse, Cursor, CountMode, next_cursor
 from src.adapters.schemas.user import UserResponse, UserCreate, UserId, UsersListResponse, UserExtendedData, UserUpdate
 from src.adapters.sqlalchemy.models import User
 from src.application.common.exceptions import UserNotFoundError, UserExistsError, WeakPasswordError
+from src.presentation.api.serialization import json_response, row_to_dict
+from src.presentation.dependencies.base import get_cursor
 from src.presentation.dependencies.user import get_current_active_superuser, get_current_active_user, get_user_service
 from src.application.user.user_service import UserService
 
@@ -16,32 +18,30 @@ router = APIRouter()
 def read_users(
         skip: int = 0,
         limit: int = 10,
+        after: Optional[Cursor] = Depends(get_cursor),
+        count: CountMode = CountMode.exact,
         user_service: UserService = Depends(get_user_service),
         current_superuser: User = Depends(get_current_active_superuser),
 ) -> UsersListResponse:
     """
     Retrieve paginated users response.
+
+    Pass `next_cursor` from the previous page as `after` to page by keyset instead of offset;
+    `count` selects an exact, approximate (planner estimate) or no total.
     """
-    users = user_service.get_users_list(Pagination(skip=skip, limit=limit))
-    total = user_service.user_repo.get_users_count()
-
-    return UsersListResponse(
-        pagination_detail=PaginationResponse(
-            skip=skip, limit=limit, total=total
-        ),
-        users_list=[
-            UserResponse(
-                id=user.id,
-                username=user.username,
-                email=user.email,
-                is_active=user.is_active,
-                type=user.type,
-                created_at=user.created_at,
-                updated_at=user.updated_at
-            )
-            for user in users
-        ]
-    )
+    users = user_service.get_users_list(Pagination(skip=skip, limit=limit), after=after)
+    total = user_service.get_users_total(count)
+
+    return json_response({
+        "pagination_detail": PaginationResponse(
+            skip=skip,
+            limit=limit,
+            total=total,
+            total_is_approximate=count == CountMode.approximate,
+            next_cursor=next_cursor(users, limit),
+        ).model_dump(),
+        "users_list": [row_to_dict(user, UserResponse) for user in users],
+    })
 
 
 @router.get("/{user_id}", response_model=UserResponse)
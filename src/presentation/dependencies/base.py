@@ -1,7 +1,8 @@
-from typing import Generator
-from fastapi import Query
+from typing import Generator, AsyncGenerator, Optional
+from fastapi import Query, HTTPException
 
-from src.adapters.sqlalchemy.db.session import SessionLocal
+from src.adapters.schemas.pagination import Cursor, decode_cursor
+from src.adapters.sqlalchemy.db.session import SessionLocal, AsyncSessionLocal
 
 
 def get_db() -> Generator:
@@ -12,7 +13,31 @@ def get_db() -> Generator:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def get_pagination_params(
         skip: int = Query(0, ge=0), limit: int = Query(10, gt=0)
 ):
     return {"skip": skip, "limit": limit}
+
+
+def _parse_cursor(value: Optional[str]) -> Optional[Cursor]:
+    if value is None:
+        return None
+    try:
+        return decode_cursor(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def get_cursor(after: Optional[str] = Query(None, description="Opaque cursor from a previous page")) -> Optional[Cursor]:
+    return _parse_cursor(after)
+
+
+def get_before_cursor(
+        before: Optional[str] = Query(None, description="Opaque cursor from a previous page of a newest-first feed")
+) -> Optional[Cursor]:
+    return _parse_cursor(before)
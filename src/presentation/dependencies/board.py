@@ -1,12 +1,14 @@
 from typing import Optional
 
 from fastapi import Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.adapters.repositories.board import BoardRepository
+from src.adapters.repositories.board import BoardRepository, AsyncBoardRepository
+from src.adapters.repositories.board_import import BoardImportRepository
 from src.adapters.sqlalchemy.models import Board
 from src.application.board.board_service import BoardService
-from src.presentation.dependencies.base import get_db
+from src.presentation.dependencies.base import get_db, get_async_db
 
 
 def get_board_repo(db: Session = Depends(get_db)) -> BoardRepository:
@@ -29,3 +31,22 @@ def get_board(
         raise HTTPException(status_code=404, detail="Board not found")
 
     return board
+
+
+def get_board_import_repo(db: Session = Depends(get_db)) -> BoardImportRepository:
+    return BoardImportRepository(session=db)
+
+
+def get_async_board_repo(db: AsyncSession = Depends(get_async_db)) -> AsyncBoardRepository:
+    return AsyncBoardRepository(session=db)
+
+
+async def get_board_async(
+        board_id: int,
+        board_repo: AsyncBoardRepository = Depends(get_async_board_repo)
+) -> Board:
+    board = await board_repo.get_board_by_id(board_id)
+    if not board:
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    return board
@@ -1,10 +1,15 @@
 from fastapi import HTTPException, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.adapters.repositories.card.card import CardRepository
+from src.adapters.repositories.card.card import CardRepository, AsyncCardRepository
+from src.adapters.repositories.card.card_activity import CardActivityRepository
+from src.adapters.repositories.card.comment import CommentRepository
+from src.adapters.repositories.outbox import OutboxRepository
 from src.application.board.board_service import BoardService
 from src.application.card.card_service import CardService
-from src.presentation.dependencies.base import get_db
+from src.application.card.comment_service import CommentService
+from src.presentation.dependencies.base import get_db, get_async_db
 from src.presentation.dependencies.board import get_board_service
 
 
@@ -12,11 +17,27 @@ def get_card_repo(db: Session = Depends(get_db)) -> CardRepository:
     return CardRepository(session=db)
 
 
+def get_outbox_repo(db: Session = Depends(get_db)) -> OutboxRepository:
+    return OutboxRepository(session=db)
+
+
+def get_card_activity_repo(db: Session = Depends(get_db)) -> CardActivityRepository:
+    return CardActivityRepository(session=db)
+
+
+def get_async_card_repo(db: AsyncSession = Depends(get_async_db)) -> AsyncCardRepository:
+    return AsyncCardRepository(session=db)
+
+
 def get_card_service(
         card_repo: CardRepository = Depends(get_card_repo),
-        board_service: BoardService = Depends(get_board_service)
+        board_service: BoardService = Depends(get_board_service),
+        outbox_repo: OutboxRepository = Depends(get_outbox_repo),
+        activity_repo: CardActivityRepository = Depends(get_card_activity_repo)
 ) -> CardService:
-    return CardService(card_repo=card_repo, board_service=board_service)
+    return CardService(
+        card_repo=card_repo, board_service=board_service, outbox_repo=outbox_repo, activity_repo=activity_repo
+    )
 
 
 def get_card(list_id: int, card_id: int, card_repo: CardRepository = Depends(get_card_repo)):
@@ -27,3 +48,24 @@ def get_card(list_id: int, card_id: int, card_repo: CardRepository = Depends(get
         )
 
     return card
+
+
+def get_comment_repo(db: Session = Depends(get_db)) -> CommentRepository:
+    return CommentRepository(session=db)
+
+
+def get_comment_service(
+        comment_repo: CommentRepository = Depends(get_comment_repo),
+        board_service: BoardService = Depends(get_board_service)
+) -> CommentService:
+    return CommentService(comment_repo=comment_repo, board_service=board_service)
+
+
+def get_comment(card_id: int, comment_id: int, comment_repo: CommentRepository = Depends(get_comment_repo)):
+    comment = comment_repo.get_comment(card_id=card_id, comment_id=comment_id)
+    if not comment:
+        raise HTTPException(
+            status_code=404, detail="Comment not found"
+        )
+
+    return comment
@@ -1,9 +1,10 @@
 from fastapi import Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.adapters.repositories.list import ListRepository
+from src.adapters.repositories.list import ListRepository, AsyncListRepository
 from src.application.list.list_service import ListService
-from src.presentation.dependencies.base import get_db
+from src.presentation.dependencies.base import get_db, get_async_db
 
 
 def get_list_repo(db: Session = Depends(get_db)) -> ListRepository:
@@ -22,3 +23,19 @@ def get_list(board_id: int, list_id: int, list_repo: ListRepository = Depends(ge
         )
 
     return list_obj
+
+
+def get_async_list_repo(db: AsyncSession = Depends(get_async_db)) -> AsyncListRepository:
+    return AsyncListRepository(session=db)
+
+
+async def get_list_async(
+        board_id: int, list_id: int, list_repo: AsyncListRepository = Depends(get_async_list_repo)
+):
+    list_obj = await list_repo.get_list_by_id(board_id=board_id, list_id=list_id)
+    if not list_obj:
+        raise HTTPException(
+            status_code=404, detail="List not found"
+        )
+
+    return list_obj
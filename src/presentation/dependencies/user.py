@@ -1,17 +1,16 @@
 from typing import List
 
-from fastapi import Depends, HTTPException, status
-from jose import jwt
+from fastapi import Depends, HTTPException, Request, status
 from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.adapters.repositories.user import UserRepository
+from src.adapters.cache.principal import UserPrincipal, principal_cache
+from src.adapters.repositories.user import UserRepository, AsyncUserRepository
 from src.adapters.schemas.token import TokenPayload
-from src.adapters.sqlalchemy.models import User
 from src.adapters.sqlalchemy.models.user import UserType
-from src.main.security import decode_access_token
 from src.presentation.api.auth_bearer import JWTBearer
-from src.presentation.dependencies.base import get_db
+from src.presentation.dependencies.base import get_db, get_async_db
 from src.application.user.user_service import UserService
 
 jwt_bearer = JWTBearer()
@@ -21,6 +20,10 @@ def get_user_repo(db: Session = Depends(get_db)) -> UserRepository:
     return UserRepository(session=db)
 
 
+def get_async_user_repo(db: AsyncSession = Depends(get_async_db)) -> AsyncUserRepository:
+    return AsyncUserRepository(session=db)
+
+
 def get_user_service(user_repo: UserRepository = Depends(get_user_repo)) -> UserService:
     return UserService(user_repo=user_repo)
 
@@ -33,38 +36,80 @@ def get_user(user_id: int, user_repo: UserRepository = Depends(get_user_repo)):
     return user
 
 
-def get_current_user(
-        token: str = Depends(jwt_bearer),
-        user_db_gateway: UserRepository = Depends(get_user_repo)
-) -> User:
+def _get_token_data(request: Request) -> TokenPayload:
     try:
-        payload = decode_access_token(token)
-        token_data = TokenPayload(**payload)
-    except (jwt.JWTError, ValidationError):
+        return TokenPayload(**request.state.token_claims)
+    except ValidationError:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
-    user = user_db_gateway.get_user_by_id(id=token_data.sub)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    return user
+
+
+def get_current_user(
+        request: Request,
+        token: str = Depends(jwt_bearer),
+        user_db_gateway: UserRepository = Depends(get_user_repo)
+) -> UserPrincipal:
+    token_data = _get_token_data(request)
+
+    principal = principal_cache.get(token_data.sub)
+    if principal is None:
+        user = user_db_gateway.get_user_by_id(id=token_data.sub)
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        principal = UserPrincipal.from_user(user)
+        principal_cache.set(principal)
+    return principal
 
 
 def get_current_active_user(
-        current_user: User = Depends(get_current_user),
-        user_service: UserService = Depends(get_user_service)
-) -> User:
-    if not user_service.is_active(current_user):
+        current_user: UserPrincipal = Depends(get_current_user)
+) -> UserPrincipal:
+    if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
 
 def get_current_active_superuser(
-        current_user: User = Depends(get_current_user),
-        user_service: UserService = Depends(get_user_service)
-) -> User:
-    if not user_service.is_superuser(current_user):
+        current_user: UserPrincipal = Depends(get_current_user)
+) -> UserPrincipal:
+    if current_user.type != UserType.admin:
+        raise HTTPException(
+            status_code=400, detail="The user doesn't have enough privileges"
+        )
+    return current_user
+
+
+async def get_current_user_async(
+        request: Request,
+        token: str = Depends(jwt_bearer),
+        user_db_gateway: AsyncUserRepository = Depends(get_async_user_repo)
+) -> UserPrincipal:
+    token_data = _get_token_data(request)
+
+    principal = principal_cache.get(token_data.sub)
+    if principal is None:
+        user = await user_db_gateway.get_user_by_id(id=token_data.sub)
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        principal = UserPrincipal.from_user(user)
+        principal_cache.set(principal)
+    return principal
+
+
+async def get_current_active_user_async(
+        current_user: UserPrincipal = Depends(get_current_user_async)
+) -> UserPrincipal:
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+
+
+async def get_current_active_superuser_async(
+        current_user: UserPrincipal = Depends(get_current_user_async)
+) -> UserPrincipal:
+    if current_user.type != UserType.admin:
         raise HTTPException(
             status_code=400, detail="The user doesn't have enough privileges"
         )
@@ -75,7 +120,7 @@ class PermissionChecker:
     def __init__(self, allowed_roles: List[UserType]):
         self.allowed_roles = allowed_roles
 
-    def __call__(self, current_user: User = Depends(get_current_user)):
+    def __call__(self, current_user: UserPrincipal = Depends(get_current_user)):
         if current_user.type not in self.allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
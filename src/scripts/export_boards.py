@@ -0,0 +1,41 @@
+import argparse
+import sys
+
+from src.application.board.board_export import export_chunks
+
+
+def export(output: str, board_ids=None, owner_id=None, compress: bool = False) -> int:
+    """Writes the NDJSON export to ``output`` ("-" for stdout); returns the number of bytes written."""
+    written = 0
+    stream = sys.stdout.buffer if output == "-" else open(output, "wb")
+    try:
+        for chunk in export_chunks(board_ids=board_ids, owner_id=owner_id, compress=compress):
+            stream.write(chunk)
+            written += len(chunk)
+    finally:
+        if stream is not sys.stdout.buffer:
+            stream.close()
+
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export boards with their lists, cards, comments, checklists and activities as NDJSON"
+    )
+    parser.add_argument(
+        "--board-id", type=int, action="append", dest="board_ids",
+        help="Board to export; repeat for several boards (default: all boards)"
+    )
+    parser.add_argument("--owner-id", type=int, help="Export only the boards of this owner")
+    parser.add_argument("--gzip", action="store_true", help="Compress the output with gzip")
+    parser.add_argument("-o", "--output", default="-", help="Output file (default: stdout)")
+
+    args = parser.parse_args()
+
+    written = export(args.output, board_ids=args.board_ids, owner_id=args.owner_id, compress=args.gzip)
+    print(f"Exported {written} bytes", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import argparse
+import os
+import sys
+
+from src.adapters.repositories.board_import import BoardImportRepository
+from src.adapters.sqlalchemy.db.session import SessionLocal
+from src.adapters.sqlalchemy.models import ImportJob
+from src.application.board.board_import import run_import
+
+
+def report(job: ImportJob) -> None:
+    print(
+        f"job {job.id}: line {job.processed_lines}, {job.imported_rows} row(s) imported, "
+        f"{job.skipped_rows} skipped",
+        file=sys.stderr,
+    )
+
+
+def create_job(source_path: str, fallback_user_id: int) -> int:
+    session = SessionLocal()
+    try:
+        return BoardImportRepository(session=session).create_job(os.path.abspath(source_path), fallback_user_id).id
+    finally:
+        session.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import boards from an NDJSON export (plain or gzip) via COPY")
+    parser.add_argument("source", nargs="?", help="Export file to import")
+    parser.add_argument(
+        "--user-id", type=int,
+        help="User that replaces owners, authors and responsible persons missing from this database"
+    )
+    parser.add_argument(
+        "--resume", type=int, metavar="JOB_ID",
+        help="Continue an interrupted or failed job after its last committed batch"
+    )
+    parser.add_argument("--batch-size", type=int, help="Rows per COPY batch (default: IMPORT_BATCH_SIZE)")
+
+    args = parser.parse_args()
+
+    if args.resume is not None:
+        job_id = args.resume
+    elif args.source and args.user_id is not None:
+        job_id = create_job(args.source, args.user_id)
+    else:
+        parser.error("either a source file with --user-id or --resume is required")
+
+    job = run_import(job_id, batch_size=args.batch_size, progress=report)
+    if job is None:
+        sys.exit(f"Import job {job_id} not found")
+
+    print(f"job {job.id}: {job.status.value}" + (f" ({job.error})" if job.error else ""))
+    if job.error:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
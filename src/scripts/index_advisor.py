@@ -0,0 +1,132 @@
+import argparse
+import json
+import sys
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from src.adapters.repositories.board import BoardRepository
+from src.adapters.repositories.card.card import CardRepository
+from src.adapters.repositories.list import ListRepository
+from src.adapters.repositories.user import UserRepository
+from src.adapters.sqlalchemy.db.session import SessionLocal, engine
+
+# Each probe calls repository readers with ids sampled from the database; every
+# statement they emit is captured and explained.
+PROBES: List[Tuple[str, Callable[[Session, Dict[str, int]], Any]]] = [
+    ("BoardRepository.get_board_by_id", lambda s, ids: BoardRepository(s).get_board_by_id(ids["board"])),
+    ("BoardRepository.get_board_summary",
+     lambda s, ids: BoardRepository(s).get_board_summary(ids["board"], ids["user"])),
+    ("BoardRepository.is_member", lambda s, ids: BoardRepository(s).is_member(ids["board"], ids["user"])),
+    ("BoardRepository.get_list_of_public_boards", lambda s, ids: BoardRepository(s).get_list_of_public_boards()),
+    ("BoardRepository.get_board_lists_with_cards",
+     lambda s, ids: BoardRepository(s).get_board_lists_with_cards(ids["board"])),
+    ("ListRepository.get_lists_by_board", lambda s, ids: ListRepository(s).get_lists_by_board(ids["board"])),
+    ("ListRepository.get_list_by_id", lambda s, ids: ListRepository(s).get_list_by_id(ids["board"], ids["list"])),
+    ("ListRepository.get_next_position", lambda s, ids: ListRepository(s).get_next_position(ids["board"])),
+    ("CardRepository.get_cards", lambda s, ids: CardRepository(s).get_cards(ids["list"])),
+    ("CardRepository.get_card", lambda s, ids: CardRepository(s).get_card(ids["list"], ids["card"])),
+    ("UserRepository.get_user_by_id", lambda s, ids: UserRepository(s).get_user_by_id(ids["user"])),
+    ("UserRepository.get_users_list", lambda s, ids: UserRepository(s).get_users_list(skip=0, limit=10)),
+]
+
+
+def sample_ids(session: Session) -> Dict[str, int]:
+    row = session.execute(
+        text(
+            'SELECT (SELECT max(id) FROM board) AS board, (SELECT max(id) FROM list) AS list, '
+            '(SELECT max(id) FROM card) AS card, (SELECT max(id) FROM "user") AS "user"'
+        )
+    ).mappings().one()
+    return {key: value or 0 for key, value in row.items()}
+
+
+def capture_statements(session: Session, ids: Dict[str, int]) -> List[Tuple[str, str, Any]]:
+    captured: List[Tuple[str, str, Any]] = []
+    current_probe = [""]
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        captured.append((current_probe[0], statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        for name, probe in PROBES:
+            current_probe[0] = name
+            probe(session, ids)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return captured
+
+
+def iter_plan_nodes(plan: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from iter_plan_nodes(child)
+
+
+def table_sizes(session: Session) -> Dict[str, float]:
+    rows = session.execute(
+        text("SELECT relname, reltuples FROM pg_class WHERE relkind IN ('r', 'p')")
+    ).all()
+    return {relname: reltuples for relname, reltuples in rows}
+
+
+def advise(min_rows: int, analyze: bool) -> int:
+    session: Session = SessionLocal()
+    flagged = 0
+    try:
+        ids = sample_ids(session)
+        sizes = table_sizes(session)
+        statements = capture_statements(session, ids)
+        connection = session.connection()
+        explain = "EXPLAIN (ANALYZE, FORMAT JSON) " if analyze else "EXPLAIN (FORMAT JSON) "
+
+        for probe, statement, parameters in statements:
+            plan = connection.exec_driver_sql(explain + statement, parameters).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+
+            seq_scans = [
+                node for node in iter_plan_nodes(plan[0]["Plan"])
+                if node["Node Type"] == "Seq Scan" and sizes.get(node["Relation Name"], 0) >= min_rows
+            ]
+            status = "SEQ SCAN" if seq_scans else "ok"
+            print(f"[{status}] {probe}")
+            for node in seq_scans:
+                flagged += 1
+                print(
+                    f"    {node['Relation Name']} (~{int(sizes[node['Relation Name']])} rows), "
+                    f"filter: {node.get('Filter', '-')}"
+                )
+            if seq_scans:
+                print(f"    {' '.join(statement.split())}")
+    finally:
+        session.rollback()
+        session.close()
+
+    print(f"{flagged} sequential scan(s) on tables with at least {min_rows} rows")
+    return flagged
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="EXPLAIN the repository queries against a seeded database and flag sequential scans"
+    )
+    parser.add_argument(
+        "--min-rows", type=int, default=1000,
+        help="Ignore sequential scans on tables estimated to have fewer rows (the planner prefers them there)"
+    )
+    parser.add_argument(
+        "--analyze", action="store_true", help="Use EXPLAIN ANALYZE (executes the read queries)"
+    )
+
+    args = parser.parse_args()
+
+    flagged = advise(min_rows=args.min_rows, analyze=args.analyze)
+    sys.exit(1 if flagged else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import argparse
+import logging
+import select
+import time
+from typing import Optional
+
+import psycopg2
+from psycopg2.extensions import connection as PgConnection
+from sqlalchemy.orm import Session
+
+from src.adapters.repositories.outbox import OutboxRepository
+from src.adapters.sqlalchemy.db.session import SessionLocal, engine
+from src.main.celery import celery_app
+from src.main.config import settings
+from src.main.utils import OUTBOX_TASK_ID_PREFIX
+
+
+def relay_batch(session: Session, batch_size: int) -> int:
+    """
+    Publishes one batch of outbox messages to Celery and deletes them; returns the batch size.
+
+    The rows stay locked (SKIP LOCKED for other relays) until the delete commits. A crash after
+    publishing republishes the batch with the same task ids, and the tasks drop the duplicates.
+    """
+    repo = OutboxRepository(session=session)
+    messages = repo.claim_batch(batch_size)
+    if not messages:
+        session.rollback()
+        return 0
+
+    for message in messages:
+        celery_app.send_task(message.task, kwargs=message.payload, task_id=f"{OUTBOX_TASK_ID_PREFIX}{message.id}")
+    repo.delete_messages(messages)
+
+    return len(messages)
+
+
+# Upper bound of the delay between attempts to re-create a lost LISTEN connection.
+MAX_RECONNECT_SECONDS = 60
+
+
+def listen() -> PgConnection:
+    """
+    A dedicated autocommit connection subscribed to the NOTIFY sent on every outbox insert.
+
+    It is opened outside the engine pool: a pooled connection would go back to the application
+    with autocommit still on.
+    """
+    connection = psycopg2.connect(
+        **engine.url.translate_connect_args(username="user", database="dbname"), **engine.url.query
+    )
+    connection.autocommit = True
+    with connection.cursor() as cursor:
+        cursor.execute("LISTEN outbox")
+    return connection
+
+
+def wait_for_notify(listener: PgConnection, poll_seconds: float) -> None:
+    if select.select([listener], [], [], poll_seconds)[0]:
+        listener.poll()
+        listener.notifies.clear()
+
+
+def run(batch_size: int, poll_seconds: float, once: bool = False) -> None:
+    session = SessionLocal()
+    listener: Optional[PgConnection] = None
+    reconnect_delay, reconnect_at = poll_seconds, 0.0
+    try:
+        while True:
+            try:
+                published = relay_batch(session, batch_size)
+                while published == batch_size:
+                    published = relay_batch(session, batch_size)
+            except Exception as e:
+                # Брокер або база недоступні: повідомлення лишаються в outbox до наступної спроби.
+                session.rollback()
+                logging.error(f"Outbox relay failed: {e}")
+                if once:
+                    raise
+                time.sleep(poll_seconds)
+                continue
+
+            if once:
+                return
+
+            if listener is None and time.monotonic() >= reconnect_at:
+                try:
+                    listener = listen()
+                    reconnect_delay = poll_seconds
+                    # NOTIFY sent before LISTEN is lost, so drain once more right after subscribing.
+                    continue
+                except psycopg2.Error as e:
+                    # Поки LISTEN недоступний, relay працює на опитуванні кожні poll_seconds.
+                    logging.error(f"Outbox listener failed to connect, retrying in {reconnect_delay:g}s: {e}")
+                    reconnect_at = time.monotonic() + reconnect_delay
+                    reconnect_delay = min(reconnect_delay * 2, MAX_RECONNECT_SECONDS)
+
+            if listener is None:
+                time.sleep(poll_seconds)
+                continue
+
+            try:
+                wait_for_notify(listener, poll_seconds)
+            except (psycopg2.Error, OSError) as e:
+                # Рестарт чи failover бази: відкриваємо нове з'єднання на наступній ітерації.
+                logging.error(f"Outbox listener connection lost: {e}")
+                listener.close()
+                listener = None
+    finally:
+        session.close()
+        if listener is not None:
+            listener.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Publish the transactional outbox to Celery")
+    parser.add_argument("--batch-size", type=int, default=settings.OUTBOX_BATCH_SIZE)
+    parser.add_argument(
+        "--poll-seconds", type=float, default=settings.OUTBOX_POLL_SECONDS,
+        help="Fallback poll interval when no NOTIFY arrives"
+    )
+    parser.add_argument("--once", action="store_true", help="Drain the outbox once and exit")
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    run(batch_size=args.batch_size, poll_seconds=args.poll_seconds, once=args.once)
+
+
+if __name__ == "__main__":
+    main()
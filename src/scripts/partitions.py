@@ -0,0 +1,189 @@
+import argparse
+import gzip
+import logging
+import os
+import re
+from datetime import date, datetime
+from typing import List, Optional, Set, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from src.adapters.cache.board import board_cache
+from src.adapters.sqlalchemy.db.session import engine
+
+# Tables partitioned by month of created_at (see the partition_comments_and_activity migration).
+PARTITIONED_TABLES = ("comment", "cardactivity")
+# Card counters kept by triggers that do not fire when a partition is detached:
+# table -> (parent table, counter column, foreign key).
+DETACH_RECOUNTS = {
+    "comment": ("card", "comments_count", "card_id"),
+}
+MONTHS_AHEAD = 3
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y_%m}"
+
+
+def list_partitions(connection: Connection, table: str) -> List[Tuple[str, date]]:
+    """Monthly partitions attached to the table, oldest first; the DEFAULT partition is not included."""
+    names = connection.scalars(
+        text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:table)"
+        ),
+        {"table": f'"{table}"'},
+    )
+    pattern = re.compile(rf"^{re.escape(table)}_p(\d{{4}})_(\d{{2}})$")
+    partitions = []
+    for name in names:
+        match = pattern.match(name)
+        if match:
+            partitions.append((name, date(int(match.group(1)), int(match.group(2)), 1)))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def create_partition(connection: Connection, table: str, month: date) -> bool:
+    """Creates the partition of a month unless the DEFAULT partition already holds rows of that month."""
+    start, end = f"{month.isoformat()} 00:00:00+00", f"{add_months(month, 1).isoformat()} 00:00:00+00"
+    # Postgres refuses to create the partition then; those rows have to be moved by hand first.
+    in_default = connection.scalar(
+        text(f'SELECT EXISTS (SELECT 1 FROM "{table}_default" WHERE created_at >= :start AND created_at < :end)'),
+        {"start": start, "end": end},
+    )
+    if in_default:
+        logging.warning(f"{table}_default holds rows of {month:%Y-%m}; partition {partition_name(table, month)} not created")
+        return False
+
+    connection.execute(text(
+        f'CREATE TABLE "{partition_name(table, month)}" PARTITION OF "{table}" '
+        f"FOR VALUES FROM ('{start}') TO ('{end}')"
+    ))
+    return True
+
+
+def archive_partition(connection: Connection, name: str, archive_dir: str) -> str:
+    """Writes a detached partition to <archive_dir>/<name>.csv.gz (COPY CSV with a header) and drops it."""
+    path = os.path.join(archive_dir, f"{name}.csv.gz")
+    cursor = connection.connection.cursor()
+    try:
+        with gzip.open(path, "wt", encoding="utf-8", newline="") as f:
+            cursor.copy_expert(f'COPY "{name}" TO STDOUT WITH (FORMAT csv, HEADER)', f)
+    finally:
+        cursor.close()
+    connection.execute(text(f'DROP TABLE "{name}"'))
+    return path
+
+
+def detach_partition(connection: Connection, table: str, name: str, archive_dir: Optional[str]) -> Set[int]:
+    """Detaches (and optionally archives) a partition; returns the boards whose card counters changed."""
+    # Без CONCURRENTLY: він несумісний з DEFAULT-партицією, а звичайний DETACH блокує таблицю лише на мить.
+    connection.execute(text(f'ALTER TABLE "{table}" DETACH PARTITION "{name}"'))
+
+    # A detached table keeps the foreign keys, which would then block deleting its cards and users.
+    constraints = connection.scalars(
+        text("SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(:name) AND contype = 'f'"),
+        {"name": f'"{name}"'},
+    )
+    for constraint in list(constraints):
+        connection.execute(text(f'ALTER TABLE "{name}" DROP CONSTRAINT "{constraint}"'))
+
+    board_ids = set()
+    if table in DETACH_RECOUNTS:
+        parent, counter, foreign_key = DETACH_RECOUNTS[table]
+        board_ids = set(connection.scalars(text(
+            f'UPDATE "{parent}" SET {counter} = (SELECT count(*) FROM "{table}" WHERE {foreign_key} = "{parent}".id) '
+            f'WHERE id IN (SELECT DISTINCT {foreign_key} FROM "{name}") '
+            f'RETURNING (SELECT board_id FROM list WHERE list.id = "{parent}".list_id)'
+        )))
+
+    if archive_dir:
+        logging.info(f"Archived {name} to {archive_partition(connection, name, archive_dir)}")
+    else:
+        logging.info(f"Detached {name}; it is kept as a standalone table")
+
+    return board_ids
+
+
+def maintain(
+        months_ahead: int,
+        retain_months: Optional[int] = None,
+        archive_dir: Optional[str] = None,
+        dry_run: bool = False,
+) -> None:
+    """
+    Creates the monthly partitions up to ``months_ahead`` months past the current one and, with
+    ``retain_months``, detaches (and with ``archive_dir`` archives) partitions of months older than that.
+    """
+    current = datetime.utcnow().date().replace(day=1)
+    for table in PARTITIONED_TABLES:
+        with engine.connect() as connection:
+            existing = {month for _, month in list_partitions(connection, table)}
+
+        for offset in range(months_ahead + 1):
+            month = add_months(current, offset)
+            if month in existing:
+                continue
+            if dry_run:
+                logging.info(f"Would create {partition_name(table, month)}")
+                continue
+            # Кожна партиція — окрема транзакція, щоб блокування таблиці було коротким.
+            with engine.begin() as connection:
+                if create_partition(connection, table, month):
+                    logging.info(f"Created {partition_name(table, month)}")
+
+        if retain_months is None:
+            continue
+
+        oldest_kept = add_months(current, -retain_months)
+        with engine.connect() as connection:
+            expired = [name for name, month in list_partitions(connection, table) if month < oldest_kept]
+        for name in expired:
+            if dry_run:
+                logging.info(f"Would {'archive' if archive_dir else 'detach'} {name}")
+                continue
+            with engine.begin() as connection:
+                board_ids = detach_partition(connection, table, name, archive_dir)
+            for board_id in board_ids:
+                board_cache.invalidate(board_id)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain the monthly partitions of comments and card activity")
+    parser.add_argument(
+        "--months-ahead", type=int, default=MONTHS_AHEAD,
+        help="Months past the current one to create partitions for"
+    )
+    parser.add_argument(
+        "--retain-months", type=int,
+        help="Detach partitions of months older than this many months before the current one (default: keep all)"
+    )
+    parser.add_argument(
+        "--archive-dir",
+        help="Write detached partitions to <dir>/<partition>.csv.gz and drop them instead of keeping the tables"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be done")
+
+    args = parser.parse_args()
+    if args.archive_dir and args.retain_months is None:
+        parser.error("--archive-dir requires --retain-months")
+    if args.archive_dir:
+        os.makedirs(args.archive_dir, exist_ok=True)
+
+    logging.basicConfig(level=logging.INFO)
+    maintain(
+        months_ahead=args.months_ahead,
+        retain_months=args.retain_months,
+        archive_dir=args.archive_dir,
+        dry_run=args.dry_run,
+    )
+
+
+if __name__ == "__main__":
+    main()
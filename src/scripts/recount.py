@@ -0,0 +1,80 @@
+import argparse
+from typing import Dict, List, Set, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.adapters.cache.board import board_cache
+from src.adapters.sqlalchemy.db.session import SessionLocal
+
+# Counter column -> expression for its true value, correlated on the parent row.
+# Mirrors the triggers created by the counter_columns migration.
+COUNTERS: List[Tuple[str, str, str]] = [
+    ("board", "lists_count", 'SELECT count(*) FROM list WHERE list.board_id = board.id'),
+    (
+        "board", "members_count",
+        'SELECT 1 + count(DISTINCT m.user_id) FROM board_members_association AS m '
+        'WHERE m.board_id = board.id AND m.user_id <> board.owner_id'
+    ),
+    ("list", "cards_count", 'SELECT count(*) FROM card WHERE card.list_id = list.id'),
+    ("card", "comments_count", 'SELECT count(*) FROM comment WHERE comment.card_id = card.id'),
+    ("card", "attachments_count", 'SELECT count(*) FROM cardattachment WHERE cardattachment.card_id = card.id'),
+    ("card", "checklists_count", 'SELECT count(*) FROM checklist WHERE checklist.card_id = card.id'),
+    (
+        "card", "performers_count",
+        'SELECT count(*) FROM task_performers_association AS p WHERE p.card_id = card.id'
+    ),
+]
+
+# Table -> expression for the board a row belongs to, used to invalidate the cached boards.
+BOARD_IDS: Dict[str, str] = {
+    "board": "board.id",
+    "list": "list.board_id",
+    "card": "(SELECT board_id FROM list WHERE list.id = card.list_id)",
+}
+
+
+def recount(dry_run: bool) -> Set[int]:
+    """Recomputes every counter column and fixes the rows that drifted; returns the boards of the fixed rows."""
+    session: Session = SessionLocal()
+    board_ids: Set[int] = set()
+    try:
+        for table, column, actual in COUNTERS:
+            if dry_run:
+                statement = f'SELECT count(*) FROM {table} WHERE {column} IS DISTINCT FROM ({actual})'
+                drifted = session.execute(text(statement)).scalar()
+            else:
+                statement = (
+                    f'UPDATE {table} SET {column} = ({actual}) WHERE {column} IS DISTINCT FROM ({actual}) '
+                    f'RETURNING {BOARD_IDS[table]}'
+                )
+                touched = session.execute(text(statement)).scalars().all()
+                board_ids.update(touched)
+                drifted = len(touched)
+            print(f"{table}.{column}: {drifted} row(s) {'drifted' if dry_run else 'fixed'}")
+
+        if dry_run:
+            session.rollback()
+        else:
+            session.commit()
+    finally:
+        session.close()
+
+    # Лічильники входять у кешоване зведення дошки, тож скидаємо його лише після коміту.
+    board_cache.invalidate(*board_ids)
+    return board_ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute denormalized counter columns and repair drift")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Only report how many rows have drifted counters"
+    )
+
+    args = parser.parse_args()
+
+    recount(dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
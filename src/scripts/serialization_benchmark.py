@@ -0,0 +1,103 @@
+import argparse
+import json
+import timeit
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.adapters.schemas.card import CardResponse
+from src.adapters.sqlalchemy.db.base_class import Base
+from src.adapters.sqlalchemy.models import Card
+from src.adapters.sqlalchemy.models.card import Priority
+from src.presentation.api.serialization import json_rows_response
+
+CARDS_ADAPTER = TypeAdapter(List[CardResponse])
+
+
+def seed_cards(session: Session, rows: int) -> None:
+    now = datetime.utcnow()
+    session.execute(
+        insert(Card),
+        [
+            {
+                "title": f"Card {i}",
+                "description": "Lorem ipsum dolor sit amet, consectetur adipiscing elit." * 2,
+                "priority": list(Priority)[i % 3],
+                "responsible_person_id": 1,
+                "list_id": 1,
+                "position": (i + 1) * 1024,
+                "due_date": now + timedelta(days=i % 30),
+                "created_at": now,
+            }
+            for i in range(rows)
+        ],
+    )
+    session.commit()
+
+
+def current_path(cards: List[Card]) -> bytes:
+    """Hand-built response models, then FastAPI's response_model validation and stdlib JSON rendering."""
+    models = [
+        CardResponse(
+            id=card.id,
+            title=card.title,
+            description=card.description,
+            priority=card.priority.value,
+            responsible_person_id=card.responsible_person_id,
+            list_id=card.list_id,
+            position=card.position,
+            due_date=card.due_date,
+            reminder_datetime=card.reminder_datetime,
+            created_at=card.created_at,
+            updated_at=card.updated_at
+        )
+        for card in cards
+    ]
+    content = CARDS_ADAPTER.dump_python(CARDS_ADAPTER.validate_python(models), mode="json")
+    return json.dumps(jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def run(rows: int, number: int) -> None:
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        seed_cards(session, rows)
+        cards = list(session.scalars(select(Card).order_by(Card.position)))
+        # Core rows stand in for projections selected without the ORM.
+        core_rows = session.execute(select(*Card.__table__.columns).order_by(Card.position)).all()
+
+        paths: Dict[str, Callable[[], bytes]] = {
+            "current (pydantic + json)": lambda: current_path(cards),
+            "fast path, ORM rows": lambda: json_rows_response(cards, CardResponse).body,
+            "fast path, Core rows": lambda: json_rows_response(core_rows, CardResponse).body,
+        }
+
+        assert json.loads(paths["fast path, ORM rows"]()) == json.loads(paths["current (pydantic + json)"]())
+
+        baseline = None
+        print(f"{rows} cards, best of 5 x {number} runs")
+        for name, path in paths.items():
+            best = min(timeit.repeat(path, number=number, repeat=5)) / number
+            baseline = baseline or best
+            print(f"  {name:<28} {best * 1000:8.2f} ms  x{baseline / best:5.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare list response serialization: pydantic models vs. the orjson fast path"
+    )
+    parser.add_argument("--rows", type=int, default=1000, help="Number of cards in the response")
+    parser.add_argument("--number", type=int, default=20, help="Serializations per timing run")
+
+    args = parser.parse_args()
+
+    run(rows=args.rows, number=args.number)
+
+
+if __name__ == "__main__":
+    main()
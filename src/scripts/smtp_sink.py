@@ -0,0 +1,88 @@
+import argparse
+import asyncio
+import time
+
+
+class SinkStats:
+    def __init__(self) -> None:
+        self.connections = 0
+        self.messages = 0
+        self.bytes = 0
+
+
+async def handle_session(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, stats: SinkStats) -> None:
+    """Speaks just enough SMTP to accept and discard messages; any AUTH PLAIN credentials are accepted."""
+    stats.connections += 1
+    writer.write(b"220 smtp-sink ready\r\n")
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            command = line[:4].upper()
+
+            if command == b"EHLO":
+                writer.write(b"250-smtp-sink\r\n250-8BITMIME\r\n250-AUTH PLAIN\r\n250 SIZE 52428800\r\n")
+            elif command == b"AUTH":
+                writer.write(b"235 Authentication successful\r\n")
+            elif command in (b"HELO", b"MAIL", b"RCPT", b"RSET", b"NOOP"):
+                writer.write(b"250 OK\r\n")
+            elif command == b"DATA":
+                writer.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                await writer.drain()
+                data = await reader.readuntil(b"\r\n.\r\n")
+                stats.messages += 1
+                stats.bytes += len(data)
+                writer.write(b"250 OK: queued\r\n")
+            elif command == b"QUIT":
+                writer.write(b"221 Bye\r\n")
+                await writer.drain()
+                break
+            else:
+                writer.write(b"502 Command not implemented\r\n")
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def report(stats: SinkStats, interval: float) -> None:
+    last_messages, last_time = 0, time.monotonic()
+    while True:
+        await asyncio.sleep(interval)
+        now = time.monotonic()
+        rate = (stats.messages - last_messages) / (now - last_time)
+        print(
+            f"{stats.messages} message(s), {stats.bytes / 1024:.0f} KiB over {stats.connections} "
+            f"connection(s); {rate:.1f} msg/s"
+        )
+        last_messages, last_time = stats.messages, now
+
+
+async def serve(host: str, port: int, interval: float) -> None:
+    stats = SinkStats()
+    server = await asyncio.start_server(lambda r, w: handle_session(r, w, stats), host, port)
+    print(f"SMTP sink listening on {host}:{port}")
+    async with server:
+        await asyncio.gather(server.serve_forever(), report(stats, interval))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Local SMTP server that accepts and discards mail and reports throughput"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1025)
+    parser.add_argument("--interval", type=float, default=5, help="Seconds between throughput reports")
+
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.interval))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()